@@ -0,0 +1,76 @@
+"""Benchmark the conversion of Plotext's output to Rich `Text`.
+
+Builds each of the plots in the library's demonstration, and times the
+conversion of the result with Rich's general-purpose `Text.from_ansi`
+against the converter used by `PlotextPlot`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from timeit import repeat
+
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+from textual_plotext import PlotextPlot
+from textual_plotext.__main__ import DemoApp
+from textual_plotext._ansi import ansi_to_text
+
+WIDTH = 120
+"""The width to build each plot at."""
+
+HEIGHT = 40
+"""The height to build each plot at."""
+
+RUNS = 20
+"""The number of conversions to time, for each plot and converter."""
+
+
+def fastest(convert, ansi: str) -> float:  # type: ignore[no-untyped-def]
+    """Time the fastest conversion of some output.
+
+    Args:
+        convert: The converter.
+        ansi: The output to convert.
+
+    Returns:
+        The fastest time of a conversion, in milliseconds.
+    """
+    return min(repeat(lambda: convert(ansi), number=1, repeat=RUNS)) * 1000
+
+
+async def demo_plots() -> list[tuple[str, str]]:
+    """Build each of the plots in the demonstration.
+
+    Returns:
+        The name and the built output of each plot.
+    """
+    app = DemoApp()
+    async with app.run_test(size=(WIDTH, HEIGHT)) as pilot:
+        await pilot.pause()
+        plots = []
+        for plot in app.query(PlotextPlot):
+            plot.plt.plotsize(WIDTH, HEIGHT)
+            plots.append((type(plot).__qualname__, plot.plt.build()))
+        return plots
+
+
+def main() -> None:
+    """Run the benchmark."""
+    table = Table("Plot", "Text.from_ansi", "ansi_to_text", "Speed-up")
+    for name, ansi in asyncio.run(demo_plots()):
+        general = fastest(Text.from_ansi, ansi)
+        specialised = fastest(ansi_to_text, ansi)
+        table.add_row(
+            name,
+            f"{general:.2f}ms",
+            f"{specialised:.2f}ms",
+            f"{general / specialised:.1f}x",
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,486 @@
+"""Check that the optimised ways of drawing a plot draw it as Plotext does.
+
+Usage:
+
+    python equivalence.py [figures] [seed]
+
+Generates random figures (line, scatter and bar series, with random markers,
+themes, sizes, scales and subplots) and draws each of them in the plain way,
+with a bare Plotext figure and Rich's `Text.from_ansi`, and then by each of
+the optimised paths in `PATHS`. The output of each path is compared with the
+plain output cell by cell, glyph and colour, and the first cell of any figure
+that differs is reported. Each path is also timed against the same path with
+only its own optimisation turned off, to report how much faster it makes it.
+
+The script exits with an error if any path drew any figure differently; so
+any new cache, converter or rasteriser should be added to `PATHS`, to ship
+with proof that it draws the same.
+"""
+
+from __future__ import annotations
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable, NamedTuple, Tuple
+
+from plotext._figure import _figure_class
+from rich.console import Console
+from rich.style import Style
+from rich.table import Table
+from rich.text import Text
+
+from textual_plotext import PersistentFrameCache, Plot, Series, themes
+from textual_plotext._ansi import ansi_to_text
+
+FIGURES = 50
+"""The default number of figures to generate."""
+
+MARKERS = ("sd", "dot", "hd", "fhd", "braille", "x", "•")
+"""The markers to draw line and scatter series with."""
+
+LENGTHS = (10, 200, 5_000, 50_000)
+"""The numbers of points to give line and scatter series."""
+
+CROWDED = 8
+"""One in this many figures is a bundle of more series than a theme has colours."""
+
+Cell = Tuple[str, Any, Any, Tuple[bool, ...]]
+"""A cell of a drawn plot: its glyph, colours and attributes."""
+
+Drawn = Tuple[Text, float]
+"""A drawn plot, and the time it took to draw."""
+
+
+def walk(random: Random, length: int) -> tuple[list[int], list[float]]:
+    """Make the data of a random walk, which never drops below one.
+
+    Args:
+        random: The source of randomness.
+        length: The number of points in the walk.
+
+    Returns:
+        The `x` and `y` data of the walk.
+    """
+    level = 100.0
+    y = []
+    for _ in range(length):
+        level = max(level + random.gauss(0, 1), 1.0)
+        y.append(level)
+    return list(range(1, length + 1)), y
+
+
+def add_series(random: Random, figure: Any, label: str) -> Any:
+    """Add a random line or scatter series to a figure.
+
+    Args:
+        random: The source of randomness.
+        figure: The plot, or subplot, to add the series to.
+        label: The label of the series.
+
+    Returns:
+        What adding the series returned: a `Series` if it was added to the
+        plot itself.
+    """
+    x, y = walk(random, random.choice(LENGTHS))
+    marker = random.choice(MARKERS)
+    if random.random() < 0.5:
+        return figure.plot(x, y, marker=marker, label=label)
+    return figure.scatter(x, y, marker=marker, label=label)
+
+
+def add_bundle(
+    random: Random, plot: Any, batch: bool, crowded: bool = False
+) -> list[Series]:
+    """Add a random bundle of line series that share their x data to a plot.
+
+    Args:
+        random: The source of randomness.
+        plot: The plot, or bare Plotext figure, to add the series to.
+        batch: Add the series all at once, with `Plot.plot_many`, rather
+            than one at a time.
+        crowded: Add as many series as a panel with a line for each CPU
+            core, which is far more than a theme has colours.
+
+    Returns:
+        The series.
+    """
+    if crowded:
+        count, length = random.randint(64, 128), random.choice(LENGTHS[:2])
+    else:
+        count, length = random.randint(2, 40), random.choice(LENGTHS[:3])
+    rows = [walk(random, length)[1] for _ in range(count)]
+    x = list(range(1, length + 1))
+    marker = random.choice(MARKERS)
+    labels = [f"b{index}" for index in range(count)]
+    if batch:
+        series: list[Series] = plot.plot_many(x, rows, marker=marker, labels=labels)
+        return series
+    return [
+        plot.plot(x, y, marker=marker, label=label) for y, label in zip(rows, labels)
+    ]
+
+
+def draw(plot: Any, seed: int, batch: bool = False) -> tuple[str, list[Series]]:
+    """Draw a random figure in a plot.
+
+    The same seed always draws the same figure, whether in a `Plot` or in a
+    bare Plotext figure.
+
+    Args:
+        plot: The plot, or bare Plotext figure, to draw in.
+        seed: The seed of the figure.
+        batch: Add any bundles of series with `Plot.plot_many`; this needs
+            a `Plot`.
+
+    Returns:
+        A description of the figure, and the series handles of its line and
+        scatter series.
+    """
+    random = Random(seed)
+    theme = random.choice(themes())
+    width, height = random.randint(20, 160), random.randint(8, 50)
+    rows, columns = random.choice(((1, 1), (1, 1), (1, 1), (1, 2), (2, 1), (2, 2)))
+    plot.theme(theme)
+    plot.plotsize(width, height)
+    added = []
+    if seed % CROWDED == CROWDED - 1:
+        added.extend(add_bundle(random, plot, batch, crowded=True))
+        series = [handle for handle in added if isinstance(handle, Series)]
+        return f"{theme}, {width}x{height}, {len(added)} series in a bundle", series
+    if rows * columns > 1:
+        plot.subplots(rows, columns)
+    for row in range(1, rows + 1):
+        for column in range(1, columns + 1):
+            figure = plot.subplot(row, column) if rows * columns > 1 else plot
+            if random.random() < 0.5:
+                figure.title(f"Figure {seed} ({row}, {column})")
+            if random.random() < 0.15:
+                categories = [f"c{index}" for index in range(random.randint(2, 8))]
+                figure.bar(categories, [random.uniform(1, 10) for _ in categories])
+                continue
+            figure.xscale(random.choice(("linear", "linear", "log")))
+            figure.yscale(random.choice(("linear", "linear", "log")))
+            figure.grid(random.random() < 0.3, random.random() < 0.3)
+            for index in range(random.randint(1, 3)):
+                added.append(add_series(random, figure, f"s{index}"))
+    if rows * columns > 1 and random.random() < 0.5:
+        # Only series added to the plot itself, which are drawn in every
+        # subplot, have handles; and so only they can be rasterised.
+        added.append(add_series(random, plot, "all"))
+    if random.random() < 0.3:
+        added.extend(add_bundle(random, plot, batch))
+    series = [handle for handle in added if isinstance(handle, Series)]
+    points = sum(len(handle.data[1]) for handle in series)
+    description = (
+        f"{theme}, {width}x{height}, {rows}x{columns} subplots, "
+        f"{len(series)} series of {points:,} points"
+    )
+    return description, series
+
+
+def cells(text: Text) -> list[list[Cell]]:
+    """Break some drawn text down into cells.
+
+    Colours are compared by the RGB values they are shown as, so that the
+    same colour given two ways compares the same.
+
+    Args:
+        text: The text.
+
+    Returns:
+        The cells of each line of the text.
+    """
+    console = Console(color_system="truecolor", width=1000)
+    lines: list[list[Cell]] = [[]]
+    for segment in text.render(console, end=""):
+        style = segment.style or Style.null()
+        color, bgcolor = (
+            (
+                None
+                if colour is None or colour.is_default
+                else colour.get_truecolor(foreground=foreground)
+            )
+            for colour, foreground in ((style.color, True), (style.bgcolor, False))
+        )
+        attributes = (
+            bool(style.bold),
+            bool(style.dim),
+            bool(style.italic),
+            bool(style.underline),
+            bool(style.reverse),
+            bool(style.strike),
+        )
+        for glyph in segment.text:
+            if glyph == "\n":
+                lines.append([])
+            else:
+                lines[-1].append((glyph, color, bgcolor, attributes))
+    return lines
+
+
+def difference(reference: Text, optimised: Text) -> str | None:
+    """Find the first cell in which some optimised output differs.
+
+    Args:
+        reference: The output drawn in the plain way.
+        optimised: The output drawn by an optimised path.
+
+    Returns:
+        A description of the first cell that differs, or `None` if none do.
+    """
+    expected, actual = cells(reference), cells(optimised)
+    for row, (expected_line, actual_line) in enumerate(zip(expected, actual)):
+        for column, (want, got) in enumerate(zip(expected_line, actual_line)):
+            if want != got:
+                return f"cell ({column}, {row}): expected {want!r}, got {got!r}"
+        if len(expected_line) != len(actual_line):
+            return (
+                f"line {row}: expected {len(expected_line)} cells, "
+                f"got {len(actual_line)}"
+            )
+    if len(expected) != len(actual):
+        return f"expected {len(expected)} lines, got {len(actual)}"
+    return None
+
+
+def plain(seed: int, vectorise: bool = False) -> Plot:
+    """Make a plot and draw a random figure in it.
+
+    Args:
+        seed: The seed of the figure.
+        vectorise: Should the plot use NumPy to draw large series?
+
+    Returns:
+        The plot.
+    """
+    plot = Plot()
+    plot.vectorise = vectorise
+    draw(plot, seed)
+    return plot
+
+
+def timed(build: Callable[[], str], convert: Callable[[str], Text]) -> Drawn:
+    """Build some output and convert it to text, timing both.
+
+    Args:
+        build: Builds the output.
+        convert: Converts the output to text.
+
+    Returns:
+        The text, and the time it took to build and convert.
+    """
+    start = perf_counter()
+    text = convert(build())
+    return text, perf_counter() - start
+
+
+def reference(seed: int) -> Text:
+    """Draw a figure in the plain way: with bare Plotext, and `Text.from_ansi`.
+
+    None of this library is involved, so that anything it gets wrong shows up
+    as a difference.
+
+    Args:
+        seed: The seed of the figure.
+
+    Returns:
+        The output.
+    """
+    figure = _figure_class()
+    draw(figure, seed)
+    return Text.from_ansi(figure.build())
+
+
+def converted(seed: int, optimised: bool) -> Drawn:
+    """Draw a figure, and convert it with `ansi_to_text`.
+
+    Args:
+        seed: The seed of the figure.
+        optimised: Convert with `ansi_to_text`, rather than `Text.from_ansi`.
+
+    Returns:
+        The output, and the time it took to build and convert.
+    """
+    plot = plain(seed)
+    return timed(plot.build, ansi_to_text if optimised else Text.from_ansi)
+
+
+def vectorised(seed: int, optimised: bool) -> Drawn:
+    """Draw a figure with large series rasterised with NumPy.
+
+    Args:
+        seed: The seed of the figure.
+        optimised: Rasterise with NumPy, rather than with Plotext.
+
+    Returns:
+        The output, and the time it took to build and convert.
+    """
+    plot = plain(seed, vectorise=optimised)
+    return timed(plot.build, Text.from_ansi)
+
+
+def rebuilt(seed: int, optimised: bool) -> Drawn:
+    """Draw a figure again after one of its series has changed.
+
+    The figure is first built with the data of its last line or scatter
+    series reversed; that series is then given its proper data, so that only
+    the subplot that holds it needs building again.
+
+    Args:
+        seed: The seed of the figure.
+        optimised: Build the figure again, rather than building it afresh
+            in a new plot.
+
+    Returns:
+        The output, and the time it took to build it again and convert.
+    """
+    if not optimised:
+        return timed(plain(seed, vectorise=True).build, Text.from_ansi)
+    plot = plain(seed, vectorise=True)
+    series = [handle for handle in plot._series if handle.kind != "bar"]
+    if series:
+        x, y = series[-1].data
+        series[-1].set_data(x, y[::-1])
+        plot.build()
+        series[-1].set_data(x, y)
+    return timed(plot.build, Text.from_ansi)
+
+
+def concurrent(seed: int, optimised: bool) -> Drawn:
+    """Draw a figure with its subplots built concurrently.
+
+    Args:
+        seed: The seed of the figure.
+        optimised: Build the subplots in a `build_executor`, rather than
+            one after another.
+
+    Returns:
+        The output, and the time it took to build and convert.
+    """
+    plot = plain(seed, vectorise=True)
+    if not optimised:
+        return timed(plot.build, Text.from_ansi)
+    with ThreadPoolExecutor(4) as executor:
+        plot.build_executor = executor
+        return timed(plot.build, Text.from_ansi)
+
+
+def batched(seed: int, optimised: bool) -> Drawn:
+    """Draw a figure with its bundles of series added with `Plot.plot_many`.
+
+    As `plot_many` speeds up adding series, rather than building them, the
+    time taken includes adding every series of the figure.
+
+    Args:
+        seed: The seed of the figure.
+        optimised: Add bundles with `plot_many`, rather than a series at a
+            time.
+
+    Returns:
+        The output, and the time it took to draw, build and convert.
+    """
+    plot = Plot()
+    plot.vectorise = True
+    start = perf_counter()
+    draw(plot, seed, batch=optimised)
+    text = Text.from_ansi(plot.build())
+    return text, perf_counter() - start
+
+
+def cached(seed: int, optimised: bool) -> Drawn:
+    """Draw a figure from a persistent cache that another plot built it into.
+
+    Args:
+        seed: The seed of the figure.
+        optimised: Load the output from the cache, rather than building it.
+
+    Returns:
+        The output, and the time it took to load, or build, and convert.
+    """
+    plot = plain(seed, vectorise=True)
+    if not optimised:
+        return timed(plot.build, ansi_to_text)
+    with TemporaryDirectory() as directory:
+        cache = PersistentFrameCache(directory)
+        built = plain(seed, vectorise=True)
+        size = (built._width or 0, built._height or 0)
+        cache.put(cache.key(built, *size, built._theme or ""), built.build())
+
+        def load() -> str:
+            loaded = cache.get(cache.key(plot, *size, plot._theme or ""))
+            return loaded if loaded is not None else plot.build()
+
+        return timed(load, ansi_to_text)
+
+
+class Path(NamedTuple):
+    """An optimised path to drawing a plot."""
+
+    name: str
+    """The name of the path."""
+
+    draw: Callable[[int, bool], Drawn]
+    """Draw the figure with a given seed, with or without the optimisation.
+
+    Returns the output and the time taken.
+    """
+
+
+PATHS = (
+    Path("ansi_to_text", converted),
+    Path("vectorise", vectorised),
+    Path("rebuild", rebuilt),
+    Path("build_executor", concurrent),
+    Path("plot_many", batched),
+    Path("PersistentFrameCache", cached),
+)
+"""The optimised paths to compare with the plain one."""
+
+
+def main() -> None:
+    """Compare each path on the figures asked for on the command line."""
+    if len(sys.argv) > 3:
+        sys.exit(__doc__)
+    figures = int(sys.argv[1]) if len(sys.argv) > 1 else FIGURES
+    first = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+    console = Console()
+    timings = {path.name: [0.0, 0.0] for path in PATHS}
+    failures: dict[str, int] = {path.name: 0 for path in PATHS}
+    for seed in range(first, first + figures):
+        expected = reference(seed)
+        for path in PATHS:
+            _, without_time = path.draw(seed, False)
+            actual, with_time = path.draw(seed, True)
+            timings[path.name][0] += without_time
+            timings[path.name][1] += with_time
+            problem = difference(expected, actual)
+            if problem is not None:
+                failures[path.name] += 1
+                description, _ = draw(Plot(), seed)
+                console.print(
+                    f"[red]{path.name}[/] differs for figure {seed} "
+                    f"({description}): {problem}",
+                    markup=True,
+                    highlight=False,
+                )
+    table = Table(f"Path ({figures} figures)", "Without", "With", "Speed-up", "Differ")
+    for path in PATHS:
+        without_time, with_time = timings[path.name]
+        table.add_row(
+            path.name,
+            f"{without_time * 1000:.1f}ms",
+            f"{with_time * 1000:.1f}ms",
+            f"{without_time / with_time:.1f}x" if with_time else "-",
+            str(failures[path.name]),
+            style="red" if failures[path.name] else None,
+        )
+    console.print(table)
+    if any(failures.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
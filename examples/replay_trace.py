@@ -0,0 +1,44 @@
+"""Replay a recorded plot trace, and report how long its builds took.
+
+Usage:
+
+    python replay_trace.py plot.trace [speed]
+
+The trace is recorded with `textual_plotext.TraceRecorder`. By default it is
+replayed as fast as possible; give a speed to replay it with the timing it
+was recorded with (1 for real time, 2 for twice as fast, and so on).
+"""
+
+from __future__ import annotations
+
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+from textual_plotext import replay
+
+
+def main() -> None:
+    """Replay the trace given on the command line."""
+    if len(sys.argv) not in (2, 3):
+        sys.exit(__doc__)
+    report = replay(
+        sys.argv[1], speed=float(sys.argv[2]) if len(sys.argv) > 2 else None
+    )
+    table = Table(
+        f"{report.calls} calls, {report.builds} builds", "Mean", "p50", "p95", "Max"
+    )
+    for name, timings in (("Build", report.build_ms), ("Render", report.render_ms)):
+        table.add_row(
+            name,
+            f"{sum(timings) / len(timings) if timings else 0:.2f}ms",
+            f"{report.percentile(timings, 50):.2f}ms",
+            f"{report.percentile(timings, 95):.2f}ms",
+            f"{max(timings, default=0):.2f}ms",
+        )
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
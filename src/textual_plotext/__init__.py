@@ -1,6 +1,57 @@
 """A Textual widget library for wrapping the Plotext terminal plotting library."""
 
+from .dataset import Dataset
+from .follow import FileFollower, FileFollowerStats
+from .frames import FrameStore, FrameStoreStats, frame_store
+from .histogram import StreamingHistogram
+from .mapped import MappedData
+from .memory import MemoryUsage, memory_usage
+from .persistent import PersistentFrameCache, PersistentFrameCacheStats
 from .plot import Plot, themes
 from .plotext_plot import PlotextPlot
+from .profiling import (
+    MemoryCategory,
+    MemoryProfiler,
+    PlotMemoryProfile,
+    memory_profiler,
+)
+from .resample import Resampler, ResamplerView
+from .scheduler import BuildScheduler, BuildSchedulerStats, build_scheduler
+from .series import Series
+from .sources import SourceBinding, SourceStats
+from .sparkline import PlotextSparkline
+from .trace import ReplayReport, TraceRecorder, replay
 
-__all__ = ["Plot", "PlotextPlot", "themes"]
+__all__ = [
+    "BuildScheduler",
+    "BuildSchedulerStats",
+    "Dataset",
+    "FileFollower",
+    "FileFollowerStats",
+    "FrameStore",
+    "FrameStoreStats",
+    "MappedData",
+    "MemoryCategory",
+    "MemoryProfiler",
+    "MemoryUsage",
+    "PersistentFrameCache",
+    "PersistentFrameCacheStats",
+    "Plot",
+    "PlotMemoryProfile",
+    "PlotextPlot",
+    "PlotextSparkline",
+    "ReplayReport",
+    "Resampler",
+    "ResamplerView",
+    "Series",
+    "SourceBinding",
+    "SourceStats",
+    "StreamingHistogram",
+    "TraceRecorder",
+    "build_scheduler",
+    "frame_store",
+    "memory_profiler",
+    "memory_usage",
+    "replay",
+    "themes",
+]
@@ -94,13 +94,6 @@ class BasicPlots(ExamplesPane):
             self.plt.title("Logarithmic Plot")
             self.plt.xlabel("logarithmic scale")
             self.plt.ylabel("linear scale")
-            # A slightly hacky workaround for what seems to be a bug in
-            # Plotext itself when it comes to log scales. We force a build
-            # of the data...
-            _ = self.plt.build()
-            # ...then put the scale back to linear so it doesn't try and
-            # apply log again and again on each render.
-            self.plt.xscale("linear")
 
     class StemPlot(PlotextPlot):
         """https://github.com/piccolomo/plotext/blob/master/readme/basic.md#stem-plot"""
@@ -251,7 +244,7 @@ class SpecialPlots(ExamplesPane):
         def on_mount(self) -> None:
             """Set up the plot."""
             self.plt.date_form("H:M")
-            times = self.plt.datetimes_to_string(
+            times = self.plt.datetimes_to_strings(
                 [
                     datetime(
                         2022,
@@ -273,16 +266,18 @@ class SpecialPlots(ExamplesPane):
             """Set up the initial conditions for the 'streaming' data."""
             self.frame = 0
             self.plt.title("Streaming Data")
+            self.stream = self.plt.scatter(self.frame_data())
             self.set_interval(0.25, self.plot)
 
+        def frame_data(self) -> list[float]:
+            """Get the data for the current frame of the stream."""
+            return self.plt.sin(periods=2, length=1_000, phase=(2 * self.frame) / 50)
+
         def plot(self) -> None:
             """Plot the current frame of the stream."""
-            self.plt.clear_data()
-            self.plt.scatter(
-                self.plt.sin(periods=2, length=1_000, phase=(2 * self.frame) / 50)
-            )
-            self.refresh()
             self.frame += 1
+            self.stream.set_data(self.frame_data())
+            self.refresh()
 
     class MatrixPlot(PlotextPlot):
         """https://github.com/piccolomo/plotext/blob/master/readme/special.md#matrix-plot"""
@@ -0,0 +1,112 @@
+"""Provides a converter from the ANSI output of Plotext to Rich `Text`.
+
+`Text.from_ansi` is a general-purpose parser that has to handle every
+control sequence a terminal might be sent. Plotext only ever emits a small,
+known set of SGR sequences: a background colour, a foreground colour and
+some text styles, each a single sequence, followed by the text they apply
+to and then a reset. So this converter splits Plotext's output on a single
+precompiled pattern, and keeps the `Style` for each combination of sequences
+it sees, across frames, rather than parsing them again.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+from rich.color import Color
+from rich.style import Style
+from rich.text import Span, Text
+
+_SGR = re.compile(r"\x1b\[([0-9;]*)m")
+"""The pattern of the SGR sequences in Plotext's output."""
+
+_RESETS = frozenset({"", "0"})
+"""The parameters of a sequence that resets the style."""
+
+_ATTRIBUTES = {
+    1: "bold",
+    2: "dim",
+    3: "italic",
+    4: "underline",
+    5: "blink",
+    7: "reverse",
+    9: "strike",
+    21: "underline2",
+}
+"""The style attribute for each SGR code that Plotext uses."""
+
+
+@lru_cache(maxsize=4096)
+def _style(sequences: tuple[str, ...]) -> Style:
+    """Get the style for the parameters of some SGR sequences.
+
+    Args:
+        sequences: The parameters of each sequence, in order.
+
+    Returns:
+        The combined style of the sequences.
+    """
+    colors: dict[str, Color] = {}
+    attributes: dict[str, bool] = {}
+    for sequence in sequences:
+        codes = [int(code) for code in sequence.split(";") if code]
+        while codes:
+            code = codes.pop(0)
+            if code in (38, 48) and codes:
+                kind = codes.pop(0)
+                if kind == 5 and codes:
+                    color = Color.from_ansi(codes.pop(0))
+                elif kind == 2 and len(codes) >= 3:
+                    color = Color.from_rgb(*codes[:3])
+                    del codes[:3]
+                else:
+                    continue
+                colors["color" if code == 38 else "bgcolor"] = color
+            elif code == 0:
+                colors.clear()
+                attributes.clear()
+            elif code in _ATTRIBUTES:
+                attributes[_ATTRIBUTES[code]] = True
+    return Style(**colors, **attributes)  # type: ignore[arg-type]
+
+
+def ansi_to_text(ansi: str) -> Text:
+    """Convert the ANSI output of Plotext into Rich `Text`.
+
+    The result is the same as that of `Text.from_ansi`, for the output of
+    Plotext.
+
+    Args:
+        ansi: The output of Plotext.
+
+    Returns:
+        The output as Rich `Text`.
+    """
+    plain: list[str] = []
+    spans: list[Span] = []
+    position = 0
+    sequences: tuple[str, ...] = ()
+    style: Style | None = None
+    # Splitting on the pattern alternates text with the parameters of the
+    # sequences between the text.
+    for index, part in enumerate(_SGR.split(ansi)):
+        if index % 2:
+            if part in _RESETS:
+                sequences, style = (), None
+            else:
+                sequences += (part,)
+                style = _style(sequences)
+        elif part:
+            plain.append(part)
+            end = position + len(part)
+            if style:
+                spans.append(Span(position, end, style))
+            position = end
+    text = "".join(plain)
+    # Like `Text.from_ansi`, drop a trailing newline.
+    if text.endswith("\n"):
+        text = text[:-1]
+        if spans and spans[-1].end > len(text):
+            spans[-1] = Span(spans[-1].start, len(text), spans[-1].style)
+    return Text(text, spans=spans)
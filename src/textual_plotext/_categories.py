@@ -0,0 +1,163 @@
+"""Provides the aggregation of the categories of bar series.
+
+A bar chart can only show as many categories as there is room for, and
+Plotext lays out every category it is given however many there are; with
+thousands of categories that is both slow and unreadable. These helpers
+reduce the categories of a bar series to those that are to be drawn, either
+by aggregating them or by picking out a window onto them.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple, Sequence
+
+from typing_extensions import Literal, TypeAlias
+
+BarAggregation: TypeAlias = Literal["top", "buckets", "window"]
+"""The ways the categories of a bar series can be reduced to fit.
+
+- `"top"`: The largest categories, then one more for all of the others.
+- `"buckets"`: Runs of neighbouring categories, each drawn as one.
+- `"window"`: A window onto the categories, which can be scrolled.
+"""
+
+OTHER = "other"
+"""The label of the category that the rest of the categories are summed into."""
+
+
+class Categories(NamedTuple):
+    """The categories of a bar series, and the values for each group of bars."""
+
+    labels: list[Any]
+    """The label of each category."""
+
+    groups: list[list[float]]
+    """The values of each group of bars, with one value per category."""
+
+
+class CategoryOrder:
+    """The order of some categories by their totals, largest first.
+
+    The order is kept from one sort to the next: sorting an order that is
+    already nearly right is close to linear, so when the values of the
+    categories change a little, sorting them again is cheap.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the order."""
+        self._labels: list[Any] | None = None
+        self._order: list[int] = []
+
+    def sort(self, labels: list[Any], sums: Sequence[float]) -> list[int]:
+        """Sort the categories by their totals.
+
+        Args:
+            labels: The label of each category.
+            sums: The total of each category.
+
+        Returns:
+            The index of each category, largest total first.
+        """
+        if labels != self._labels:
+            self._labels = list(labels)
+            self._order = list(range(len(labels)))
+        self._order.sort(key=sums.__getitem__, reverse=True)
+        return self._order
+
+
+def totals(categories: Categories) -> list[float]:
+    """Get the total of each category across all of the groups.
+
+    Args:
+        categories: The categories.
+
+    Returns:
+        The total of each category.
+    """
+    return [sum(values) for values in zip(*categories.groups)]
+
+
+def top(categories: Categories, count: int, order: CategoryOrder) -> Categories:
+    """Reduce some categories to the largest, and one for all of the others.
+
+    Args:
+        categories: The categories.
+        count: The number of categories to reduce to.
+        order: The order of the categories, kept between updates.
+
+    Returns:
+        The largest `count - 1` categories, largest first, and then a
+        category for the rest; or all of the categories if there are no
+        more than `count`.
+    """
+    labels, groups = categories
+    if len(labels) <= count:
+        return categories
+    ranked = order.sort(labels, totals(categories))
+    kept, rest = ranked[: count - 1], ranked[count - 1 :]
+    return Categories(
+        [str(labels[index]) for index in kept] + [OTHER],
+        [
+            [values[index] for index in kept] + [sum(values[index] for index in rest)]
+            for values in groups
+        ],
+    )
+
+
+def buckets(categories: Categories, count: int) -> Categories:
+    """Reduce some categories to runs of neighbouring categories.
+
+    Args:
+        categories: The categories.
+        count: The number of runs to reduce to.
+
+    Returns:
+        The runs of categories, each labelled with its first and last
+        categories and with the sum of their values; or all of the
+        categories if there are no more than `count`.
+    """
+    labels, groups = categories
+    size = len(labels)
+    if size <= count:
+        return categories
+    bounds = [
+        (bucket * size // count, (bucket + 1) * size // count)
+        for bucket in range(count)
+    ]
+    return Categories(
+        [
+            f"{labels[start]}"
+            if end - start == 1
+            else f"{labels[start]}–{labels[end - 1]}"
+            for start, end in bounds
+        ],
+        [[sum(values[start:end]) for start, end in bounds] for values in groups],
+    )
+
+
+def window(
+    categories: Categories, count: int, offset: int, order: CategoryOrder | None
+) -> Categories:
+    """Pick out a window onto some categories.
+
+    Args:
+        categories: The categories.
+        count: The number of categories in the window.
+        offset: The position of the first category in the window.
+        order: The order to take the categories in, if they're sorted by
+            their totals; otherwise they're taken in their own order.
+
+    Returns:
+        The categories within the window.
+    """
+    labels, groups = categories
+    if order is None:
+        return Categories(
+            labels[offset : offset + count],
+            [values[offset : offset + count] for values in groups],
+        )
+    shown = order.sort(labels, totals(categories))[offset : offset + count]
+    return Categories(
+        [labels[index] for index in shown],
+        [[values[index] for index in shown] for values in groups],
+    )
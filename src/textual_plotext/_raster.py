@@ -0,0 +1,544 @@
+"""Provides a NumPy-vectorised rasteriser for large line and scatter series.
+
+Plotext draws a line or scatter series point by point, in Python: every data
+point is mapped onto the canvas, every line between two points is broken
+down into the canvas cells (or, for the high-definition markers, the
+sub-cells) it passes through, and the results are then de-duplicated and
+grouped into the final markers. For a series with many more points than
+there are cells on the canvas, nearly all of that work is thrown away.
+
+This module does the mapping and the line drawing for such series with
+NumPy, and reduces each of them to the distinct sub-cells that would end up
+being drawn. Plotext is then handed one point per sub-cell, positioned so
+that it maps back onto that same sub-cell, and so composes exactly the same
+markers it would have done from the full series; while everything else
+(axes, ticks, legends, colours, the order in which series are drawn) is left
+to Plotext as normal.
+
+To know the size of the canvas and the limits of the axes before any data is
+drawn, the plot is first built with each series reduced to its smallest and
+largest values, which gives the same layout as the full series would.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Hashable, NamedTuple, Sequence
+
+import numpy
+
+from plotext._utility import get_hd_marker, marker_factor
+
+_MAX_LINE_POINTS = 20_000_000
+"""The most points the lines of a single series will be broken down into.
+
+A series whose lines would need more points than this (which can happen if
+its data lies far outside of the limits of the axes) is left to Plotext.
+"""
+
+_BATCH_POINTS = 16 * 1024
+"""The most points to rasterise in a single batch of signals."""
+
+_MAX_BITMAP = 64 * 1024 * 1024
+"""The most sub-cells, across a batch of signals, to mark in a bitmap."""
+
+
+class Signal(NamedTuple):
+    """A line or scatter signal that is a candidate for rasterising."""
+
+    position: int
+    """The index of the signal within its Plotext monitor."""
+
+    x: numpy.ndarray
+    """The x data of the signal."""
+
+    y: numpy.ndarray
+    """The y data of the signal."""
+
+    marker: str
+    """The marker used for every point of the signal."""
+
+    density: bool
+    """Should the signal be drawn as a density map?"""
+
+    cache: dict[int, tuple[Hashable, Any]]
+    """A cache for density maps of the signal, keyed on the monitor's identity."""
+
+    stage: Callable[..., None]
+    """A function that hands the data to use for the signal to Plotext.
+
+    It takes the x and y data and, optionally, a marker and a colour for
+    each point.
+    """
+
+
+def _axis(side: str, sides: Sequence[str]) -> int:
+    """Get the index of the axis for a side.
+
+    Args:
+        side: The side a signal is drawn against.
+        sides: The default sides for the axes.
+
+    Returns:
+        The index of the axis, as used by Plotext's per-axis settings.
+    """
+    return 0 if side == sides[0] else 1
+
+
+def _bounds(values: numpy.ndarray) -> list[float]:
+    """Reduce some data to the values that determine its limits.
+
+    Args:
+        values: The data to reduce.
+
+    Returns:
+        The smallest and largest of the values, or a single gap if there are
+        only gaps in the data.
+    """
+    numbers = values[~numpy.isnan(values)]
+    if len(numbers):
+        return [float(numbers.min()), float(numbers.max())]
+    return [float("nan")] if len(values) else []
+
+
+class _Axes(NamedTuple):
+    """The axes that a signal is drawn against."""
+
+    x_limits: tuple[float, float]
+    """The limits of the x axis."""
+
+    y_limits: tuple[float, float]
+    """The limits of the y axis."""
+
+    x_log: bool
+    """Does the x axis use a log scale?"""
+
+    y_log: bool
+    """Does the y axis use a log scale?"""
+
+    @classmethod
+    def of(cls, monitor: Any, signal: Signal) -> _Axes | None:
+        """Get the axes a signal is drawn against, as of the last build.
+
+        Args:
+            monitor: The Plotext monitor the signal belongs to.
+            signal: The signal.
+
+        Returns:
+            The axes, or `None` if the limits of either axis are empty.
+        """
+        default = monitor.default
+        x_axis = _axis(monitor.xside[signal.position], default.xside)
+        y_axis = _axis(monitor.yside[signal.position], default.yside)
+        x_limits, y_limits = monitor.xlim[x_axis], monitor.ylim[y_axis]
+        if x_limits[0] == x_limits[1] or y_limits[0] == y_limits[1]:
+            return None
+        return cls(
+            (x_limits[0], x_limits[1]),
+            (y_limits[0], y_limits[1]),
+            monitor.xscale[x_axis] == default.xscale[1],
+            monitor.yscale[y_axis] == default.yscale[1],
+        )
+
+    def to_bins(
+        self, x: numpy.ndarray, y: numpy.ndarray, x_bins: int, y_bins: int
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Map data onto the bins of the canvas.
+
+        Args:
+            x: The x data.
+            y: The y data; either of the same shape as the x data or, for a
+                batch of signals that share their x data, with a row of y
+                data for each signal.
+            x_bins: The number of bins across the canvas.
+            y_bins: The number of bins up the canvas.
+
+        Returns:
+            The x and y bins of each point, with gaps left as NaN, and any
+            points that can't be mapped as infinite.
+        """
+        with numpy.errstate(all="ignore"):
+            return (
+                _to_bins(numpy.log10(x) if self.x_log else x, self.x_limits, x_bins),
+                _to_bins(numpy.log10(y) if self.y_log else y, self.y_limits, y_bins),
+            )
+
+    def from_bins(
+        self, x: numpy.ndarray, y: numpy.ndarray, x_bins: int, y_bins: int
+    ) -> tuple[list[float], list[float]]:
+        """Map bins of the canvas back onto data.
+
+        Args:
+            x: The x bins.
+            y: The y bins.
+            x_bins: The number of bins across the canvas.
+            y_bins: The number of bins up the canvas.
+
+        Returns:
+            The x and y data, which Plotext will map back onto the bins.
+        """
+        data_x = _from_bins(x, self.x_limits, x_bins)
+        data_y = _from_bins(y, self.y_limits, y_bins)
+        if self.x_log:
+            data_x = 10**data_x
+        if self.y_log:
+            data_y = 10**data_y
+        return data_x.tolist(), data_y.tolist()
+
+
+def _to_bins(
+    values: numpy.ndarray, limits: Sequence[float], bins: int
+) -> numpy.ndarray:
+    """Map data onto the bins of a canvas, the same way Plotext does.
+
+    Args:
+        values: The values to map.
+        limits: The limits of the axis.
+        bins: The number of bins along the axis.
+
+    Returns:
+        The bin for each value, with gaps left as NaN.
+    """
+    lower, upper = limits
+    return numpy.floor(
+        numpy.round(0.5 + (bins - 1) * (values - lower) / (upper - lower), 8)
+    )
+
+
+def _from_bins(
+    bins_: numpy.ndarray, limits: Sequence[float], bins: int
+) -> numpy.ndarray:
+    """Map bins of a canvas back onto data that will land in the middle of them.
+
+    Args:
+        bins_: The bins to map.
+        limits: The limits of the axis.
+        bins: The number of bins along the axis.
+
+    Returns:
+        The data values.
+    """
+    lower, upper = limits
+    if bins == 1:
+        return numpy.full(len(bins_), float(lower))
+    return lower + bins_ * ((upper - lower) / (bins - 1))
+
+
+def _lines(
+    x: numpy.ndarray, y: numpy.ndarray
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray] | None:
+    """Break the lines between consecutive points down into bins.
+
+    This follows Plotext's `get_lines`: each line between two numerical
+    points is broken down into the bins it passes through, not including its
+    end; lines to or from a gap aren't drawn.
+
+    Args:
+        x: The x bins of the points, with a row for each signal.
+        y: The y bins of the points, with a row for each signal.
+
+    Returns:
+        The row, and the x and y bins, of the points on the lines; or `None`
+        if there would be too many of them.
+    """
+    x0, x1, y0, y1 = x[:, :-1], x[:, 1:], y[:, :-1], y[:, 1:]
+    drawn = ~(numpy.isnan(x0) | numpy.isnan(x1) | numpy.isnan(y0) | numpy.isnan(y1))
+    row = numpy.broadcast_to(numpy.arange(len(x))[:, None], drawn.shape)[drawn]
+    x0, x1, y0, y1 = x0[drawn], x1[drawn], y0[drawn], y1[drawn]
+    steps = numpy.maximum(numpy.abs(x1 - x0), numpy.abs(y1 - y0)).astype(numpy.int64)
+    total = int(steps.sum())
+    if total > _MAX_LINE_POINTS:
+        return None
+    segment = numpy.repeat(numpy.arange(len(steps)), steps)
+    step = numpy.arange(total) - numpy.repeat(numpy.cumsum(steps) - steps, steps)
+    divisor = numpy.maximum(steps, 1)
+    x_slope, y_slope = (x1 - x0) / divisor, (y1 - y0) / divisor
+    return (
+        row[segment],
+        numpy.trunc(x0[segment] + step * x_slope[segment]),
+        numpy.trunc(y0[segment] + step * y_slope[segment]),
+    )
+
+
+def _rasterise(
+    signals: list[Signal],
+    axes: _Axes,
+    width: int,
+    height: int,
+    lines: bool,
+) -> list[tuple[list[float], list[float]] | None]:
+    """Reduce a batch of signals to one point per sub-cell that each draws in.
+
+    The signals of a batch share the same x data and marker, and are drawn
+    against the same axes; so the x data is mapped onto the canvas once,
+    and the y data of all of the signals together, as the rows of a single
+    array. A batch may be of a single signal.
+
+    Args:
+        signals: The signals to reduce.
+        axes: The axes the signals are drawn against.
+        width: The width of the canvas, in cells.
+        height: The height of the canvas, in cells.
+        lines: Are lines drawn between the points of the signals?
+
+    Returns:
+        The reduced x and y data of each signal, or `None` for any that
+        can't be reduced.
+    """
+    marker = signals[0].marker
+    x_bins = width * marker_factor(marker, 2, 2, 2)
+    y_bins = height * marker_factor(marker, 2, 3, 4)
+    x, y = axes.to_bins(
+        signals[0].x[None, :],
+        numpy.stack([signal.y for signal in signals]),
+        x_bins,
+        y_bins,
+    )
+    if numpy.isinf(x).any():
+        return [None] * len(signals)
+    # A signal with points that can't be mapped is left to Plotext, and
+    # takes no further part here.
+    mapped = ~numpy.isinf(y).any(axis=1)
+    y[~mapped] = numpy.nan
+    x = numpy.broadcast_to(x, y.shape)
+    numerical = ~(numpy.isnan(x) | numpy.isnan(y))
+    rows = numpy.broadcast_to(numpy.arange(len(signals))[:, None], y.shape)
+    row, points_x, points_y = rows[numerical], x[numerical], y[numerical]
+    if lines and y.shape[1] > 1:
+        line = _lines(x, y)
+        if line is None:
+            if len(signals) == 1:
+                return [None]
+            # Too many points for the batch as a whole; but perhaps not for
+            # each of its signals.
+            return [
+                reduced
+                for signal in signals
+                for reduced in _rasterise([signal], axes, width, height, lines)
+            ]
+        row = numpy.concatenate((row, line[0]))
+        points_x = numpy.concatenate((points_x, line[1]))
+        points_y = numpy.concatenate((points_y, line[2]))
+    inside = (
+        (points_x >= 0) & (points_x < x_bins) & (points_y >= 0) & (points_y < y_bins)
+    )
+    area = x_bins * y_bins
+    keys = (
+        row[inside].astype(numpy.int64) * area
+        + points_x[inside].astype(numpy.int64) * y_bins
+        + points_y[inside].astype(numpy.int64)
+    )
+    if len(signals) * area <= _MAX_BITMAP:
+        # Marking the sub-cells drawn in a bitmap finds the distinct ones,
+        # in order, without having to sort all of the points.
+        bitmap = numpy.zeros(len(signals) * area, dtype=bool)
+        bitmap[keys] = True
+        cells = numpy.flatnonzero(bitmap)
+    else:
+        cells = numpy.unique(keys)
+    bounds = numpy.searchsorted(cells, numpy.arange(len(signals) + 1) * area).tolist()
+    reduced: list[tuple[list[float], list[float]] | None] = []
+    for index, signal in enumerate(signals):
+        drawn = cells[bounds[index] : bounds[index + 1]] - index * area
+        if not mapped[index]:
+            reduced.append(None)
+        elif not len(drawn):
+            # Nothing lands on the canvas; but so that Plotext still sees
+            # that the signal has data, hand it a single gap.
+            reduced.append(
+                ([float("nan")], [float("nan")]) if len(signal.x) else ([], [])
+            )
+        else:
+            reduced.append(
+                axes.from_bins(drawn // y_bins, drawn % y_bins, x_bins, y_bins)
+            )
+    return reduced
+
+
+def _density(
+    monitor: Any, signal: Signal, width: int, height: int
+) -> tuple[list[float], list[float], list[str], list[Any]] | None:
+    """Reduce a signal to a density map, with one point per cell.
+
+    Each cell that any points land in is drawn with a marker made up of the
+    sub-cells the points land in (for the high-definition markers; with any
+    other marker it's drawn with that marker), and is coloured from the
+    theme's colour sequence according to how many points land in it, on a
+    log scale; any colour in the sequence that is the colour of the canvas
+    is skipped.
+
+    Args:
+        monitor: The Plotext monitor the signal belongs to.
+        signal: The signal to reduce.
+        width: The width of the canvas, in cells.
+        height: The height of the canvas, in cells.
+
+    Returns:
+        The x and y data, markers and colours of the density map, or `None`
+        if the signal can't be reduced.
+    """
+    axes = _Axes.of(monitor, signal)
+    if axes is None:
+        return None
+    # A colour that is the same as the canvas would hide the cells drawn
+    # in it; in the dark themes, that's the densest of them.
+    palette = [
+        color for color in monitor.color_sequence if color != monitor.canvas_color
+    ] or list(monitor.color_sequence)
+    key = (width, height, axes, signal.marker, repr(palette))
+    cached = signal.cache.get(id(monitor))
+    density: tuple[list[float], list[float], list[str], list[Any]]
+    if cached is not None and cached[0] == key:
+        density = cached[1]
+        return density
+    x_factor = marker_factor(signal.marker, 2, 2, 2)
+    y_factor = marker_factor(signal.marker, 2, 3, 4)
+    x, y = axes.to_bins(signal.x, signal.y, width * x_factor, height * y_factor)
+    if numpy.isinf(x).any() or numpy.isinf(y).any():
+        return None
+    inside = (x >= 0) & (x < width * x_factor) & (y >= 0) & (y < height * y_factor)
+    x, y = x[inside].astype(numpy.int64), y[inside].astype(numpy.int64)
+    cells = (x // x_factor) * height + (y // y_factor)
+    counts = numpy.bincount(cells, minlength=width * height)
+    occupied = numpy.flatnonzero(counts)
+    if not len(occupied):
+        density = (
+            ([float("nan")], [float("nan")], [signal.marker], [palette[0]])
+            if len(signal.x)
+            else ([], [], [], [])
+        )
+        signal.cache[id(monitor)] = (key, density)
+        return density
+    if x_factor * y_factor > 1:
+        # Plotext codes a high-definition marker as the flags of its
+        # sub-cells, from the top row down and left to right.
+        masks = numpy.zeros(width * height, dtype=numpy.int64)
+        bits = (y_factor - 1 - y % y_factor) * x_factor + x % x_factor
+        numpy.bitwise_or.at(masks, cells, numpy.left_shift(1, bits))
+        glyphs = {
+            mask: get_hd_marker(
+                tuple((mask >> bit) & 1 for bit in range(x_factor * y_factor))
+            )
+            for mask in numpy.unique(masks[occupied]).tolist()
+        }
+        markers = [glyphs[mask] for mask in masks[occupied].tolist()]
+    else:
+        markers = [signal.marker] * len(occupied)
+    dense = counts[occupied]
+    most = int(dense.max())
+    levels = (
+        numpy.minimum(
+            (numpy.log(dense) / numpy.log(most + 1) * len(palette)).astype(int),
+            len(palette) - 1,
+        )
+        if most > 1
+        else numpy.zeros(len(dense), dtype=int)
+    )
+    density = (
+        *axes.from_bins(occupied // height, occupied % height, width, height),
+        markers,
+        [palette[level] for level in levels.tolist()],
+    )
+    signal.cache[id(monitor)] = (key, density)
+    return density
+
+
+def build_plot(
+    monitor: Any,
+    signals: list[Signal],
+    build_state: Sequence[str],
+) -> None:
+    """Build a Plotext monitor, rasterising the given signals with NumPy.
+
+    Signals that are to be drawn as density maps are always reduced to
+    them; any others are only reduced if there are enough points for it to
+    be worthwhile.
+
+    Args:
+        monitor: The Plotext monitor to build.
+        signals: The line and scatter signals that can be rasterised.
+        build_state: The attributes of the monitor that a build changes.
+    """
+    build = type(monitor).build_plot
+    width, height = monitor.size
+    if not any(signal.density for signal in signals) and sum(
+        len(signal.x) for signal in signals
+    ) < (width or 0) * (height or 0):
+        # Small enough that Plotext will manage just fine.
+        for signal in signals:
+            signal.stage(signal.x.tolist(), signal.y.tolist())
+        build(monitor)
+        return
+
+    # Work out the layout of the plot, and the limits of the axes, by
+    # building it with each of the signals reduced to its bounds. The legend
+    # plays no part in the layout, and Plotext can't draw the legend entry
+    # of a signal with no points on the canvas, which the bounds alone
+    # might well not have; so the signals go unlabelled for this build.
+    state = {name: getattr(monitor, name) for name in build_state}
+    labels = monitor.label
+    monitor.label = labels[:]
+    for signal in signals:
+        signal.stage(_bounds(signal.x), _bounds(signal.y))
+        monitor.label[signal.position] = None
+    try:
+        build(monitor)
+    finally:
+        monitor.label = labels
+    width = len(monitor.matrix.Cols_canvas)
+    height = len(monitor.matrix.Rows_canvas)
+    limits = {
+        "xlim": [
+            limits[::direction]
+            for limits, direction in zip(monitor.xlim, monitor.xdirection)
+        ],
+        "ylim": [
+            limits[::direction]
+            for limits, direction in zip(monitor.ylim, monitor.ydirection)
+        ],
+    }
+    reduced: list[Any] = [None] * len(signals)
+    batches: dict[tuple[int, str, bool, _Axes], list[int]] = {}
+    for index, signal in enumerate(signals):
+        if not (width and height):
+            break
+        if signal.density:
+            reduced[index] = _density(monitor, signal, width, height)
+        elif (axes := _Axes.of(monitor, signal)) is not None:
+            # Signals that share their x data (such as those plotted together
+            # with `Plot.plot_many`) are rasterised together.
+            lines = monitor.lines[signal.position]
+            batches.setdefault((id(signal.x), signal.marker, lines, axes), []).append(
+                index
+            )
+    for (_, _, lines, axes), indices in batches.items():
+        # Batches are kept small enough for their arrays to stay in cache;
+        # for long enough signals, that's a single signal.
+        size = max(_BATCH_POINTS // max(len(signals[indices[0]].x), 1), 1)
+        for start in range(0, len(indices), size):
+            batch = indices[start : start + size]
+            for index, data in zip(
+                batch,
+                _rasterise(
+                    [signals[index] for index in batch], axes, width, height, lines
+                ),
+            ):
+                reduced[index] = data
+    for name, value in state.items():
+        setattr(monitor, name, value)
+
+    # Now build it for real, with the limits fixed to those of the full data.
+    # The lines of a reduced signal have already been drawn, so it's handed
+    # over as a scatter.
+    monitor.xlim, monitor.ylim = limits["xlim"], limits["ylim"]
+    lines = monitor.lines
+    monitor.lines = lines[:]
+    for signal, data in zip(signals, reduced):
+        if data is None:
+            signal.stage(signal.x.tolist(), signal.y.tolist())
+        else:
+            signal.stage(*data)
+            monitor.lines[signal.position] = False
+    try:
+        build(monitor)
+    finally:
+        monitor.lines = lines
@@ -0,0 +1,127 @@
+"""Provides datasets that can be shown by any number of plots at once.
+
+When the same data is shown in several places (a detailed plot, an
+overview, a grid of small plots) each plot would otherwise need its own
+copy of the data, and each update would have to be made to every copy. A
+`Dataset` holds the data once; plotting it in a `Plot` creates a view of it
+that draws the dataset's own arrays, and updating the dataset updates every
+view of it.
+
+Each plot that shows a dataset still has its own limits, scales, markers
+and level of quality; it is only the data that is shared.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Sequence
+from weakref import WeakSet
+
+from plotext._utility import set_data as _set_data
+
+from .series import _compact
+
+if TYPE_CHECKING:
+    from .plot import Plot
+    from .series import Series
+
+
+class Dataset:
+    """Data that is held once, and shown by any number of plots.
+
+    A dataset is shown in a plot by plotting it as a line or scatter series:
+
+    ```python
+    cpu = Dataset(times, load)
+    detail.plt.plot(cpu)
+    overview.plt.scatter(cpu, marker="braille")
+    ...
+    cpu.set_data(times, load)
+    ```
+
+    Each view of the dataset draws the dataset's own arrays, so the data
+    isn't copied for each plot. When the dataset changes, only the plots
+    that show it are told to update, and each of their widgets refreshes.
+
+    Datasets only hold numbers.
+    """
+
+    def __init__(self, *data: Sequence[Any]) -> None:
+        """Initialise the dataset.
+
+        Args:
+            *data: The data, given as `y` or `x, y`, as for `Plot.plot`.
+
+        Raises:
+            ValueError: If the data isn't all numbers.
+        """
+        self._x, self._y = self._pack(data)
+        self._version = 0
+        self._views: WeakSet[Series] = WeakSet()
+
+    @property
+    def version(self) -> int:
+        """The version of the data; this goes up by one each time it changes."""
+        return self._version
+
+    @property
+    def data(self) -> tuple[Sequence[float], Sequence[float]]:
+        """The `x` and `y` data of the dataset."""
+        return (self._x, self._y)
+
+    @property
+    def views(self) -> list[Series]:
+        """The series, in any plot, that show the dataset."""
+        return [series for series in self._views if series.dataset is self]
+
+    @staticmethod
+    def _pack(data: tuple[Sequence[Any], ...]) -> tuple[Any, Any]:
+        """Pack some data into compact arrays.
+
+        Args:
+            data: The data, given as `y` or `x, y`.
+
+        Returns:
+            The packed `x` and `y` data.
+
+        Raises:
+            ValueError: If the data isn't all numbers.
+        """
+        x, y = (_compact(values) for values in _set_data(*data))
+        if isinstance(x, list) or isinstance(y, list):
+            raise ValueError("A dataset can only hold numbers")
+        return x, y
+
+    def _attach(self, series: Series) -> None:
+        """Attach a series to the dataset, as a view of it.
+
+        Args:
+            series: The series.
+        """
+        self._views.add(series)
+        series._follow(self, self._x, self._y)  # pylint:disable=protected-access
+
+    def set_data(self, *data: Sequence[Any]) -> None:
+        """Replace the data of the dataset, from any thread.
+
+        The data is packed once, on the calling thread, and published to
+        each plot that shows the dataset, as with `Plot.publish`; so every
+        view of the dataset changes together, the next time its plot is
+        built or, in a `PlotextPlot`, as soon as the application gets to it.
+
+        Args:
+            *data: The new data, given as `y` or `x, y`.
+
+        Raises:
+            ValueError: If the data isn't all numbers.
+        """
+        x, y = self._pack(data)
+        self._x, self._y = x, y
+        self._version += 1
+        updates: dict[Plot, dict[Series, Any]] = {}
+        # A dataset publishes to its views much as their plots would.
+        # pylint:disable=protected-access
+        for series in self.views:
+            if series.attached:
+                updates.setdefault(series._plot, {})[series] = (x, y, False, False)
+        for plot, prepared in updates.items():
+            plot._publish_followed(prepared)
@@ -0,0 +1,336 @@
+"""Provides for following a growing file of samples, as `tail -f` does.
+
+Plotting a CSV or JSON lines file that something else keeps appending to
+would otherwise mean reading and parsing the whole file each time it grows.
+A `FileFollower` keeps its place in the file, and each time it looks only
+reads, in bulk, and parses what has been appended since; so the work done
+follows how quickly the file grows, not how large it is. It also notices
+when the file is truncated, or rotated (moved aside and replaced by a new
+file), and starts again from the beginning of the new file.
+
+A follower is an async iterable of samples, so it is plotted by binding it
+to a `PlotextPlot` with `PlotextPlot.bind_source`, which applies the
+samples in batches, and refreshes the plot, at most once a frame.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from asyncio import sleep
+from typing import IO, Any, AsyncIterator, NamedTuple
+
+from typing_extensions import Literal, TypeAlias
+
+FileFormat: TypeAlias = Literal["csv", "jsonl"]
+"""The formats of file that can be followed.
+
+- `"csv"`: Comma (or otherwise) separated values, a sample a line.
+- `"jsonl"`: JSON lines, a sample a line, each an object or an array.
+"""
+
+
+class FileFollowerStats(NamedTuple):
+    """Statistics for a followed file."""
+
+    bytes: int
+    """The number of bytes read from the file."""
+
+    samples: int
+    """The number of samples parsed from the file."""
+
+    skipped: int
+    """The number of lines skipped because they couldn't be parsed."""
+
+    restarts: int
+    """The number of times the file was truncated or rotated."""
+
+
+class FileFollower:
+    """An async iterable of the samples appended to a file.
+
+    Each line of the file is a sample. The `y` value of each sample is
+    taken from one column (for a CSV file) or key (for a JSON lines file),
+    and its `x` value, optionally, from another:
+
+    ```python
+    follower = FileFollower("metrics.csv", x="time", y="load")
+    self.query_one(PlotextPlot).bind_source(follower, window=500)
+    ```
+
+    Without an `x` column, each sample's `x` value is its position in the
+    source. Columns can be given by position, or, for a CSV file with a
+    header line, by name; a name that isn't in the header raises a
+    `ValueError` when the header is read. Lines that can't be parsed are
+    skipped.
+    """
+
+    DEFAULT_CHUNK = 1024 * 1024
+    """The default number of bytes to read from the file at a time."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        y: int | str = 0,
+        x: int | str | None = None,
+        format: FileFormat = "csv",
+        delimiter: str = ",",
+        header: bool = False,
+        from_end: bool = False,
+        interval: float = 0.25,
+        chunk: int = DEFAULT_CHUNK,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Initialise the file follower.
+
+        Args:
+            path: The path of the file to follow.
+            y: The column, or key, of the `y` value of each sample.
+            x: The column, or key, of the `x` value of each sample, if any.
+            format: The format of the file.
+            delimiter: The delimiter between the columns of a CSV file.
+            header: Does a CSV file start with a header line? It does if
+                either column is given by name.
+            from_end: Start at the end of the file, rather than taking the
+                samples already in it.
+            interval: How often, in seconds, to look for more of the file.
+            chunk: The most bytes to read from the file at a time.
+            encoding: The encoding of the file.
+
+        Raises:
+            ValueError: If the interval or chunk make no sense.
+        """
+        if interval <= 0:
+            raise ValueError("The interval must be positive")
+        if chunk < 1:
+            raise ValueError("The chunk must be at least one byte")
+        self._path = os.fspath(path)
+        self._y = y
+        self._x = x
+        self._format = format
+        self._delimiter = delimiter
+        self._header = header or isinstance(x, str) or isinstance(y, str)
+        self._from_end = from_end
+        self._interval = interval
+        self._chunk = chunk
+        self._encoding = encoding
+        self._file: IO[bytes] | None = None
+        self._identity: tuple[int, int] | None = None
+        self._started = False
+        self._offset = 0
+        self._partial = b""
+        self._columns: tuple[Any, Any] | None = None
+        self._bytes = 0
+        self._samples = 0
+        self._skipped = 0
+        self._restarts = 0
+
+    @property
+    def path(self) -> str:
+        """The path of the file being followed."""
+        return self._path
+
+    @property
+    def stats(self) -> FileFollowerStats:
+        """The statistics for the followed file."""
+        return FileFollowerStats(
+            self._bytes, self._samples, self._skipped, self._restarts
+        )
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        """Follow the file, yielding each sample as it is appended.
+
+        Returns:
+            An iterator of the samples.
+        """
+        return self._follow()
+
+    async def _follow(self) -> AsyncIterator[Any]:
+        """Follow the file, yielding each sample as it is appended.
+
+        Yields:
+            Each sample, as a `y` value or an `(x, y)` pair.
+        """
+        try:
+            while True:
+                samples, more = self._poll()
+                for sample in samples:
+                    yield sample
+                # Even with more to read, let the rest of the application run.
+                await sleep(0 if more else self._interval)
+        finally:
+            self._close()
+
+    def _close(self) -> None:
+        """Close the file being followed, if it is open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._identity = None
+
+    def _open(self) -> bool:
+        """Open the file if it isn't open, and notice if it has been truncated.
+
+        Returns:
+            `True` if the file is open, `False` if there is no file to open.
+        """
+        if self._file is not None:
+            if os.fstat(self._file.fileno()).st_size < self._offset:
+                # Truncated, so start again from the beginning.
+                self._restarts += 1
+                self._restart(at_end=False)
+            return True
+        try:
+            self._file = open(self._path, "rb")
+        except OSError:
+            return False
+        status = os.fstat(self._file.fileno())
+        self._identity = (status.st_dev, status.st_ino)
+        # Only the file first followed is started at its end; any that
+        # replace it are new, so all of them is wanted.
+        self._restart(at_end=self._from_end and not self._started)
+        self._started = True
+        return True
+
+    def _restart(self, at_end: bool) -> None:
+        """Start reading the open file again.
+
+        Args:
+            at_end: Start at the end of the file, rather than its beginning.
+        """
+        assert self._file is not None
+        self._offset = 0
+        self._partial = b""
+        self._columns = None
+        if at_end:
+            if self._header and self._format == "csv":
+                # The header is still needed to find the columns by name.
+                self._file.seek(0)
+                self._parse([self._file.readline().rstrip(b"\n")])
+            self._offset = self._file.seek(0, os.SEEK_END)
+
+    def _poll(self) -> tuple[list[Any], bool]:
+        """Read and parse whatever has been appended to the file.
+
+        Returns:
+            The samples parsed, and whether there is more of the file to
+            read straight away.
+        """
+        if not self._open():
+            return [], False
+        assert self._file is not None
+        self._file.seek(self._offset)
+        data = self._file.read(self._chunk)
+        more = len(data) == self._chunk
+        if not data and self._rotated():
+            # All of the old file has been read, so carry on with the file
+            # that has replaced it.
+            self._restarts += 1
+            self._close()
+            return [], True
+        self._offset += len(data)
+        self._bytes += len(data)
+        data = self._partial + data
+        lines = data.split(b"\n")
+        self._partial = lines.pop()
+        return self._parse(lines), more
+
+    def _rotated(self) -> bool:
+        """Has the open file been replaced by another at the same path?
+
+        Returns:
+            `True` if the path now names another file.
+        """
+        try:
+            status = os.stat(self._path)
+        except OSError:
+            return False
+        return (status.st_dev, status.st_ino) != self._identity
+
+    def _parse(self, lines: list[bytes]) -> list[Any]:
+        """Parse some whole lines of the file into samples.
+
+        Args:
+            lines: The lines.
+
+        Returns:
+            The samples.
+        """
+        text = [
+            line.decode(self._encoding, "replace").rstrip("\r")
+            for line in lines
+            if line.strip()
+        ]
+        x: Any
+        y: Any
+        if self._format == "jsonl":
+            records: list[Any] = []
+            for line in text:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    self._skipped += 1
+            x, y = self._x, self._y
+        else:
+            records = list(csv.reader(text, delimiter=self._delimiter))
+            if self._columns is None:
+                if self._header:
+                    if not records:
+                        return []
+                    names = records.pop(0)
+                    self._columns = (
+                        self._column(names, self._x),
+                        self._column(names, self._y),
+                    )
+                else:
+                    self._columns = (self._x, self._y)
+            x, y = self._columns
+        samples: list[Any] = []
+        for record in records:
+            try:
+                value = float(record[y])
+                sample = value if x is None else (_number(record[x]), value)
+            except (LookupError, TypeError, ValueError):
+                self._skipped += 1
+                continue
+            samples.append(sample)
+        self._samples += len(samples)
+        return samples
+
+    @staticmethod
+    def _column(names: list[str], column: int | str | None) -> int | None:
+        """Find a column of a CSV file by its name in the header.
+
+        Args:
+            names: The names of the columns, from the header.
+            column: The column, by name or position.
+
+        Returns:
+            The position of the column.
+
+        Raises:
+            ValueError: If there's no column with the name.
+        """
+        if isinstance(column, str):
+            if column not in names:
+                raise ValueError(f"The file has no column named {column!r}")
+            return names.index(column)
+        return column
+
+
+def _number(value: Any) -> Any:
+    """Convert an `x` value to a number, if it is one.
+
+    Args:
+        value: The value.
+
+    Returns:
+        The value as a float, or the value itself if it isn't a number
+        (for example a date, which Plotext parses itself).
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return value
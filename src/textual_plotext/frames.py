@@ -0,0 +1,253 @@
+"""Provides an application-wide, memory-bounded store of built plot frames.
+
+Building a plot, and turning the result into a Rich `Text`, is the most
+expensive thing a `PlotextPlot` does; so each widget keeps the frame it last
+built in a store that is shared by every plot in the application. The store
+has a byte budget, and once that is exceeded frames are evicted in
+least-recently-used order; frames belonging to plots that aren't currently
+on screen are evicted before any others. A plot whose frame has been evicted
+simply builds it again the next time it is rendered.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from sys import getsizeof
+from typing import TYPE_CHECKING, Any, Hashable, NamedTuple
+from weakref import WeakKeyDictionary, ref
+
+from rich.text import Span, Text
+
+if TYPE_CHECKING:
+    from textual.app import App
+    from textual.widget import Widget
+
+_SPAN_SIZE = getsizeof(Span(0, 0, "")) + getsizeof(0) * 2
+"""The approximate number of bytes used by a span within a `Text`."""
+
+
+def frame_size(frame: Text) -> int:
+    """Estimate the memory used by a frame.
+
+    Args:
+        frame: The frame to size.
+
+    Returns:
+        The estimated number of bytes.
+    """
+    return getsizeof(frame) + getsizeof(frame.plain) + len(frame.spans) * _SPAN_SIZE
+
+
+def _on_screen(widget: Widget) -> bool:
+    """Is the given widget currently on screen?
+
+    Args:
+        widget: The widget to check.
+
+    Returns:
+        `True` if the widget is mounted, on a screen that can be seen, and
+        occupies some part of that screen; `False` otherwise.
+    """
+    if not widget.is_mounted:
+        return False
+    try:
+        screen = widget.screen
+        stack = widget.app.screen_stack
+        if screen not in stack:
+            return False
+        # A screen can be seen through any translucent screens above it, but
+        # not through an opaque one.
+        above = stack[stack.index(screen) + 1 :]
+        if any(cover.styles.background.a == 1 for cover in above):
+            return False
+        return bool(widget.region)
+    except Exception:  # pylint:disable=broad-except
+        return False
+
+
+class FrameStoreStats(NamedTuple):
+    """Statistics for a frame store."""
+
+    hits: int
+    """The number of times a frame was found in the store."""
+
+    misses: int
+    """The number of times a frame had to be built."""
+
+    evictions: int
+    """The number of frames evicted to keep within the budget."""
+
+    frames: int
+    """The number of frames currently held."""
+
+    size: int
+    """The number of bytes currently held."""
+
+
+class _Frame(NamedTuple):
+    """A frame held in a frame store."""
+
+    owner: ref[Widget]
+    """A reference to the widget that owns the frame."""
+
+    key: Hashable
+    """The key the frame was built for."""
+
+    frame: Text
+    """The frame itself."""
+
+    size: int
+    """The estimated size of the frame, in bytes."""
+
+
+class FrameStore:
+    """A memory-bounded, least-recently-used store of built frames.
+
+    Each widget has at most one frame in the store, along with the key it
+    was built for; asking for a frame with a different key counts as a miss.
+    """
+
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+    """The default byte budget of a frame store."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialise the frame store.
+
+        Args:
+            max_bytes: The byte budget of the store.
+        """
+        self._max_bytes = max_bytes
+        self._frames: OrderedDict[int, _Frame] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """The byte budget of the store.
+
+        Lowering the budget evicts frames right away if needed.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+        self._evict()
+
+    @property
+    def stats(self) -> FrameStoreStats:
+        """The statistics for the store."""
+        return FrameStoreStats(
+            self._hits, self._misses, self._evictions, len(self._frames), self._size
+        )
+
+    def get(self, owner: Widget, key: Hashable) -> Text | None:
+        """Get the frame for a widget.
+
+        Args:
+            owner: The widget to get the frame for.
+            key: The key the frame must have been built for.
+
+        Returns:
+            The frame, or `None` if there is no frame for that key.
+        """
+        frame = self._frames.get(id(owner))
+        if frame is None or frame.owner() is not owner or frame.key != key:
+            self._misses += 1
+            return None
+        self._frames.move_to_end(id(owner))
+        self._hits += 1
+        return frame.frame
+
+    def latest(self, owner: Widget) -> Text | None:
+        """Get the frame a widget last put into the store, whatever its key.
+
+        This doesn't count as either a hit or a miss.
+
+        Args:
+            owner: The widget to get the frame for.
+
+        Returns:
+            The frame, or `None` if the widget has no frame in the store.
+        """
+        frame = self._frames.get(id(owner))
+        if frame is None or frame.owner() is not owner:
+            return None
+        return frame.frame
+
+    def put(self, owner: Widget, key: Hashable, frame: Text) -> None:
+        """Put the frame for a widget into the store.
+
+        Any previous frame for the widget is replaced.
+
+        Args:
+            owner: The widget the frame belongs to.
+            key: The key the frame was built for.
+            frame: The frame.
+        """
+        self.discard(owner)
+        entry = _Frame(ref(owner), key, frame, frame_size(frame))
+        self._frames[id(owner)] = entry
+        self._size += entry.size
+        self._evict()
+
+    def discard(self, owner: Widget) -> None:
+        """Remove the frame for a widget from the store, if there is one.
+
+        Args:
+            owner: The widget whose frame should be removed.
+        """
+        frame = self._frames.pop(id(owner), None)
+        if frame is not None:
+            self._size -= frame.size
+
+    def clear(self) -> None:
+        """Remove all of the frames from the store."""
+        self._frames.clear()
+        self._size = 0
+
+    def _evict(self) -> None:
+        """Evict frames until the store is within its budget."""
+        if self._size <= self._max_bytes:
+            return
+        # Frames whose owners have gone, or aren't on screen right now, are
+        # the first to go; after that it's least recently used first.
+        hidden = {
+            identity
+            for identity, frame in self._frames.items()
+            if (owner := frame.owner()) is None or not _on_screen(owner)
+        }
+        candidates = [identity for identity in self._frames if identity in hidden]
+        candidates.extend(
+            identity for identity in self._frames if identity not in hidden
+        )
+        for identity in candidates:
+            if self._size <= self._max_bytes:
+                break
+            self._size -= self._frames.pop(identity).size
+            self._evictions += 1
+
+
+_stores: WeakKeyDictionary[Any, FrameStore] = WeakKeyDictionary()
+"""The frame stores for each application."""
+
+
+def frame_store(app: App[Any]) -> FrameStore:
+    """Get the frame store for an application.
+
+    The store is created, with the default budget, the first time it is
+    asked for.
+
+    Args:
+        app: The application to get the frame store for.
+
+    Returns:
+        The frame store.
+    """
+    try:
+        return _stores[app]
+    except KeyError:
+        store = _stores[app] = FrameStore()
+        return store
@@ -0,0 +1,267 @@
+"""Provides a histogram that folds in samples as they arrive.
+
+Plotext's `hist` bins all of its data from scratch each time it is called,
+so a live histogram has to keep, and bin again, every sample it has ever
+been given. A `StreamingHistogram` keeps only the count in each bin: each
+batch of samples is folded into the counts as it arrives, and the plot is
+drawn from the counts alone. So however many samples have been seen, the
+memory used, and the work done to draw the plot, stays the same.
+
+The counts can also be made to fade over time (exponential decay), or to
+only cover the samples of a recent window of time (sliding-window expiry).
+"""
+
+from __future__ import annotations
+
+from math import floor, isfinite
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Iterable
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .series import Series
+
+
+class StreamingHistogram:
+    """A histogram that folds in batches of samples as they arrive.
+
+    Streaming histograms are created with `Plot.streaming_hist`.
+
+    The histogram has a fixed number of bins. If it is given `limits`, they
+    are fixed too, and samples outside of them are counted as `outliers`
+    rather than drawn. Otherwise the limits are taken from the first batch
+    of samples, and whenever a sample arrives outside of them they are
+    doubled in width, by merging neighbouring bins, until it fits.
+    """
+
+    def __init__(
+        self,
+        series: Series,
+        bins: int,
+        limits: tuple[float, float] | None,
+        half_life: float | None,
+        window: float | None,
+        slices: int,
+        norm: bool,
+    ) -> None:
+        """Initialise the streaming histogram.
+
+        Args:
+            series: The bar series that draws the histogram.
+            bins: The number of bins.
+            limits: The fixed lower and upper limits of the bins, if any.
+            half_life: The time, in seconds, over which counts fade by half.
+            window: The time, in seconds, that samples are counted for.
+            slices: The number of slices the window is expired in.
+            norm: Draw the share of the total in each bin, not the count.
+
+        Raises:
+            ValueError: If the bins, limits, half-life or window make no sense.
+        """
+        if bins < 1:
+            raise ValueError("A histogram needs at least one bin")
+        if limits is None and bins % 2:
+            raise ValueError("An expanding histogram needs an even number of bins")
+        if limits is not None and not limits[0] < limits[1]:
+            raise ValueError("A histogram's lower limit must be below its upper")
+        if half_life is not None and half_life <= 0:
+            raise ValueError("The half-life of a histogram must be positive")
+        if window is not None and (window <= 0 or slices < 1):
+            raise ValueError("The window of a histogram must be positive")
+        self._series = series
+        self._bins = bins
+        self._low, self._width = (
+            (limits[0], (limits[1] - limits[0]) / bins) if limits else (0.0, 0.0)
+        )
+        self._expanding = limits is None
+        self._half_life = half_life
+        self._slice = None if window is None else window / slices
+        self._norm = norm
+        # The counts of each slice of the window, oldest first; without a
+        # window there is just the one.
+        self._slices = [[0.0] * bins for _ in range(1 if window is None else slices)]
+        self._started = self._faded = monotonic()
+        self._outliers = 0
+        self._seen = 0
+
+    @property
+    def series(self) -> Series:
+        """The bar series that draws the histogram."""
+        return self._series
+
+    @property
+    def counts(self) -> list[float]:
+        """The count in each bin."""
+        if len(self._slices) == 1:
+            return list(self._slices[0])
+        return [sum(counts) for counts in zip(*self._slices)]
+
+    @property
+    def edges(self) -> list[float]:
+        """The edges of the bins, from the lower limit to the upper."""
+        return [self._low + self._width * edge for edge in range(self._bins + 1)]
+
+    @property
+    def seen(self) -> int:
+        """The number of samples folded into the histogram, ever."""
+        return self._seen
+
+    @property
+    def outliers(self) -> int:
+        """The number of samples that fell outside of fixed limits."""
+        return self._outliers
+
+    def add(self, samples: Iterable[float]) -> None:
+        """Fold a batch of samples into the histogram, and redraw it.
+
+        Samples that aren't finite numbers are ignored.
+
+        Args:
+            samples: The samples.
+        """
+        now = monotonic()
+        self._fade(now)
+        self._expire(now)
+        values: Any
+        if numpy is not None:
+            values = numpy.asarray(
+                samples if hasattr(samples, "__len__") else list(samples),
+                dtype=numpy.float64,
+            ).ravel()
+            values = values[numpy.isfinite(values)]
+        else:
+            values = [float(sample) for sample in samples]
+            values = [value for value in values if isfinite(value)]
+        if len(values):
+            self._seen += len(values)
+            if self._expanding:
+                lowest, highest = (
+                    (values.min(), values.max())
+                    if numpy is not None
+                    else (min(values), max(values))
+                )
+                self._expand(float(lowest), float(highest))
+            self._fold(values)
+        self._draw()
+
+    def reset(self) -> None:
+        """Forget all of the samples, and redraw the histogram.
+
+        Expanding limits are taken afresh from the next batch of samples.
+        """
+        self._slices = [[0.0] * self._bins for _ in self._slices]
+        if self._expanding:
+            self._low = self._width = 0.0
+        self._outliers = 0
+        self._seen = 0
+        self._started = self._faded = monotonic()
+        self._draw()
+
+    def redraw(self) -> None:
+        """Bring the counts up to date with the time, and redraw the histogram.
+
+        This is done by `add`; but with decay or a window the counts change
+        over time, so call this to show that without adding any samples.
+        """
+        now = monotonic()
+        self._fade(now)
+        self._expire(now)
+        self._draw()
+
+    def _draw(self) -> None:
+        """Draw the histogram from its counts."""
+        counts = self.counts
+        if self._norm:
+            total = sum(counts)
+            counts = [count / total if total else 0.0 for count in counts]
+        self._series.set_data(
+            [self._low + self._width * (index + 0.5) for index in range(self._bins)],
+            counts,
+        )
+
+    def _fade(self, now: float) -> None:
+        """Fade the counts for the time that has passed since they last were.
+
+        Args:
+            now: The time now.
+        """
+        if self._half_life is None or now <= self._faded:
+            return
+        factor = 0.5 ** ((now - self._faded) / self._half_life)
+        self._faded = now
+        for counts in self._slices:
+            counts[:] = [count * factor for count in counts]
+
+    def _expire(self, now: float) -> None:
+        """Expire the slices of the window that have passed.
+
+        Args:
+            now: The time now.
+        """
+        if self._slice is None:
+            return
+        passed = int((now - self._started) // self._slice)
+        if passed < 1:
+            return
+        self._started += passed * self._slice
+        for _ in range(min(passed, len(self._slices))):
+            self._slices.pop(0)
+            self._slices.append([0.0] * self._bins)
+
+    def _expand(self, lowest: float, highest: float) -> None:
+        """Expand the limits of the bins until they take in the given values.
+
+        Args:
+            lowest: The lowest value to take in.
+            highest: The highest value to take in.
+        """
+        if not self._width:
+            span = highest - lowest
+            self._low = lowest
+            self._width = (span if span else abs(lowest) or 1.0) / self._bins
+        half = self._bins // 2
+        while lowest < self._low or highest >= self._low + self._width * self._bins:
+            # Merge neighbouring pairs of bins into one half of the bins, and
+            # stretch the limits away from the other half.
+            upwards = lowest >= self._low
+            for counts in self._slices:
+                merged = [
+                    counts[index] + counts[index + 1]
+                    for index in range(0, self._bins, 2)
+                ]
+                empty = [0.0] * half
+                counts[:] = merged + empty if upwards else empty + merged
+            if not upwards:
+                self._low -= self._width * self._bins
+            self._width *= 2
+
+    def _fold(self, values: Any) -> None:
+        """Fold some values into the counts of the latest slice.
+
+        Args:
+            values: The values; a NumPy array if NumPy is installed, a list
+                otherwise.
+        """
+        counts = self._slices[-1]
+        low, width, bins = self._low, self._width, self._bins
+        high = low + width * bins
+        # As with Plotext's own histograms, the upper limit falls into the
+        # last bin.
+        if numpy is not None:
+            inside = (values >= low) & (values <= high)
+            self._outliers += int(len(values) - inside.sum())
+            positions = numpy.minimum(
+                numpy.floor((values[inside] - low) / width).astype(numpy.intp), bins - 1
+            )
+            added = numpy.bincount(positions, minlength=bins)
+            counts[:] = [count + int(extra) for count, extra in zip(counts, added)]
+            return
+        for value in values:
+            if low <= value <= high:
+                counts[min(floor((value - low) / width), bins - 1)] += 1
+            else:
+                self._outliers += 1
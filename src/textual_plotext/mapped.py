@@ -0,0 +1,184 @@
+"""Provides series data read from memory-mapped files.
+
+A series of several gigabytes, kept in a flat binary or `.npy` file, can't
+be loaded into memory just to plot it; nor does it need to be, as a plot
+can only show so many points across its width. `MappedData` maps such a
+file into memory without reading it, and a series plotted from it reads
+only the points it needs: those within the limits of the x axis, reduced
+to the lowest and highest of each few points for each column of the plot.
+
+Reading the points for a view is done with NumPy, in ascending order of
+position in the file, so that reads go through the page cache in sequence.
+"""
+
+from __future__ import annotations
+
+import os
+from math import ceil, floor
+from typing import Any
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+
+class MappedData:
+    """The data of a series, in a memory-mapped file.
+
+    The file is either a `.npy` file, or a flat binary file of records,
+    each holding `columns` values of type `dtype`. The `y` data of the
+    series is one column of the file and, optionally, the `x` data another;
+    the `x` column must be in ascending order. Without an `x` column, the
+    position of each value in the file is used, counting from one as Plotext
+    does.
+
+    A series is plotted from the data by passing it to `Plot.plot` or
+    `Plot.scatter`:
+
+    ```python
+    history = MappedData("cpu.f64", columns=2, x=0, y=1)
+    plot.plt.plot(history)
+    plot.plt.xlim(start, end)
+    ```
+
+    Mapping the file reads none of it; each build of the plot then reads
+    only the points of the file within the limits of the x axis. Where there
+    are more than `resolution` of them for each column of the plot, they
+    are gathered into buckets, each drawn as its lowest and highest point,
+    so that no spike is lost.
+    """
+
+    DEFAULT_RESOLUTION = 16
+    """The default number of points read for each column of the plot."""
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        dtype: Any = "float64",
+        *,
+        y: int = 0,
+        x: int | None = None,
+        columns: int = 1,
+        offset: int = 0,
+        stride: int | None = None,
+        resolution: int = DEFAULT_RESOLUTION,
+    ) -> None:
+        """Initialise the memory-mapped data.
+
+        Args:
+            path: The path of the file. A file whose name ends in `.npy` is
+                read as a NumPy array file, which gives its own type and
+                layout, and `dtype`, `columns`, `offset` and `stride` are
+                ignored.
+            dtype: The NumPy type of each value in the file.
+            y: The column that holds the `y` data.
+            x: The column that holds the `x` data, if any.
+            columns: The number of values in each record of the file.
+            offset: The number of bytes before the first record, such as
+                those of a header.
+            stride: The number of bytes from the start of one record to the
+                start of the next; by default, the size of `columns` values.
+            resolution: The most points to read for each column of the plot.
+
+        Raises:
+            ImportError: If NumPy isn't installed.
+            ValueError: If the columns or the resolution make no sense.
+        """
+        if numpy is None:
+            raise ImportError("Memory-mapped data needs NumPy")
+        if resolution < 1:
+            raise ValueError("The resolution must be at least one point a column")
+        self._path = os.fspath(path)
+        self.resolution = resolution
+        """The most points to read for each column of the plot."""
+        if self._path.endswith(".npy"):
+            mapped = numpy.load(self._path, mmap_mode="r")
+            if mapped.ndim == 1:
+                mapped = mapped.reshape(-1, 1)
+            if mapped.ndim != 2:
+                raise ValueError("A mapped array must have one or two dimensions")
+            columns = mapped.shape[1]
+            self._columns = [mapped[:, column] for column in range(columns)]
+        else:
+            dtype = numpy.dtype(dtype)
+            stride = columns * dtype.itemsize if stride is None else stride
+            if columns < 1 or stride < columns * dtype.itemsize:
+                raise ValueError("The records of the file must hold its columns")
+            size = os.path.getsize(self._path)
+            records = max(size - offset, 0) // stride
+            raw = (
+                numpy.memmap(self._path, dtype=numpy.uint8, mode="r")
+                if records
+                else numpy.zeros(0, dtype=numpy.uint8)
+            )
+            self._columns = [
+                numpy.ndarray(
+                    (records,),
+                    dtype=dtype,
+                    buffer=raw,
+                    offset=offset + column * dtype.itemsize if records else 0,
+                    strides=(stride,),
+                )
+                for column in range(columns)
+            ]
+        if not 0 <= y < columns or (x is not None and not 0 <= x < columns):
+            raise ValueError(f"The file only has {columns} column(s)")
+        self._y = self._columns[y]
+        self._x = None if x is None else self._columns[x]
+
+    @property
+    def path(self) -> str:
+        """The path of the file."""
+        return self._path
+
+    def __len__(self) -> int:
+        """The number of points in the file."""
+        return len(self._y)
+
+    def read(
+        self, low: float | None, high: float | None, columns: int
+    ) -> tuple[Any, Any]:
+        """Read the points within a range of `x` values.
+
+        One more point is read either side of the range, if there is one,
+        so that a line runs off the edges of the plot.
+
+        Args:
+            low: The lowest `x` value to read, if there's a limit.
+            high: The highest `x` value to read, if there's a limit.
+            columns: The number of columns of the plot the points are for.
+
+        Returns:
+            The `x` and `y` values of the points, as NumPy arrays of floats.
+        """
+        length = len(self._y)
+        if self._x is None:
+            # As in Plotext, the first value is at position one.
+            start = 0 if low is None else ceil(low) - 1
+            stop = length if high is None else floor(high)
+        else:
+            # A binary search, which only touches a few pages of the file.
+            start = 0 if low is None else int(self._x.searchsorted(low, "left"))
+            stop = length if high is None else int(self._x.searchsorted(high, "right"))
+        start = min(max(start - 1, 0), length)
+        stop = min(max(stop + 1, start), length)
+        limit = max(columns, 1) * self.resolution
+        if stop - start <= limit:
+            y = numpy.array(self._y[start:stop], dtype=numpy.float64)
+            if self._x is None:
+                return numpy.arange(start + 1, stop + 1, dtype=numpy.float64), y
+            return numpy.array(self._x[start:stop], dtype=numpy.float64), y
+        # Taking every so many points would drop spikes between them, so
+        # each bucket is drawn as its lowest and its highest point, at the
+        # `x` value the bucket starts at.
+        size = -(-2 * (stop - start) // limit)
+        window = self._y[start:stop]
+        edges = numpy.arange(0, stop - start, size)
+        low_y = numpy.minimum.reduceat(window, edges).astype(numpy.float64)
+        high_y = numpy.maximum.reduceat(window, edges).astype(numpy.float64)
+        if self._x is None:
+            at = (edges + start + 1).astype(numpy.float64)
+        else:
+            at = numpy.array(self._x[start:stop][edges], dtype=numpy.float64)
+        return numpy.repeat(at, 2), numpy.column_stack((low_y, high_y)).ravel()
@@ -0,0 +1,86 @@
+"""Provides tools for accounting for the memory used by plots."""
+
+from __future__ import annotations
+
+from sys import getsizeof
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from textual.app import App
+
+    from .plotext_plot import PlotextPlot
+
+_FLOAT_SIZE = getsizeof(0.0)
+"""The number of bytes used by a Python float."""
+
+
+class MemoryUsage(NamedTuple):
+    """The memory used by a plot, in bytes."""
+
+    series: int
+    """The memory used by the data held by the plot's series handles."""
+
+    figure: int
+    """The memory used by the per-signal lists held inside Plotext."""
+
+    canvas: int
+    """The memory used by the canvas of the most recent build."""
+
+    @property
+    def total(self) -> int:
+        """The total memory used by the plot, in bytes."""
+        return self.series + self.figure + self.canvas
+
+
+def _signals_size(monitor: Any) -> int:
+    """Estimate the memory used by the per-signal lists of a Plotext monitor.
+
+    Args:
+        monitor: The monitor to size.
+
+    Returns:
+        The estimated number of bytes.
+    """
+    size = 0
+    for name in ("x", "y", "marker", "color", "style"):
+        signals = getattr(monitor, name)
+        size += getsizeof(signals) + sum(getsizeof(signal) for signal in signals)
+    for name in ("x", "y"):
+        size += sum(len(signal) for signal in getattr(monitor, name)) * _FLOAT_SIZE
+    return size
+
+
+def _canvas_size(monitor: Any) -> int:
+    """Estimate the memory used by the built canvas of a Plotext monitor.
+
+    Args:
+        monitor: The monitor to size.
+
+    Returns:
+        The estimated number of bytes.
+    """
+    matrix = monitor.matrix
+    size = getsizeof(getattr(matrix, "canvas", ""))
+    for name in ("marker", "fullground", "background", "style"):
+        rows = getattr(matrix, name, [])
+        size += getsizeof(rows) + sum(getsizeof(row) for row in rows)
+    return size
+
+
+def memory_usage(app: App[Any]) -> list[tuple[PlotextPlot, MemoryUsage]]:
+    """Get the memory used by all of the plots in an application.
+
+    Args:
+        app: The application to get the memory usage for.
+
+    Returns:
+        A list of each plot widget and its memory usage, largest first.
+    """
+    from .plotext_plot import PlotextPlot  # pylint:disable=import-outside-toplevel
+
+    usage = [
+        (plot, plot.memory_usage())
+        for screen in app.screen_stack
+        for plot in screen.query(PlotextPlot)
+    ]
+    return sorted(usage, key=lambda plot_usage: plot_usage[1].total, reverse=True)
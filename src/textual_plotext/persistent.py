@@ -0,0 +1,246 @@
+"""Provides an opt-in, persistent, on-disk cache of built plots.
+
+Plots of data that doesn't change (yesterday's metrics, say) are built
+again each time an application starts. Giving a `PlotextPlot` a
+`PersistentFrameCache` keeps what each plot builds in a directory on disk,
+keyed by a hash of the content of the plot along with its size and theme,
+so that the next run of the application can load it rather than build it.
+
+The cache is safe to share between several processes: each entry is written
+to a temporary file that is then moved into place, so an entry is only ever
+seen whole; and an entry that has gone by the time it is read is simply a
+miss.
+"""
+
+from __future__ import annotations
+
+import os
+import zlib
+from hashlib import blake2b
+from pathlib import Path
+from tempfile import mkstemp
+from time import time
+from typing import TYPE_CHECKING, NamedTuple
+
+import plotext
+
+if TYPE_CHECKING:
+    from .plot import Plot
+
+_MAGIC = b"TXPF\x01"
+"""The bytes that start every entry in the cache, including its format version."""
+
+_SUFFIX = ".frame"
+"""The suffix of the name of each entry in the cache."""
+
+_PARTIAL = ".partial"
+"""The suffix of the name of an entry that is still being written."""
+
+_ABANDONED = 60 * 60
+"""How old, in seconds, a partial entry must be before it is taken as abandoned."""
+
+
+class PersistentFrameCacheStats(NamedTuple):
+    """Statistics for a persistent frame cache."""
+
+    hits: int
+    """The number of times a plot was loaded from the cache."""
+
+    misses: int
+    """The number of times a plot wasn't in the cache."""
+
+    writes: int
+    """The number of plots written to the cache."""
+
+    evictions: int
+    """The number of entries evicted to keep within the budget."""
+
+
+class PersistentFrameCache:
+    """A size-capped cache of built plots, kept in a directory on disk.
+
+    Each entry is the output of a plot's build, compressed. Once the
+    entries in the directory take up more than the byte budget, the least
+    recently used are removed.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    """The default byte budget of a persistent frame cache."""
+
+    def __init__(
+        self, directory: str | os.PathLike[str], max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """Initialise the persistent frame cache.
+
+        Args:
+            directory: The directory to keep the cache in; it is created if
+                need be.
+            max_bytes: The byte budget of the cache.
+        """
+        self._directory = Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        """The byte budget of the cache."""
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evictions = 0
+
+    @property
+    def directory(self) -> Path:
+        """The directory the cache is kept in."""
+        return self._directory
+
+    @property
+    def stats(self) -> PersistentFrameCacheStats:
+        """The statistics for the cache, for this process."""
+        return PersistentFrameCacheStats(
+            self._hits, self._misses, self._writes, self._evictions
+        )
+
+    @staticmethod
+    def key(plot: Plot, width: int, height: int, theme: str) -> str:
+        """Get the key for a plot in the cache.
+
+        Args:
+            plot: The plot.
+            width: The width the plot is built at.
+            height: The height the plot is built at.
+            theme: The name of the Plotext theme the plot is built with.
+
+        Returns:
+            The key.
+        """
+        digest = blake2b(digest_size=20)
+        digest.update(_MAGIC)
+        digest.update(getattr(plotext, "__version__", "").encode())
+        digest.update(f"{width}x{height}:{theme}:".encode())
+        digest.update(plot.content_hash().encode())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        """Get the path of the entry for a key.
+
+        Args:
+            key: The key.
+
+        Returns:
+            The path of the entry.
+        """
+        return self._directory / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> str | None:
+        """Get a built plot from the cache.
+
+        Args:
+            key: The key of the plot.
+
+        Returns:
+            The output of the plot's build, or `None` if it isn't in the cache.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self._misses += 1
+            return None
+        try:
+            if not data.startswith(_MAGIC):
+                raise ValueError("Not an entry in the cache")
+            built = zlib.decompress(data[len(_MAGIC) :]).decode("utf-8")
+        except (ValueError, zlib.error):
+            # Entries are only ever seen whole, so this one is from something
+            # else; it's of no use, so it may as well go.
+            self._discard(path)
+            self._misses += 1
+            return None
+        try:
+            # Mark the entry as recently used, for the sake of eviction.
+            os.utime(path)
+        except OSError:
+            pass
+        self._hits += 1
+        return built
+
+    def put(self, key: str, built: str) -> None:
+        """Put a built plot into the cache.
+
+        Any failure to write to the cache is ignored; the cache is only an
+        aid to speed.
+
+        Args:
+            key: The key of the plot.
+            built: The output of the plot's build.
+        """
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            handle, partial = mkstemp(
+                prefix=f".{key}-", suffix=_PARTIAL, dir=self._directory
+            )
+            try:
+                with os.fdopen(handle, "wb") as entry:
+                    entry.write(_MAGIC + zlib.compress(built.encode("utf-8")))
+                os.replace(partial, self._path(key))
+            except BaseException:
+                self._discard(Path(partial))
+                raise
+        except OSError:
+            return
+        self._writes += 1
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all of the entries from the cache."""
+        for path in self._entries():
+            self._discard(path)
+
+    def _entries(self) -> list[Path]:
+        """Get the paths of the entries in the cache.
+
+        Returns:
+            The paths.
+        """
+        try:
+            return [
+                path
+                for path in self._directory.iterdir()
+                if path.name.endswith(_SUFFIX)
+            ]
+        except OSError:
+            return []
+
+    @staticmethod
+    def _discard(path: Path) -> None:
+        """Remove a file from the cache, if it's still there.
+
+        Args:
+            path: The path of the file.
+        """
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Evict entries until the cache is within its budget."""
+        entries: list[tuple[float, int, Path]] = []
+        try:
+            paths = list(self._directory.iterdir())
+        except OSError:
+            return
+        now = time()
+        for path in paths:
+            try:
+                status = path.stat()
+            except OSError:
+                continue
+            if path.name.endswith(_SUFFIX):
+                entries.append((status.st_mtime, status.st_size, path))
+            elif path.name.endswith(_PARTIAL) and now - status.st_mtime > _ABANDONED:
+                self._discard(path)
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_bytes:
+                break
+            self._discard(path)
+            size -= entry_size
+            self._evictions += 1
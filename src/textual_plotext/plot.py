@@ -6,9 +6,37 @@ inside Plotext and promotes it to the top level, so to speak, and then takes
 care of adding in some of the utility methods that will bee needed.
 """
 
+# A `Plot` owns both its series and the Plotext figures they are drawn in,
+# and has to work with the internals of each; Plotext gives no public way
+# to walk its subplots, for one. So pylint is asked not to flag protected
+# access in this file.
+#
+# pylint:disable=protected-access
+
 from __future__ import annotations
 
-from typing import Any, Tuple, Union
+import pickle
+from collections import deque
+from concurrent.futures import Executor
+from functools import partial, wraps
+from hashlib import blake2b
+from inspect import getattr_static
+from itertools import count
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Container,
+    Hashable,
+    Iterator,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from textual.theme import BUILTIN_THEMES
 from typing_extensions import Literal, TypeAlias, get_args
@@ -22,7 +50,28 @@ from plotext._utility import get_color_code
 from textual.color import Color as TextualColor
 
 from . import plotext
+from .histogram import StreamingHistogram
+from .memory import MemoryUsage, _canvas_size, _signals_size
 from .plotext._figure import _figure_class as Figure
+from ._categories import BarAggregation
+from .series import _BAR_KINDS, Series, _compact
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+try:
+    from . import _raster
+except ImportError:
+    _raster = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from ._raster import Signal
+    from .dataset import Dataset
+    from .mapped import MappedData
+    from .resample import ResamplerView
+    from .trace import TraceRecorder
 
 PlotextThemeName = Literal[
     # The standard Plotext themes.
@@ -73,7 +122,299 @@ Note:
 Color: TypeAlias = Union[str, int, Tuple[int, int, int]]
 """Type of a Plotext colour."""
 
+_epochs = count()
+"""Source of epochs for plots; a new epoch starts each time data is cleared."""
+
+_BUILD_STATE = (
+    "x",
+    "y",
+    "marker",
+    "color",
+    "style",
+    "xlim",
+    "ylim",
+    "xticks",
+    "yticks",
+    "xlabels",
+    "ylabels",
+    "hcoord",
+    "vcoord",
+    "hcolors",
+    "vcolors",
+    "tx",
+    "ty",
+)
+"""The attributes of a Plotext monitor that are restored after a build."""
+
+
+class _Quality(NamedTuple):
+    """How a plot is drawn at a level of quality."""
+
+    markers: Mapping[str, str]
+    """The markers to draw in place of others."""
+
+    points: int | None
+    """The most points of a line or scatter series to draw, per column.
+
+    `None` if there's no limit.
+    """
+
+    grid: bool
+    """Are grid lines drawn?"""
+
+
+_HD_TO_DOT = {"braille": "dot", "fhd": "dot", "hd": "dot"}
+"""Markers that draw in high definition, replaced with a plain dot."""
+
+_QUALITIES = (
+    _Quality(_HD_TO_DOT, 1, False),
+    _Quality(_HD_TO_DOT, 4, False),
+    _Quality({"braille": "hd", "fhd": "hd"}, 16, True),
+    _Quality({}, None, True),
+)
+"""How a plot is drawn at each level of quality, from the lowest up."""
+
+
+_QUERIES = frozenset(
+    {
+        "build",
+        "clear_terminal",
+        "clt",
+        "datetime_to_string",
+        "datetimes_to_strings",
+        "main",
+        "memory_usage",
+        "publish",
+        "save_fig",
+        "savefig",
+        "show",
+        "string_to_datetime",
+        "string_to_time",
+        "strings_to_time",
+        "subplot",
+        "today_datetime",
+        "today_string",
+    }
+)
+"""The public methods of a figure that don't change what it would build."""
+
+_RESIZES = frozenset({"plot_size", "plotsize", "take_min"})
+"""The public methods of a figure that change no more than its size."""
+
+_RECORDED_QUERIES = frozenset({"publish", "subplot"})
+"""The public methods of a figure that don't change it, but are still recorded."""
+
+FigureType = TypeVar("FigureType", bound=Type[Figure])
+
+
+def _tracked(cls: FigureType) -> FigureType:
+    """Make a figure class track changes made to it.
+
+    Every public method that could change what a figure builds is wrapped so
+    that calling it bumps the generation of the master figure. Unless all it
+    changes is the size of the figure, it also counts as a change to the
+    figure itself.
+
+    While the plot is being recorded, these calls, and those queries that
+    matter to a replay, are made through the recorder.
+
+    Args:
+        cls: The figure class to track changes for.
+
+    Returns:
+        The figure class.
+    """
+
+    def track(method: Callable[..., Any], resizes: bool) -> Callable[..., Any]:
+        @wraps(method)
+        def tracked(self: Figure, *args: Any, **kwargs: Any) -> Any:
+            try:
+                return _call(self, method, args, kwargs)
+            finally:
+                if not resizes:
+                    self._changes += 1
+                self._master._generation += 1
+
+        return tracked
+
+    def record(method: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(method)
+        def recorded(self: Figure, *args: Any, **kwargs: Any) -> Any:
+            return _call(self, method, args, kwargs)
+
+        return recorded
+
+    for name in dir(cls):
+        if name.startswith("_"):
+            continue
+        if isinstance(getattr_static(cls, name), (staticmethod, classmethod)):
+            continue
+        if not callable(method := getattr(cls, name)):
+            continue
+        if name in _RECORDED_QUERIES:
+            setattr(cls, name, record(method))
+        elif name not in _QUERIES:
+            setattr(cls, name, track(method, name in _RESIZES))
+    return cls
+
+
+def _call(figure: Figure, method: Callable[..., Any], args: Any, kwargs: Any) -> Any:
+    """Call a method of a figure, through the plot's recorder if it has one.
+
+    Args:
+        figure: The figure.
+        method: The method.
+        args: The positional arguments of the call.
+        kwargs: The keyword arguments of the call.
+
+    Returns:
+        The result of the call.
+    """
+    recorder = figure._master._recorder
+    if recorder is None:
+        return method(figure, *args, **kwargs)
+    return recorder._call(figure, method, args, kwargs)
+
+
+@_tracked
+class _Subfigure(Figure):
+    """A subplot within a `Plot`, which tracks changes made to it."""
+
+    _changes = 0
+
+    _block: Hashable = None
+
+    def _set_subplots(self) -> None:
+        self.subfig = [
+            [_Subfigure(self._master, self) for _ in self._Cols] for _ in self._Rows
+        ]
 
+    def _build_matrix(self) -> None:
+        """Build the subplot, unless the block last built for it is current."""
+        if not (self._no_plots and self._block == _block(self)):
+            super()._build_matrix()
+
+
+def _block(figure: Figure) -> Hashable:
+    """Get the key for the block of canvas that a subplot would build.
+
+    Args:
+        figure: The subplot.
+
+    Returns:
+        A key that changes whenever the subplot, any figure it is part of,
+        or its size, changes.
+    """
+    size = (figure._width, figure._height)
+    changes = [figure._changes]
+    while not figure._is_master:
+        figure = figure._parent
+        changes.append(figure._changes)
+    return (tuple(changes), size)
+
+
+def _subplots(figure: Figure) -> Iterator[tuple[int, int, Figure]]:
+    """Iterate over the subplots directly within a figure.
+
+    Args:
+        figure: The figure.
+
+    Yields:
+        The row and column of each subplot, and the subplot; nothing if the
+        figure has no subplots.
+    """
+    if not figure._no_plots:
+        for row in figure._Rows:
+            for col in figure._Cols:
+                yield row, col, figure._get_subplot(row, col)
+
+
+def _leaves(figure: Figure) -> Iterator[Figure]:
+    """Iterate over the figures within a figure that are drawn into.
+
+    Args:
+        figure: The figure to get the leaves for.
+
+    Yields:
+        The figure itself if it has no subplots, otherwise each of the
+        subplots within it that has none.
+    """
+    if figure._no_plots:
+        yield figure
+    for _, _, subplot in _subplots(figure):
+        yield from _leaves(subplot)
+
+
+def _figures(figure: Figure) -> Iterator[Figure]:
+    """Iterate over a figure and all of the subplots within it.
+
+    Args:
+        figure: The figure to start from.
+
+    Yields:
+        The figure itself, then each of its subplots, depth first.
+    """
+    yield figure
+    for _, _, subplot in _subplots(figure):
+        yield from _figures(subplot)
+
+
+_BUILT = frozenset({"matrix"})
+"""The attributes of a Plotext monitor that hold what it has built."""
+
+_UNHASHED = _BUILT | {"default"}
+"""The attributes of a Plotext monitor left out of the content of a plot.
+
+Besides what the monitor has built, this is the defaults it falls back on;
+which come from Plotext and the theme, though Plotext also shares the tick
+lists of a bar chart with them.
+"""
+
+
+def _hashable_content(monitor: Any) -> dict[str, Any]:
+    """Get the content of a Plotext monitor, in the same form in every run.
+
+    Plotext sets the ticks of a bar chart from a set of positions, so their
+    order depends on the hash seed; the ticks are sorted, along with their
+    labels, so that the same chart always has the same content.
+
+    Args:
+        monitor: The Plotext monitor.
+
+    Returns:
+        The attributes of the monitor that make up its content.
+    """
+    content = {
+        name: value for name, value in vars(monitor).items() if name not in _UNHASHED
+    }
+    for ticks_name, labels_name in (("xticks", "xlabels"), ("yticks", "ylabels")):
+        sides = []
+        for ticks, labels in zip(content[ticks_name], content[labels_name]):
+            if ticks is not None:
+                order = sorted(range(len(ticks)), key=ticks.__getitem__)
+                ticks = [ticks[index] for index in order]
+                if labels is not None and len(labels) == len(order):
+                    labels = [labels[index] for index in order]
+            sides.append((ticks, labels))
+        content[ticks_name] = [ticks for ticks, _ in sides]
+        content[labels_name] = [labels for _, labels in sides]
+    return content
+
+
+def _monitors(figure: Figure) -> Iterator[Any]:
+    """Iterate over all of the Plotext monitors within a figure.
+
+    Args:
+        figure: The figure to get the monitors for.
+
+    Yields:
+        The monitor of the figure and of every subplot within it.
+    """
+    for each in _figures(figure):
+        yield each.monitor
+
+
+@_tracked
 class Plot(Figure):
     """A class that provides a Textual-friendly interface to Plotext.
 
@@ -100,8 +441,773 @@ class Plot(Figure):
 
     functionally equivalent, but with the advantage that the latter has no
     global state and is free of external side-effects.
+
+    Unlike with Plotext, `plot`, `scatter` and `bar` return a `Series`
+    handle that can be used to update, restyle or remove that series without
+    having to clear and redeclare the whole figure.
+
+    Every change made to the plot, or to any of its subplots or series, bumps
+    its `generation`; so a plot whose generation hasn't changed would build
+    the same as it did last time. Changes are also tracked for each subplot,
+    so that only the subplots that have changed are built again.
+
+    A plot isn't safe to change from more than one thread; other than by
+    `publish`ing new data for its series, which can be done from any thread.
+    """
+
+    _generation = 0
+
+    _changes = 0
+
+    _on_publish: Callable[[], None] | None = None
+    """Called, from the publishing thread, whenever data is published."""
+
+    _recorder: TraceRecorder | None = None
+    """The recorder of the calls made to the plot, if it is being recorded."""
+
+    build_executor: Executor | None = None
+    """An executor to build the subplots that have changed in.
+
+    By default the subplots of a plot that have changed since it was last
+    built are built one after the other. Set this to a
+    `concurrent.futures.ThreadPoolExecutor` to build them concurrently. The
+    executor belongs to the caller, and isn't shut down by the plot.
+
+    Note:
+        Plotext is pure Python, so how much this helps depends on how much
+        of the work is done while the GIL is released; subplots holding
+        large series that are rasterised with NumPy gain the most.
     """
 
+    vectorise = True
+    """Use NumPy, if it is installed, to speed up drawing large series.
+
+    Line and scatter series with many more points than there are cells on
+    the canvas are reduced, with NumPy, to just the points that would be
+    drawn before Plotext draws them; which gives the same plot, only
+    faster. Set this to `False` to leave all of the drawing to Plotext
+    (other than for scatter series drawn as density maps).
+    """
+
+    FULL_QUALITY = len(_QUALITIES) - 1
+    """The level of quality at which a plot is drawn in full."""
+
+    _quality = FULL_QUALITY
+
+    def __init__(self) -> None:
+        """Initialise the plot."""
+        super().__init__()
+        self._epoch = next(_epochs)
+        self._series: list[Series] = []
+        self._built: tuple[tuple[int, int | None, int | None], str] | None = None
+        self._theme: str | None = None
+        self._published: deque[tuple[dict[Series, Any], bool]] = deque()
+
+    @property
+    def generation(self) -> int:
+        """The generation of the plot; this changes each time the plot does."""
+        return self._generation
+
+    @property
+    def quality(self) -> int:
+        """The level of quality the plot is drawn at.
+
+        At `FULL_QUALITY` (the default) the plot is drawn as declared. Each
+        level below that trades some fidelity for a faster build:
+
+        - `FULL_QUALITY - 1`: braille and full high-definition markers are
+          drawn as high-definition markers, and line and scatter series are
+          thinned to at most 16 points per column.
+        - `FULL_QUALITY - 2`: all high-definition markers are drawn as dots,
+          series are thinned to 4 points per column, and there's no grid.
+        - `0`: as above, with series thinned to 1 point per column.
+
+        Series drawn as density maps, or with per-point markers, colours or
+        styles, are never thinned.
+        """
+        return self._quality
+
+    @quality.setter
+    def quality(self, quality: int) -> None:
+        quality = min(max(quality, 0), self.FULL_QUALITY)
+        if quality != self._quality:
+            self._quality = quality
+            self._changes += 1
+            self._generation += 1
+
+    def _set_subplots(self) -> None:
+        self.subfig = [
+            [_Subfigure(self._master, self) for _ in self._Cols] for _ in self._Rows
+        ]
+
+    def _target_figures(self) -> list[Figure]:
+        """Get the figures that a plotting call on the plot would draw into.
+
+        Returns:
+            The list of figures.
+        """
+        return list(_leaves(self))
+
+    def theme(self, theme: str | None = None) -> None:
+        """A wrapper around Plotext's `theme`, which remembers the theme."""
+        super().theme(theme)
+        self._theme = theme
+
+    def clear_color(self) -> None:
+        """A wrapper around Plotext's `clear_color`."""
+        super().clear_color()
+        self._theme = None
+
+    clc = clear_color
+
+    def clear_data(self) -> None:
+        """Clear the data of the plot, detaching any series handles."""
+        super().clear_data()
+        self._epoch = next(_epochs)
+        self._series = []
+
+    cld = clear_data
+
+    def scatter(  # type: ignore[override]
+        self,
+        *args: Sequence[Any] | Dataset | MappedData | ResamplerView,
+        marker: str | None = None,
+        color: Color | None = None,
+        style: str | None = None,
+        fillx: float | bool | str | None = None,
+        filly: float | bool | str | None = None,
+        xside: str | None = None,
+        yside: str | None = None,
+        label: str | None = None,
+        density: bool = False,
+    ) -> Series:
+        """A wrapper around Plotext's `scatter`.
+
+        Args:
+            *args: The data, as for Plotext's `scatter`; or a `Dataset`, to
+                show a view of it; or `MappedData`, or a view of a
+                `Resampler`, to read from.
+            density: Draw the series as a density map: rather than a marker
+                for each point, each cell of the canvas that any points land
+                in is shaded, using the theme's colour sequence, by how many
+                points land in it. This needs NumPy; without it the series
+                is drawn as a normal scatter.
+
+        Returns:
+            A handle for updating, restyling or removing the series.
+
+        Raises:
+            ValueError: If a density map is asked for with `fillx` or `filly`.
+        """
+        return Series(
+            self,
+            "scatter",
+            args,
+            dict(
+                marker=marker,
+                color=color,
+                style=style,
+                fillx=fillx,
+                filly=filly,
+                xside=xside,
+                yside=yside,
+                label=label,
+                density=density,
+            ),
+        )
+
+    def plot(  # type: ignore[override]
+        self,
+        *args: Sequence[Any] | Dataset | MappedData | ResamplerView,
+        marker: str | None = None,
+        color: Color | None = None,
+        style: str | None = None,
+        fillx: float | bool | str | None = None,
+        filly: float | bool | str | None = None,
+        xside: str | None = None,
+        yside: str | None = None,
+        label: str | None = None,
+    ) -> Series:
+        """A wrapper around Plotext's `plot`.
+
+        Args:
+            *args: The data, as for Plotext's `plot`; or a `Dataset`, to show
+                a view of it; or `MappedData`, or a view of a `Resampler`, to
+                read from.
+
+        Returns:
+            A handle for updating, restyling or removing the series.
+        """
+        return Series(
+            self,
+            "plot",
+            args,
+            dict(
+                marker=marker,
+                color=color,
+                style=style,
+                fillx=fillx,
+                filly=filly,
+                xside=xside,
+                yside=yside,
+                label=label,
+            ),
+        )
+
+    def plot_many(
+        self,
+        *args: Any,
+        marker: str | None = None,
+        color: Color | list[Color] | None = None,
+        style: str | None = None,
+        fillx: float | bool | str | None = None,
+        filly: float | bool | str | None = None,
+        xside: str | None = None,
+        yside: str | None = None,
+        labels: Sequence[str | None] | None = None,
+    ) -> list[Series]:
+        """Plot many line series at once, from the rows of a 2-D array.
+
+        This draws the same as calling `plot` once for each row, but much
+        faster for many series:
+
+        ```python
+        cores = plt.plot_many(times, usage, labels=[f"CPU {n}" for n in range(64)])
+        ...
+        cores[3].set_data(times, usage[3])
+        ```
+
+        The data is copied into a single array, of which each series holds
+        a row, and the series share their `x` data; series that share their
+        `x` data are also rasterised together, if they are drawn with
+        NumPy. Unless a colour is given, each series takes the next colour
+        from the theme's sequence, as it would have with `plot`.
+
+        Args:
+            *args: The data, as `Y` or `x, Y`: `Y` is a 2-D array, or a
+                sequence of sequences of the same length, holding a row of
+                `y` data for each series; and `x` is the `x` data shared by
+                all of them.
+            color: The colour of every series, or a list of the colour of
+                each.
+            labels: The label of each series.
+
+        Returns:
+            A handle for each series, in the order of the rows.
+
+        Raises:
+            TypeError: If the data isn't given as `Y` or `x, Y`.
+            ValueError: If the data isn't a 2-D array of numbers, or there
+                isn't an `x` value, label or colour for each.
+        """
+        if len(args) not in (1, 2):
+            raise TypeError("The data of many series is given as Y or x, Y")
+        x, rows = args if len(args) == 2 else (None, args[0])
+        many = len(rows)
+        if labels is not None and len(labels) != many:
+            raise ValueError("There must be a label for each series")
+        if isinstance(color, list) and len(color) != many:
+            raise ValueError("There must be a colour for each series")
+        figures = self._target_figures()
+        monitor = figures[0].monitor
+        # Without a colour, each series is left to pick the next colour from
+        # the theme's sequence, in each subplot it's drawn in, as with `plot`.
+        colors = color if isinstance(color, list) else [color] * many
+
+        def options(index: int) -> dict[str, Any]:
+            return dict(
+                marker=marker,
+                color=colors[index],
+                style=style,
+                fillx=fillx,
+                filly=filly,
+                xside=xside,
+                yside=yside,
+                label=None if labels is None else labels[index],
+            )
+
+        if numpy is None:
+            return [
+                self.plot(*(() if x is None else (x,)), row, **options(index))
+                for index, row in enumerate(rows)
+            ]
+        y = numpy.array(rows, dtype=numpy.float64)
+        if y.ndim != 2:
+            raise ValueError("The y data of many series needs a row for each series")
+        x_date = False
+        if x is None:
+            x = numpy.arange(1, y.shape[1] + 1, dtype=numpy.float64)
+        else:
+            x, x_date = monitor.to_time(list(x))
+            x = _compact(x)
+            if len(x) != y.shape[1]:
+                raise ValueError("There must be an x value for each column of y data")
+        series = []
+        for index in range(many):
+            handle = Series(self, "plot", ([],), options(index))
+            handle._adopt((x, y[index], x_date, False))
+            series.append(handle)
+        return series
+
+    def bar(  # type: ignore[override]
+        self,
+        *args: Sequence[Any],
+        marker: str | None = None,
+        color: Color | None = None,
+        fill: bool | None = None,
+        width: float | None = None,
+        orientation: str | None = None,
+        minimum: float | None = None,
+        reset_ticks: bool | None = None,
+        xside: str | None = None,
+        yside: str | None = None,
+        label: str | None = None,
+        aggregate: BarAggregation | None = None,
+        max_categories: int | None = None,
+        sort: bool = False,
+    ) -> Series:
+        """A wrapper around Plotext's `bar`.
+
+        Args:
+            aggregate: How to reduce the categories to those that fit: the
+                largest categories and one for all of the others (`"top"`),
+                runs of neighbouring categories (`"buckets"`), or a window
+                onto the categories that can be scrolled with the series'
+                `category_offset` (`"window"`). By default every category is
+                drawn.
+            max_categories: The number of categories to reduce to; by
+                default, as many as fit in the width (or the height, for a
+                horizontal chart) of the plot.
+            sort: Sort the categories in a window by value, largest first.
+
+        Returns:
+            A handle for updating, restyling or removing the series.
+        """
+        return Series(
+            self,
+            "bar",
+            args,
+            dict(
+                marker=marker,
+                color=color,
+                fill=fill,
+                width=width,
+                orientation=orientation,
+                minimum=minimum,
+                reset_ticks=reset_ticks,
+                xside=xside,
+                yside=yside,
+                label=label,
+                aggregate=aggregate,
+                max_categories=max_categories,
+                sort=sort,
+            ),
+        )
+
+    def multiple_bar(  # type: ignore[override]
+        self,
+        *args: Sequence[Any],
+        marker: str | None = None,
+        color: Color | Sequence[Color] | None = None,
+        fill: bool | None = None,
+        width: float | None = None,
+        orientation: str | None = None,
+        minimum: float | None = None,
+        reset_ticks: bool | None = None,
+        xside: str | None = None,
+        yside: str | None = None,
+        labels: Sequence[str] | None = None,
+        aggregate: BarAggregation | None = None,
+        max_categories: int | None = None,
+        sort: bool = False,
+    ) -> Series:
+        """A wrapper around Plotext's `multiple_bar`.
+
+        Args:
+            aggregate: How to reduce the categories to those that fit; see
+                `bar`.
+            max_categories: The number of categories to reduce to; see `bar`.
+            sort: Sort the categories in a window by value, largest first.
+
+        Returns:
+            A handle for updating, restyling or removing the series.
+        """
+        return Series(
+            self,
+            "multiple_bar",
+            args,
+            dict(
+                marker=marker,
+                color=color,
+                fill=fill,
+                width=width,
+                orientation=orientation,
+                minimum=minimum,
+                reset_ticks=reset_ticks,
+                xside=xside,
+                yside=yside,
+                labels=labels,
+                aggregate=aggregate,
+                max_categories=max_categories,
+                sort=sort,
+            ),
+        )
+
+    def stacked_bar(  # type: ignore[override]
+        self,
+        *args: Sequence[Any],
+        marker: str | None = None,
+        color: Color | Sequence[Color] | None = None,
+        fill: bool | None = None,
+        width: float | None = None,
+        orientation: str | None = None,
+        minimum: float | None = None,
+        reset_ticks: bool | None = None,
+        xside: str | None = None,
+        yside: str | None = None,
+        labels: Sequence[str] | None = None,
+        aggregate: BarAggregation | None = None,
+        max_categories: int | None = None,
+        sort: bool = False,
+    ) -> Series:
+        """A wrapper around Plotext's `stacked_bar`.
+
+        Args:
+            aggregate: How to reduce the categories to those that fit; see
+                `bar`.
+            max_categories: The number of categories to reduce to; see `bar`.
+            sort: Sort the categories in a window by value, largest first.
+
+        Returns:
+            A handle for updating, restyling or removing the series.
+        """
+        return Series(
+            self,
+            "stacked_bar",
+            args,
+            dict(
+                marker=marker,
+                color=color,
+                fill=fill,
+                width=width,
+                orientation=orientation,
+                minimum=minimum,
+                reset_ticks=reset_ticks,
+                xside=xside,
+                yside=yside,
+                labels=labels,
+                aggregate=aggregate,
+                max_categories=max_categories,
+                sort=sort,
+            ),
+        )
+
+    def streaming_hist(
+        self,
+        bins: int = 10,
+        *,
+        limits: tuple[float, float] | None = None,
+        half_life: float | None = None,
+        window: float | None = None,
+        slices: int = 10,
+        norm: bool = False,
+        marker: str | None = None,
+        color: Color | None = None,
+        fill: bool | None = None,
+        width: float | None = None,
+        orientation: str | None = None,
+        xside: str | None = None,
+        yside: str | None = None,
+        label: str | None = None,
+    ) -> StreamingHistogram:
+        """Add a histogram that folds in batches of samples as they arrive.
+
+        Unlike `hist`, the samples aren't kept: each batch given to the
+        histogram's `add` is folded into the count of each bin, and the plot
+        is drawn from the counts alone.
+
+        Args:
+            bins: The number of bins. If there are no `limits` this must be
+                even.
+            limits: Fixed lower and upper limits for the bins. By default
+                the limits are taken from the first batch of samples, and
+                expanded as needed to take in later samples.
+            half_life: If given, the counts fade over time, halving over
+                this many seconds.
+            window: If given, only the samples added in this many seconds
+                are counted.
+            slices: The number of slices the window is split into; samples
+                are expired a slice at a time.
+            norm: Draw the share of the total in each bin rather than the
+                count.
+
+        Returns:
+            A handle for adding samples to the histogram.
+        """
+        return StreamingHistogram(
+            self.bar(
+                [],
+                [],
+                marker=marker,
+                color=color,
+                fill=fill,
+                width=width,
+                orientation=orientation,
+                reset_ticks=False,
+                xside=xside,
+                yside=yside,
+                label=label,
+            ),
+            bins,
+            limits,
+            half_life,
+            window,
+            slices,
+            norm,
+        )
+
+    def build(self) -> str:
+        """Build the plot.
+
+        The data held by the series handles is handed to Plotext for the
+        duration of the build, and taken back out again afterwards.
+
+        Plotext also applies log scales, and works out the limits and ticks
+        of the axes, as part of building a plot, writing the results back
+        into the figure; which means that building a plot a second time
+        would otherwise apply log scales twice over, and keep the limits of
+        the first build. Here everything is put back as it was once the
+        build is done, so every build starts afresh.
+
+        The plot is drawn at its current level of `quality`.
+
+        As a plot that hasn't changed would build the same again, the result
+        is kept and reused until the plot, or its size, changes. Likewise,
+        for a plot with subplots, the block of canvas built for each subplot
+        is reused until that subplot changes; and the subplots that have
+        changed are built in the `build_executor`, if there is one.
+
+        Any data that has been published for the plot's series is swapped
+        in first.
+
+        Returns:
+            The plot, as a string containing ANSI escape sequences.
+        """
+        if self._recorder is not None:
+            self._recorder._built(self._width, self._height, self._theme)
+        self._swap_buffers()
+        key = (self._generation, self._width, self._height)
+        if self._built is not None and self._built[0] == key:
+            return self._built[1]
+        quality = _QUALITIES[self._quality]
+        # Fitting a series may draw it again, which is to last beyond the
+        # build; so it's done before the state of the build is kept.
+        self._settle()
+        state = [
+            (
+                monitor,
+                {name: getattr(monitor, name) for name in (*_BUILD_STATE, "grid")},
+            )
+            for monitor in _monitors(self)
+        ]
+        if not quality.grid:
+            for monitor, _ in state:
+                monitor.grid = [False, False]
+        changed = [] if self._no_plots else list(_leaves(self))
+        current = {leaf.monitor for leaf in changed if leaf._block == _block(leaf)}
+        changed = [leaf for leaf in changed if leaf.monitor not in current]
+        staged = [series for series in self._series if series.kind not in _BAR_KINDS]
+        degraded = [
+            series._degrade(
+                quality.markers,
+                None if quality.points is None else quality.points * (self._width or 0),
+            )
+            for series in staged
+        ]
+        rasterised = self._rasterised(staged, current)
+        for series in staged:
+            series._stage(skip={*rasterised, *current})
+        try:
+            self._build_blocks(changed)
+            built = super().build()
+            self._built = (key, built)
+            return built
+        finally:
+            for monitor in rasterised:
+                del monitor.build_plot
+            for monitor, attributes in state:
+                for name, value in attributes.items():
+                    setattr(monitor, name, value)
+            for series, restore in zip(staged, degraded):
+                series._unstage()
+                restore()
+
+    def publish(self, updates: Mapping[Series, tuple[Sequence[Any], ...]]) -> None:
+        """Publish new data for some series, from any thread.
+
+        The new data is prepared on the calling thread and then published in
+        a single step, without taking any locks. It is swapped in for the
+        current data the next time the plot is built (or, in a
+        `PlotextPlot`, as soon as the application gets to it), with all of
+        the series published together changing together; until then, builds
+        see the data as it was. If a series is published to more than once
+        before that, only the latest data is used.
+
+        ```python
+        @work(thread=True)
+        def gather(self) -> None:
+            for x, y in readings():
+                line.publish(x, y)
+        ```
+
+        Args:
+            updates: The new data for each series, given as a tuple in the
+                same form as for `Series.set_data`.
+
+        Raises:
+            DetachedSeriesError: If any of the series are no longer in the
+                plot.
+        """
+        prepared = {series: series._prepare(data) for series, data in updates.items()}
+        # A series that follows a dataset, or reads from mapped data, stops
+        # doing so once it is given its own data; but that happens when the
+        # data is swapped in, on the thread that builds the plot.
+        self._publish_prepared(prepared, unlink=True)
+
+    def _publish_prepared(
+        self, prepared: dict[Series, Any], *, unlink: bool = False
+    ) -> None:
+        """Publish some prepared data for some series, from any thread.
+
+        Args:
+            prepared: The new data for each series, as prepared by the series.
+            unlink: Whether the series stop following a dataset, or reading
+                from mapped data, when the data is swapped in.
+        """
+        self._published.append((prepared, unlink))
+        if self._on_publish is not None:
+            self._on_publish()
+
+    def _publish_followed(self, prepared: dict[Series, Any]) -> None:
+        """Publish the new data of a dataset to the series that show it.
+
+        Args:
+            prepared: The new data for each series of the plot that shows
+                the dataset.
+        """
+        if self._recorder is not None:
+            for series, (x, y, _, _) in prepared.items():
+                self._recorder._followed(series, x, y)
+        self._publish_prepared(prepared)
+
+    def _swap_buffers(self) -> bool:
+        """Swap in any data that has been published since the last swap.
+
+        Returns:
+            `True` if any data was swapped in, `False` if not.
+        """
+        latest: dict[Series, tuple[Any, bool]] = {}
+        while self._published:
+            prepared, unlink = self._published.popleft()
+            latest.update((series, (data, unlink)) for series, data in prepared.items())
+        for series, (data, unlink) in latest.items():
+            # The series may have been removed since its data was published.
+            if series.attached:
+                if unlink:
+                    series._unlink()
+                series._adopt(data)
+        return bool(latest)
+
+    def _build_blocks(self, subplots: list[Figure]) -> None:
+        """Build the blocks of canvas for some subplots.
+
+        Args:
+            subplots: The subplots to build.
+        """
+
+        def build_block(subplot: Figure) -> None:
+            if not subplot.monitor.fast_plot:
+                subplot.monitor.build_plot()
+            subplot._block = _block(subplot)
+
+        if self.build_executor is None or len(subplots) < 2:
+            for subplot in subplots:
+                build_block(subplot)
+        else:
+            # Consume the results so that any exceptions are raised here.
+            list(self.build_executor.map(build_block, subplots))
+
+    def _rasterised(
+        self, staged: list[Series], skip: Container[Any] = ()
+    ) -> dict[Any, list[Signal]]:
+        """Set up the monitors whose signals will be rasterised with NumPy.
+
+        Args:
+            staged: The series that are being staged for the build.
+            skip: Any monitors that won't be built.
+
+        Returns:
+            The signals to be rasterised, for each monitor that has any.
+        """
+        if _raster is None:
+            return {}
+        rasterised: dict[Any, list[Signal]] = {}
+        for series in staged:
+            for monitor, signal in series._signals():
+                if monitor in skip:
+                    continue
+                if self.vectorise or signal.density:
+                    rasterised.setdefault(monitor, []).append(signal)
+        for monitor, signals in rasterised.items():
+            monitor.build_plot = partial(
+                _raster.build_plot, monitor, signals, _BUILD_STATE
+            )
+        return rasterised
+
+    def _settle(self) -> None:
+        """Settle the size of each subplot, and fit each series to its size."""
+        self._set_sizes()
+        for series in self._series:
+            series._fit()
+
+    def content_hash(self) -> str:
+        """Get a hash of the content of the plot.
+
+        Two plots with the same content hash build the same, including
+        across runs of an application; so the hash can be used to key a
+        built plot in a persistent cache.
+
+        Returns:
+            The hash, as a string of hexadecimal digits.
+        """
+        # Building starts by working out the size of each subplot, and by
+        # fitting the series to them; what that sets is part of the content,
+        # so settle it first.
+        self._settle()
+        digest = blake2b(digest_size=16)
+        digest.update(pickle.dumps((self._quality, self._theme), protocol=4))
+        for figure in _figures(self):
+            content = _hashable_content(figure.monitor)
+            digest.update(
+                pickle.dumps((figure._width, figure._height, content), protocol=4)
+            )
+        for series in self._series:
+            digest.update(pickle.dumps(series._content(), protocol=4))
+        return digest.hexdigest()
+
+    def memory_usage(self) -> MemoryUsage:
+        """Get the memory used by the plot.
+
+        Returns:
+            The memory used by the plot, in bytes.
+        """
+        monitors = list(_monitors(self))
+        return MemoryUsage(
+            sum(series._memory_usage() for series in self._series),
+            sum(_signals_size(monitor) for monitor in monitors),
+            sum(_canvas_size(monitor) for monitor in monitors),
+        )
+
     @staticmethod
     def sin(
         periods: int = 2,
@@ -14,7 +14,7 @@ general support for the type-hinting of Plotext.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Sequence, Tuple, Union
+from typing import Any, Hashable, Sequence, Tuple, Union
 
 from typing_extensions import Literal, Self, TypeAlias
 
@@ -23,6 +23,29 @@ Color: TypeAlias = Union[str, int, Tuple[int, int, int]]
 Orientation: TypeAlias = Literal["horizontal", "vertical"]
 
 class _figure_class:
+    ############################################################################
+    # Internal State
+    def __init__(
+        self, master: _figure_class | None = None, parent: _figure_class | None = None
+    ) -> None: ...
+    monitor: Any
+    subfig: list[list[_figure_class]]
+    _master: Any
+    _parent: Any
+    _is_master: bool
+    _changes: int
+    _block: Hashable
+    _no_plots: bool
+    _Rows: list[int]
+    _Cols: list[int]
+    _width: int | None
+    _height: int | None
+    def _get_subplot(
+        self, row: int | None = None, col: int | None = None
+    ) -> _figure_class: ...
+    def _set_sizes(self) -> None: ...
+    def _build_matrix(self) -> None: ...
+
     ############################################################################
     # Subplots Functions
     def subplot(
@@ -325,7 +348,7 @@ class _figure_class:
     def datetime_to_string(
         self, datetime: datetime, output_form: str | None = None
     ) -> str: ...
-    def datetimes_to_string(
+    def datetimes_to_strings(
         self, datetimes: Sequence[datetime], output_form: str | None = None
     ) -> list[str]: ...
     def string_to_datetime(
@@ -1,20 +1,56 @@
 """Provides a widget for creating and displaying a Plotext plot."""
 
 from __future__ import annotations
-from typing import Literal
+from time import perf_counter
+from typing import Any, AsyncIterable, Hashable, Literal, Optional
 
 from rich.text import Text
 from textual.app import RenderResult
 from textual.reactive import reactive
+from textual.signal import Signal
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.color import Color
+from textual.geometry import Region
+from typing_extensions import Self
+from ._ansi import ansi_to_text
+from .frames import _on_screen, frame_store
+from .memory import MemoryUsage
+from .persistent import PersistentFrameCache
 from .plot import Plot, PlotextThemeName, _rgbify_theme, _sequence
+from .profiling import _active_profiler
+from .resample import Resampler
+from .scheduler import OFF_SCREEN, _priority, build_scheduler
+from .series import Series
+from .sources import BackpressurePolicy, SourceBinding
 
 from plotext._dict import themes as _themes
 
 
 class PlotextPlot(Widget):
-    """A Plotext plot display widget."""
+    """A Plotext plot display widget.
+
+    When the widget isn't being displayed (for example, when it is in a
+    hidden tab, or on a screen that isn't current) it is paused: any timers
+    it owns are paused, and `paused_signal` is published so that any other
+    producers of data for the plot can throttle themselves. When the widget
+    is displayed again it catches up with a single build of the plot as it
+    is at that point.
+
+    Frames are built under the application's `build_scheduler`, so when many
+    plots change at once the focused plot is built first, then the plots
+    that can be seen, and then the rest; plots that don't fit into the time
+    slice of one frame show their previous frame until they're built.
+
+    If `frame_budget_ms` is set, the plot adapts the `quality` it is drawn
+    at so that building a frame keeps within that budget: each frame that
+    takes longer than the budget lowers the quality by a level, and once
+    several frames in a row have taken less than half of the budget the
+    quality is raised again by a level.
+    """
+
+    RECOVERY_FRAMES = 5
+    """The number of frames in a row well within budget before quality is raised."""
 
     DEFAULT_CSS = """
     PlotextPlot {
@@ -35,6 +71,14 @@ class PlotextPlot(Widget):
     If set to a specific Plotext theme name, that theme will be used.
     """
 
+    frame_budget_ms: reactive[float | None] = reactive[Optional[float]](
+        None, repaint=False
+    )
+    """The time, in milliseconds, that building a frame of the plot should take.
+
+    If set to `None` (the default) the plot is always drawn at full quality.
+    """
+
     def __init__(
         self,
         *,
@@ -42,6 +86,7 @@ class PlotextPlot(Widget):
         id: str | None = None,  # pylint:disable=redefined-builtin
         classes: str | None = None,
         disabled: bool = False,
+        persistent_cache: PersistentFrameCache | None = None,
     ) -> None:
         """Initialise the Plotext plot widget.
 
@@ -50,9 +95,27 @@ class PlotextPlot(Widget):
             id: The ID of the Plotext plot widget in the DOM.
             classes: The CSS classes of the Plotext plot widget.
             disabled: Whether the Plotext plot widget is disabled or not.
+            persistent_cache: The on-disk cache to keep built plots in, if any.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self.persistent_cache = persistent_cache
+        """The on-disk cache to keep built plots in, if any.
+
+        When set, a plot that has been built before, with the same content,
+        size and theme (by this or by an earlier run of the application) is
+        loaded from the cache rather than built again.
+        """
         self._plot = Plot()
+        self._plot._on_publish = self._data_published
+        self._swap_pending = False
+        self._applied: tuple[int, tuple[int, int, str]] | None = None
+        self._paused = False
+        self._paused_timers: list[Timer] = []
+        self.paused_signal: Signal[bool] = Signal(self, "paused")
+        """Published with the new paused state each time it changes."""
+        self._within_budget = 0
+        self.quality_signal: Signal[int] = Signal(self, "quality")
+        """Published with the new quality each time it is adapted."""
 
     def on_mount(self) -> None:
         """Set up the plot."""
@@ -60,6 +123,90 @@ class PlotextPlot(Widget):
             self, lambda theme: self._register_theme(theme.name)
         )
         self._register_theme(self.app.theme)
+        self.watch(self.screen, "stack_updates", self._update_paused, init=False)
+        self.call_after_refresh(self._update_paused)
+
+    def on_unmount(self) -> None:
+        """Release the frame held for the plot."""
+        frame_store(self.app).discard(self)
+
+    def on_show(self) -> None:
+        """Resume the plot when it is shown."""
+        self._update_paused()
+
+    def on_hide(self) -> None:
+        """Pause the plot when it is hidden."""
+        self._update_paused()
+
+    @property
+    def paused(self) -> bool:
+        """Is the plot paused because it isn't being displayed?"""
+        return self._paused
+
+    @property
+    def quality(self) -> int:
+        """The level of quality the plot is currently drawn at.
+
+        See `Plot.quality` for what each level means.
+        """
+        return self._plot.quality
+
+    def watch_frame_budget_ms(self, frame_budget_ms: float | None) -> None:
+        """React to the frame budget changing."""
+        self._within_budget = 0
+        if frame_budget_ms is None:
+            self._set_quality(Plot.FULL_QUALITY)
+
+    def _set_quality(self, quality: int) -> None:
+        """Set the quality the plot is drawn at.
+
+        Args:
+            quality: The new level of quality.
+        """
+        quality = min(max(quality, 0), Plot.FULL_QUALITY)
+        if quality != self._plot.quality:
+            self._plot.quality = quality
+            self.refresh()
+            self.quality_signal.publish(self._plot.quality)
+
+    def _adapt_quality(self, elapsed: float) -> None:
+        """Adapt the quality of the plot to the time taken to build a frame.
+
+        Args:
+            elapsed: The time taken to build the frame, in milliseconds.
+        """
+        budget = self.frame_budget_ms
+        if budget is None:
+            return
+        if elapsed > budget:
+            self._within_budget = 0
+            self._set_quality(self._plot.quality - 1)
+        elif elapsed < budget / 2 and self._plot.quality < Plot.FULL_QUALITY:
+            self._within_budget += 1
+            if self._within_budget >= self.RECOVERY_FRAMES:
+                self._within_budget = 0
+                self._set_quality(self._plot.quality + 1)
+        else:
+            self._within_budget = 0
+
+    def _update_paused(self) -> None:
+        """Pause or resume the plot depending on whether it is displayed."""
+        paused = not _on_screen(self)
+        if paused == self._paused:
+            return
+        self._paused = paused
+        if paused:
+            # Textual only holds timers weakly, and a paused timer isn't
+            # otherwise kept alive; so hold on to them until they resume.
+            self._paused_timers = list(self._timers)
+            for timer in self._paused_timers:
+                timer.pause()
+        else:
+            for timer in self._paused_timers:
+                timer.resume()
+            self._paused_timers = []
+            self.refresh()
+        self.paused_signal.publish(paused)
 
     @property
     def plt(self) -> Plot:
@@ -80,13 +227,212 @@ class PlotextPlot(Widget):
         """
         return self._plot
 
+    def bind_source(
+        self,
+        source: AsyncIterable[Any],
+        series: Series | Resampler | None = None,
+        *,
+        batch: int = 1000,
+        window: int = 1000,
+        policy: BackpressurePolicy = "block",
+    ) -> SourceBinding:
+        """Bind an asynchronous source of samples to a series of the plot.
+
+        Samples are taken from the source as they arrive, and applied to the
+        series in batches, at most once a frame:
+
+        ```python
+        def on_mount(self) -> None:
+            self.query_one(PlotextPlot).bind_source(self.readings(), window=500)
+        ```
+
+        Each sample is either a `y` value, in which case its `x` value is its
+        position in the source, or an `(x, y)` pair. The source is consumed
+        in a worker belonging to the widget, so the widget must be mounted.
+
+        Given a `Resampler`, the samples are folded into it instead, and the
+        views of it that the plot shows are drawn again; each sample is then
+        a `(time, value)` pair, or a value, for the time it arrived.
+
+        Args:
+            source: The source of samples.
+            series: The series, or resampler, to apply the samples to; by
+                default a new line series is plotted for them.
+            batch: The most samples to hold between frames. Once that many
+                are waiting to be applied, `policy` decides what happens to
+                the next.
+            window: The number of the latest samples to show; this doesn't
+                apply to a resampler, which keeps its own history.
+            policy: What to do with a sample when the batch is full.
+
+        Returns:
+            The binding, which gives statistics for the source and can be
+            used to stop it.
+        """
+        binding = SourceBinding(
+            self,
+            source,
+            self._plot.plot([]) if series is None else series,
+            batch,
+            window,
+            policy,
+        )
+        binding._start()  # pylint:disable=protected-access
+        return binding
+
+    def _data_published(self) -> None:
+        """Arrange for published data to be swapped in; called from any thread."""
+        if not self._swap_pending:
+            self._swap_pending = True
+            self.call_later(self._swap_buffers)
+
+    def _swap_buffers(self) -> None:
+        """Swap in any data that has been published for the plot."""
+        self._swap_pending = False
+        if self._plot._swap_buffers():  # pylint:disable=protected-access
+            self.refresh()
+
+    def memory_usage(self) -> MemoryUsage:
+        """Get the memory used by the plot.
+
+        Returns:
+            The memory used by the plot, in bytes.
+        """
+        return self._plot.memory_usage()
+
+    def refresh(
+        self,
+        *regions: Region,
+        repaint: bool = True,
+        layout: bool = False,
+        recompose: bool = False,
+    ) -> Self:
+        """Initiate a refresh of the plot.
+
+        A plot that is scrolled out of view is queued with the application's
+        build scheduler, so that it has been built by the time it is next
+        seen.
+
+        Args:
+            *regions: Additional screen regions to mark as dirty.
+            repaint: Repaint the widget (will call render() again).
+            layout: Also layout widgets in the view.
+            recompose: Re-compose the widget (will remove and re-mount children).
+
+        Returns:
+            The `PlotextPlot` instance.
+        """
+        if repaint and self.is_mounted and not self._paused:
+            if _priority(self) == OFF_SCREEN:
+                build_scheduler(self.app).defer(self)
+        return super().refresh(
+            *regions, repaint=repaint, layout=layout, recompose=recompose
+        )
+
     def render(self) -> RenderResult:
         """Render the plot.
 
+        The most recently built frame is kept in the application's frame
+        store, and reused for as long as neither the plot, its size nor its
+        theme change. If a new frame is needed but the application's build
+        scheduler puts it off, the previous frame is shown until the new one
+        has been built.
+
         Returns:
             The renderable for displaying the plot.
         """
-        self._plot.plotsize(self.size.width, self.size.height)
+        key = self._frame_key()
+        store = frame_store(self.app)
+        frame = store.get(self, key)
+        if frame is None:
+            if build_scheduler(self.app).admit(self):
+                frame = self._build_frame(key)
+            else:
+                frame = store.latest(self)
+        return "" if frame is None else frame
+
+    def _frame_key(self) -> Hashable:
+        """Bring the plot up to date with the widget and get the key of its frame.
+
+        Returns:
+            The key that the frame of the plot is built for.
+        """
+        self._plot._swap_buffers()  # pylint:disable=protected-access
+        width, height = self.size
+        state = (width, height, self._get_plotext_theme_name(self.app.theme))
+        if self._applied != (self._plot.generation, state):
+            self._apply(*state)
+            self._applied = (self._plot.generation, state)
+        return (self._plot.generation, state)
+
+    def _build_frame(self, key: Hashable) -> Text:
+        """Build the frame of the plot and put it into the frame store.
+
+        The time taken is used to adapt the quality of the plot to
+        `frame_budget_ms`; and if the application's memory profiler is
+        tracing, the memory the build allocates is measured.
+
+        Args:
+            key: The key the frame is built for.
+
+        Returns:
+            The frame.
+        """
+        # The widget reports its own builds to the profiler.
+        # pylint:disable=protected-access
+        profiler = _active_profiler(self.app)
+        if profiler is not None:
+            profiler._begin(self)
+        start = perf_counter()
+        frame = ansi_to_text(self._build())
+        frame_store(self.app).put(self, key, frame)
+        elapsed = (perf_counter() - start) * 1000
+        if profiler is not None:
+            profiler._end(self)
+        build_scheduler(self.app).spent(elapsed)
+        self._adapt_quality(elapsed)
+        return frame
+
+    def _build(self) -> str:
+        """Build the plot, or load it from the persistent cache if it's there.
+
+        Returns:
+            The output of the plot's build.
+        """
+        cache = self.persistent_cache
+        if cache is None or self._applied is None:
+            return self._plot.build()
+        key = cache.key(self._plot, *self._applied[1])
+        built = cache.get(key)
+        if built is None:
+            built = self._plot.build()
+            cache.put(key, built)
+        return built
+
+    def _build_scheduled(self) -> bool:
+        """Build the frame of the plot on behalf of the build scheduler.
+
+        Returns:
+            `True` if a frame was built, `False` if none was needed.
+        """
+        if self._paused or not self.is_mounted:
+            return False
+        key = self._frame_key()
+        if frame_store(self.app).get(self, key) is not None:
+            return False
+        self._build_frame(key)
+        self.refresh()
+        return True
+
+    def _apply(self, width: int, height: int, plotext_theme_name: str) -> None:
+        """Apply the size and theme of the widget to the plot.
+
+        Args:
+            width: The width of the plot.
+            height: The height of the plot.
+            plotext_theme_name: The name of the Plotext theme to use.
+        """
+        self._plot.plotsize(width, height)
         # This is a belt-and-braces setting of the size of the plot.
         # Internally plotsize calls _set_plot, and as best as I can figure
         # out, what I'm doing here *should* be a no-op (or rather a repeat
@@ -96,11 +442,13 @@ class PlotextPlot(Widget):
         # class.
         #
         # https://github.com/Textualize/textual-plotext/issues/5
-        self._plot._set_size(self.size.width, self.size.height)
-        # If the theme is set to "auto" ensure the theme is registered with Plotext.
-        plotext_theme_name = self._get_plotext_theme_name(self.app.theme)
-        self._plot.theme(plotext_theme_name)
-        return Text.from_ansi(self._plot.build())
+        #
+        # pylint:disable=protected-access
+        self._plot._set_size(width, height)
+        # Applying the theme counts as a change to every subplot; so only
+        # apply it if the plot doesn't already have it.
+        if self._plot._theme != plotext_theme_name:
+            self._plot.theme(plotext_theme_name)
 
     def _register_theme(self, app_theme_name: str) -> None:
         """Register the theme with Plotext if necessary.
@@ -0,0 +1,549 @@
+"""Provides opt-in profiling of the memory allocated by plots.
+
+An application that runs for a long time and slowly grows needs to know what
+is growing: the Plotext figures, the frames built from them, the themes
+registered with Plotext, or the data of the series. A `MemoryProfiler`,
+once started, uses `tracemalloc` to trace allocations, and each time a plot
+widget builds a frame it records:
+
+- the memory the build allocated and left allocated, and the most it had
+  allocated at once;
+- the estimated memory used by the plot, as `PlotextPlot.memory_usage`
+  gives it, by each of its subplots, and by its frame, and how much that
+  changed since the widget's previous build.
+
+A report of those, and of all of the memory traced, grouped by what it was
+allocated for and with how much each group has grown since the previous
+report, can be shown or dumped from the application at any time.
+
+Tracing allocations slows the application down noticeably, so the profiler
+does nothing until it is started, and is meant for soak tests and chasing
+leaks rather than for leaving on.
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+import tracemalloc
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+from weakref import WeakKeyDictionary, ref
+
+import plotext
+from plotext._dict import themes as _themes
+from rich.console import Console, Group
+from rich.table import Table
+
+from .frames import frame_size, frame_store
+from .memory import MemoryUsage, _canvas_size, _signals_size
+
+if TYPE_CHECKING:
+    from textual.app import App
+
+    from .plot import Plot
+    from .plotext_plot import PlotextPlot
+
+_PLOTEXT = os.path.dirname(os.path.abspath(plotext.__file__))
+"""The directory Plotext is installed in."""
+
+_PACKAGE = os.path.dirname(os.path.abspath(__file__))
+"""The directory this library is installed in."""
+
+_OUTPUT_MODULES = frozenset({"_ansi.py", "frames.py", "persistent.py"})
+"""The modules of this library that allocate the frames built from plots."""
+
+_SERIES_MODULES = frozenset(
+    {
+        "dataset.py",
+        "follow.py",
+        "histogram.py",
+        "mapped.py",
+        "resample.py",
+        "series.py",
+        "sources.py",
+    }
+)
+"""The modules of this library that allocate the data of series."""
+
+CATEGORIES = ("figure", "output", "themes", "series", "other")
+"""What traced memory is grouped as having been allocated for.
+
+- `"figure"`: The Plotext figures, and the canvases built from them.
+- `"output"`: The frames built from plots, as Rich `Text`.
+- `"themes"`: The themes registered with Plotext.
+- `"series"`: The data held by series, datasets and streaming sources.
+- `"other"`: Anything else: Textual, the application, and so on.
+"""
+
+
+class PlotMemoryProfile(NamedTuple):
+    """The memory profile of a plot widget, as of the latest frame it built."""
+
+    builds: int
+    """The number of frames the widget has built while profiled."""
+
+    usage: MemoryUsage
+    """The estimated memory used by the plot."""
+
+    output: int
+    """The estimated memory used by the plot's frame in the frame store."""
+
+    growth: int
+    """How much the estimated memory used by the plot and its frame changed in the latest build."""
+
+    retained: int
+    """The traced memory that the latest build left allocated."""
+
+    total_retained: int
+    """The traced memory that all of the profiled builds left allocated."""
+
+    peak: int
+    """The most traced memory the latest build had allocated at once."""
+
+    figures: tuple[tuple[tuple[int, ...], MemoryUsage], ...]
+    """The estimated memory used by each figure that is drawn into.
+
+    Each figure is given by its position: `()` for a plot without subplots,
+    otherwise the row and column of each level of subplot.
+    """
+
+
+class MemoryCategory(NamedTuple):
+    """The traced memory allocated for one category."""
+
+    name: str
+    """The name of the category; one of `CATEGORIES`."""
+
+    size: int
+    """The traced memory currently allocated, in bytes."""
+
+    blocks: int
+    """The number of blocks of memory currently allocated."""
+
+    growth: int
+    """How much the memory allocated changed since the previous report, in bytes."""
+
+
+class _Measure:
+    """The running measurements for a profiled plot widget."""
+
+    __slots__ = ("profile", "before", "estimated")
+
+    def __init__(self) -> None:
+        """Initialise the measurements."""
+        self.profile: PlotMemoryProfile | None = None
+        self.before = 0
+        self.estimated: int | None = None
+
+
+def _theme_lines() -> list[tuple[str, range]]:
+    """Find the lines of code that register themes with Plotext.
+
+    Returns:
+        The file and range of lines of each function that does.
+    """
+    from .plot import _rgbify_theme  # pylint:disable=import-outside-toplevel
+    from .plotext_plot import PlotextPlot  # pylint:disable=import-outside-toplevel
+
+    functions: list[Callable[..., Any]] = [
+        PlotextPlot._register_theme,  # pylint:disable=protected-access
+        _rgbify_theme,
+    ]
+    lines = []
+    for function in functions:
+        source, first = inspect.getsourcelines(function)
+        filename = os.path.abspath(inspect.getsourcefile(function) or "")
+        lines.append((filename, range(first, first + len(source))))
+    return lines
+
+
+def _figure_usage(
+    plot: Plot, figure: Any = None, position: tuple[int, ...] = ()
+) -> list[tuple[tuple[int, ...], MemoryUsage]]:
+    """Estimate the memory used by each figure of a plot that is drawn into.
+
+    Args:
+        plot: The plot.
+        figure: The figure to start from; the plot itself by default.
+        position: The position of the figure.
+
+    Returns:
+        The position and estimated memory usage of each figure.
+    """
+    from .plot import _subplots  # pylint:disable=import-outside-toplevel
+
+    figure = plot if figure is None else figure
+    subplots = list(_subplots(figure))
+    if not subplots:
+        # Only the series know how much memory they hold, and where.
+        # pylint:disable=protected-access
+        series = sum(
+            series._memory_usage()
+            for series in plot._series
+            if any(slot.figure is figure for slot in series._slots)
+        )
+        monitor = figure.monitor
+        return [
+            (
+                position,
+                MemoryUsage(series, _signals_size(monitor), _canvas_size(monitor)),
+            )
+        ]
+    return [
+        usage
+        for row, col, subplot in subplots
+        for usage in _figure_usage(plot, subplot, (*position, row, col))
+    ]
+
+
+def _size(size: int) -> str:
+    """Format a number of bytes for a report.
+
+    Args:
+        size: The number of bytes.
+
+    Returns:
+        The number of bytes, in the most readable unit.
+    """
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:,.0f}{unit}" if unit == "B" else f"{size:,.1f}{unit}"
+        size /= 1024  # type: ignore[assignment]
+    return f"{size:,.1f}GiB"
+
+
+def _growth(size: int) -> str:
+    """Format a change in a number of bytes for a report.
+
+    Args:
+        size: The change in the number of bytes.
+
+    Returns:
+        The change, with its sign.
+    """
+    return f"+{_size(size)}" if size > 0 else _size(size)
+
+
+class MemoryProfiler:
+    """Traces the memory allocated by the plots of an application.
+
+    The profiler for an application is got with `memory_profiler`. It does
+    nothing until it's started:
+
+    ```python
+    class Dashboard(App[None]):
+
+        BINDINGS = [("f12", "memory_report", "Memory report")]
+
+        def on_mount(self) -> None:
+            memory_profiler(self).start()
+
+        def action_memory_report(self) -> None:
+            memory_profiler(self).dump("memory.log")
+    ```
+
+    Allocations are traced for the whole process, so what each build of a
+    plot is measured to allocate includes anything allocated by other
+    threads at the same time.
+    """
+
+    DEFAULT_FRAMES = 32
+    """The default number of frames of each traceback to trace."""
+
+    def __init__(self, app: App[Any]) -> None:
+        """Initialise the memory profiler.
+
+        Args:
+            app: The application the profiler is for.
+        """
+        self._app = ref(app)
+        self._enabled = False
+        self._started_tracing = False
+        self._measures: WeakKeyDictionary[PlotextPlot, _Measure] = WeakKeyDictionary()
+        self._theme_lines: list[tuple[str, range]] = []
+        self._categories: dict[str, int] = {}
+        self._themes = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Is the profiler tracing allocations?"""
+        return self._enabled
+
+    def start(self, frames: int = DEFAULT_FRAMES) -> None:
+        """Start tracing allocations.
+
+        If `tracemalloc` is already tracing, it is left as it is (and so
+        traces as many frames as it was started with); otherwise it is
+        started, and is stopped again when the profiler is.
+
+        Args:
+            frames: The number of frames of each traceback to trace. The
+                allocations of a plot can only be told apart from the rest
+                if the traceback reaches back to the plot.
+        """
+        if self._enabled:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            self._started_tracing = True
+        self._theme_lines = _theme_lines()
+        self._enabled = True
+        self._measures.clear()
+        self._categories = {
+            category.name: category.size for category in self._measure_categories()
+        }
+        self._themes = len(_themes)
+
+    def stop(self) -> None:
+        """Stop tracing allocations.
+
+        The profiles recorded so far are kept until the profiler is started
+        again.
+        """
+        if not self._enabled:
+            return
+        self._enabled = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def profile(self, plot: PlotextPlot) -> PlotMemoryProfile | None:
+        """Get the memory profile of a plot widget.
+
+        Args:
+            plot: The plot widget.
+
+        Returns:
+            The profile as of the latest frame the widget built, or `None`
+            if it hasn't built one while profiled.
+        """
+        measure = self._measures.get(plot)
+        return None if measure is None else measure.profile
+
+    @property
+    def profiles(self) -> list[tuple[PlotextPlot, PlotMemoryProfile]]:
+        """The memory profiles of the plot widgets, largest retained first."""
+        profiles = [
+            (plot, measure.profile)
+            for plot, measure in self._measures.items()
+            if measure.profile is not None
+        ]
+        return sorted(
+            profiles, key=lambda profile: profile[1].total_retained, reverse=True
+        )
+
+    def categories(self) -> list[MemoryCategory]:
+        """Group the memory being traced by what it was allocated for.
+
+        Taking a snapshot of everything being traced takes a while, so this
+        is best done on demand rather than every frame.
+
+        Returns:
+            The traced memory in each of `CATEGORIES`, and how much it grew
+            since the previous call (or since the profiler was started).
+        """
+        if not self._enabled:
+            return []
+        categories = self._measure_categories()
+        previous, self._categories = self._categories, {
+            category.name: category.size for category in categories
+        }
+        return [
+            category._replace(growth=category.size - previous.get(category.name, 0))
+            for category in categories
+        ]
+
+    def report(self) -> Group:
+        """Build a report of the memory used and allocated by the plots.
+
+        This counts as a call to `categories`.
+
+        Returns:
+            A renderable report, of a table of the plot widgets and a table
+            of the categories of traced memory.
+        """
+        plots = Table(title="Plot memory", title_justify="left")
+        for heading in (
+            "Plot",
+            "Builds",
+            "Series",
+            "Figure",
+            "Canvas",
+            "Frame",
+            "Growth",
+            "Retained",
+            "Total retained",
+            "Peak",
+        ):
+            plots.add_column(heading, justify="left" if heading == "Plot" else "right")
+        for plot, profile in self.profiles:
+            plots.add_row(
+                f"{plot.__class__.__name__}#{plot.id}" if plot.id else repr(plot),
+                f"{profile.builds:,}",
+                _size(profile.usage.series),
+                _size(profile.usage.figure),
+                _size(profile.usage.canvas),
+                _size(profile.output),
+                _growth(profile.growth),
+                _growth(profile.retained),
+                _growth(profile.total_retained),
+                _size(profile.peak),
+            )
+        categories = Table(title="Traced memory", title_justify="left")
+        for heading in ("Category", "Size", "Blocks", "Growth"):
+            categories.add_column(
+                heading, justify="left" if heading == "Category" else "right"
+            )
+        for category in self.categories():
+            categories.add_row(
+                category.name,
+                _size(category.size),
+                f"{category.blocks:,}",
+                _growth(category.growth),
+            )
+        themes = len(_themes)
+        categories.caption = (
+            f"{themes} Plotext themes ({themes - self._themes:+d} since started)"
+        )
+        return Group(plots, categories)
+
+    def dump(self, path: str | os.PathLike[str] | None = None) -> None:
+        """Dump a report of the memory used and allocated by the plots.
+
+        The report is written to the application's log, and, optionally,
+        appended to a file as plain text.
+
+        Args:
+            path: The path of a file to append the report to, if any.
+        """
+        report = self.report()
+        app = self._app()
+        if app is not None:
+            app.log(report)
+        if path is not None:
+            with open(path, "a", encoding="utf-8") as file:
+                Console(file=file, width=120, color_system=None).print(report)
+
+    def _begin(self, plot: PlotextPlot) -> None:
+        """Start measuring a build of a plot widget's frame.
+
+        Args:
+            plot: The plot widget.
+        """
+        measure = self._measures.get(plot)
+        if measure is None:
+            measure = self._measures[plot] = _Measure()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        measure.before = tracemalloc.get_traced_memory()[0]
+
+    def _end(self, plot: PlotextPlot) -> None:
+        """Finish measuring a build of a plot widget's frame.
+
+        Args:
+            plot: The plot widget.
+        """
+        measure = self._measures.get(plot)
+        if measure is None:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        retained = current - measure.before
+        usage = plot.memory_usage()
+        frame = frame_store(plot.app).latest(plot)
+        output = 0 if frame is None else frame_size(frame)
+        estimated = usage.total + output
+        growth = 0 if measure.estimated is None else estimated - measure.estimated
+        measure.estimated = estimated
+        previous = measure.profile
+        measure.profile = PlotMemoryProfile(
+            1 if previous is None else previous.builds + 1,
+            usage,
+            output,
+            growth,
+            retained,
+            retained + (0 if previous is None else previous.total_retained),
+            max(peak - measure.before, retained),
+            tuple(_figure_usage(plot.plt)),
+        )
+
+    def _category(self, traceback: tracemalloc.Traceback) -> str:
+        """Find what some memory was allocated for, from where it was allocated.
+
+        The most recent frame of the traceback that is in either Plotext or
+        this library decides.
+
+        Args:
+            traceback: The traceback of the allocation.
+
+        Returns:
+            The category, one of `CATEGORIES`.
+        """
+        for frame in reversed(traceback):
+            filename = frame.filename
+            for theme_file, lines in self._theme_lines:
+                if filename == theme_file and frame.lineno in lines:
+                    return "themes"
+            directory, module = os.path.split(filename)
+            if directory == _PLOTEXT:
+                return "figure"
+            if directory == _PACKAGE:
+                if module in _OUTPUT_MODULES:
+                    return "output"
+                if module in _SERIES_MODULES:
+                    return "series"
+                return "figure"
+        return "other"
+
+    def _measure_categories(self) -> list[MemoryCategory]:
+        """Group the memory being traced by what it was allocated for.
+
+        Returns:
+            The traced memory in each of `CATEGORIES`, with no growth.
+        """
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        sizes = dict.fromkeys(CATEGORIES, 0)
+        blocks = dict.fromkeys(CATEGORIES, 0)
+        for statistic in snapshot.statistics("traceback"):
+            category = self._category(statistic.traceback)
+            sizes[category] += statistic.size
+            blocks[category] += statistic.count
+        return [
+            MemoryCategory(name, sizes[name], blocks[name], 0) for name in CATEGORIES
+        ]
+
+
+_profilers: WeakKeyDictionary[Any, MemoryProfiler] = WeakKeyDictionary()
+"""The memory profilers for each application."""
+
+
+def memory_profiler(app: App[Any]) -> MemoryProfiler:
+    """Get the memory profiler for an application.
+
+    The profiler is created, stopped, the first time it is asked for.
+
+    Args:
+        app: The application to get the memory profiler for.
+
+    Returns:
+        The memory profiler.
+    """
+    try:
+        return _profilers[app]
+    except KeyError:
+        profiler = _profilers[app] = MemoryProfiler(app)
+        return profiler
+
+
+def _active_profiler(app: App[Any]) -> MemoryProfiler | None:
+    """Get the memory profiler for an application, if it is tracing.
+
+    Args:
+        app: The application.
+
+    Returns:
+        The memory profiler, or `None` if there isn't one that is tracing.
+    """
+    profiler = _profilers.get(app)
+    return profiler if profiler is not None and profiler.enabled else None
@@ -0,0 +1,551 @@
+"""Provides for resampling high-rate time series into buckets of time.
+
+A source that produces many samples a second can't usefully be plotted
+sample by sample: there are far more samples than columns to draw them in,
+and keeping them all takes ever more memory. A `Resampler` folds each
+sample, as it arrives, into a bucket of time, which keeps only a few
+aggregates of the samples in it (their count, sum, smallest and largest
+values, and a coarse histogram from which percentiles are estimated); so
+the memory used for each bucket is fixed, however many samples fall in it,
+and only so many buckets are kept.
+
+A series plotted from a resampler draws one of its aggregates. Each time
+the series is built, the width of the buckets it draws is picked from the
+span of time the plot shows and the width of the plot, so that there are
+about as many buckets as there are columns; the buckets of that width are
+made by merging those the resampler keeps. So zooming out merges stored
+aggregates, rather than going back to the samples, which are long gone.
+"""
+
+from __future__ import annotations
+
+from math import floor, inf, isfinite
+from typing import TYPE_CHECKING, Any, Iterable, Sequence
+from weakref import WeakSet
+
+from typing_extensions import Literal, TypeAlias
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .series import Series
+
+Aggregate: TypeAlias = Literal["mean", "min", "max", "p95"]
+"""The aggregates of the samples in each bucket that can be drawn.
+
+- `"mean"`: The mean of the samples.
+- `"min"`: The smallest of the samples.
+- `"max"`: The largest of the samples.
+- `"p95"`: The 95th percentile of the samples, estimated from a histogram.
+"""
+
+_AGGREGATES: tuple[Aggregate, ...] = ("mean", "min", "max", "p95")
+"""All of the aggregates."""
+
+_STEPS = (1, 2, 5)
+"""The multiples of each power of ten of the resolution that buckets are drawn at."""
+
+
+class ResamplerView:
+    """One aggregate of a resampler, to draw as a series.
+
+    Views are created with `Resampler.view`, and are plotted by passing
+    them to `Plot.plot` or `Plot.scatter`.
+    """
+
+    def __init__(self, resampler: Resampler, aggregate: Aggregate) -> None:
+        """Initialise the view.
+
+        Args:
+            resampler: The resampler.
+            aggregate: The aggregate to draw.
+        """
+        self._resampler = resampler
+        self._aggregate = aggregate
+        self._width = resampler.resolution
+        self._series: WeakSet[Series] = WeakSet()
+
+    @property
+    def resampler(self) -> Resampler:
+        """The resampler the view is of."""
+        return self._resampler
+
+    @property
+    def aggregate(self) -> Aggregate:
+        """The aggregate the view draws."""
+        return self._aggregate
+
+    @property
+    def width(self) -> float:
+        """The width, in units of time, of the buckets last drawn."""
+        return self._width
+
+    def __len__(self) -> int:
+        """The number of buckets the resampler keeps that hold samples."""
+        return self._resampler._occupied()  # pylint:disable=protected-access
+
+    def _attach(self, series: Series) -> None:
+        """Attach a series to the view, to be drawn again as samples arrive.
+
+        Args:
+            series: The series.
+        """
+        self._series.add(series)
+
+    def _redraw(self) -> None:
+        """Have the series that read from the view read from it again."""
+        for series in self._series:
+            series._reread(self)  # pylint:disable=protected-access
+
+    def read(
+        self, low: float | None, high: float | None, columns: int
+    ) -> tuple[Any, Any]:
+        """Read the buckets within a span of time.
+
+        Args:
+            low: The start of the span, if it has one.
+            high: The end of the span, if it has one.
+            columns: The number of columns of the plot the buckets are for.
+
+        Returns:
+            The middle of each bucket, and its aggregate, as NumPy arrays of
+            floats; buckets without samples are gaps.
+        """
+        # pylint:disable-next=protected-access
+        self._width, x, y = self._resampler._read(self._aggregate, low, high, columns)
+        return x, y
+
+
+class Resampler:
+    """Timestamped samples, folded into buckets of time as they arrive.
+
+    ```python
+    load = Resampler(resolution=0.1)
+    plot.plt.plot(load.view("mean"), label="mean")
+    plot.plt.plot(load.view("p95"), label="p95")
+    ...
+    load.add(times, values)
+    plot.refresh()
+    ```
+
+    Samples are folded into buckets `resolution` units of time wide, of
+    which the latest `history` are kept; samples that arrive for buckets
+    older than that are dropped. A resampler can also be given to
+    `PlotextPlot.bind_source`, which adds samples to it as they arrive.
+
+    Every view of the resampler that is plotted is drawn again when
+    samples are added; the plots that show them still need refreshing.
+    """
+
+    DEFAULT_HISTORY = 4096
+    """The default number of buckets to keep."""
+
+    DEFAULT_BINS = 64
+    """The default number of histogram bins to estimate percentiles from."""
+
+    def __init__(
+        self,
+        resolution: float = 1.0,
+        *,
+        history: int = DEFAULT_HISTORY,
+        percentiles: bool = True,
+        bins: int = DEFAULT_BINS,
+        per_column: float = 1.0,
+    ) -> None:
+        """Initialise the resampler.
+
+        Args:
+            resolution: The width, in units of time, of the narrowest
+                buckets. Wider buckets are drawn at 1, 2 or 5 times a power
+                of ten of this.
+            history: The number of the narrowest buckets to keep.
+            percentiles: Keep a histogram in each bucket, from which
+                percentiles are estimated. Without it, the memory for each
+                bucket is much smaller, but `"p95"` can't be drawn.
+            bins: The number of bins in each histogram; this must be even.
+            per_column: The number of buckets to draw for each column of
+                the plot.
+
+        Raises:
+            ImportError: If NumPy isn't installed.
+            ValueError: If the resolution, history, bins or buckets per
+                column make no sense.
+        """
+        if numpy is None:
+            raise ImportError("Resampling needs NumPy")
+        if not resolution > 0:
+            raise ValueError("The resolution must be positive")
+        if history < 1:
+            raise ValueError("The history must hold at least one bucket")
+        if percentiles and (bins < 2 or bins % 2):
+            raise ValueError("The histograms need an even number of bins")
+        if not per_column > 0:
+            raise ValueError("There must be some buckets for each column")
+        self._resolution = resolution
+        self._history = history
+        self._per_column = per_column
+        self._count = numpy.zeros(history, dtype=numpy.int64)
+        self._sum = numpy.zeros(history, dtype=numpy.float64)
+        self._min = numpy.full(history, inf)
+        self._max = numpy.full(history, -inf)
+        self._bins = (
+            numpy.zeros((history, bins), dtype=numpy.int64) if percentiles else None
+        )
+        # The limits of the histogram of each bucket, which are taken from
+        # the first samples in it and expanded as samples arrive outside of
+        # them; a bin width of zero means the bucket has no limits yet.
+        self._low = numpy.zeros(history, dtype=numpy.float64)
+        self._bin_width = numpy.zeros(history, dtype=numpy.float64)
+        # The index (since time zero) of the latest bucket kept.
+        self._latest: int | None = None
+        self._seen = 0
+        self._dropped = 0
+        self._views: dict[Aggregate, ResamplerView] = {}
+
+    @property
+    def resolution(self) -> float:
+        """The width, in units of time, of the narrowest buckets."""
+        return self._resolution
+
+    @property
+    def seen(self) -> int:
+        """The number of samples folded into the buckets, ever."""
+        return self._seen
+
+    @property
+    def dropped(self) -> int:
+        """The number of samples dropped, for being too old to keep or not finite."""
+        return self._dropped
+
+    def view(self, aggregate: Aggregate = "mean") -> ResamplerView:
+        """Get a view of one aggregate of the resampler, to plot.
+
+        Args:
+            aggregate: The aggregate.
+
+        Returns:
+            The view.
+
+        Raises:
+            ValueError: If the aggregate isn't known, or is a percentile and
+                the resampler doesn't keep them.
+        """
+        if aggregate not in _AGGREGATES:
+            raise ValueError(f"Unknown aggregate {aggregate!r}")
+        if aggregate == "p95" and self._bins is None:
+            raise ValueError("The resampler doesn't keep percentiles")
+        if aggregate not in self._views:
+            self._views[aggregate] = ResamplerView(self, aggregate)
+        return self._views[aggregate]
+
+    def add(self, times: Iterable[float], values: Iterable[float]) -> None:
+        """Fold a batch of samples into their buckets.
+
+        Args:
+            times: The time of each sample.
+            values: The value of each sample.
+
+        Raises:
+            ValueError: If there isn't a time for each value.
+        """
+        time = numpy.asarray(
+            times if isinstance(times, Sequence) else list(times),
+            dtype=numpy.float64,
+        ).ravel()
+        value = numpy.asarray(
+            values if isinstance(values, Sequence) else list(values),
+            dtype=numpy.float64,
+        ).ravel()
+        if len(time) != len(value):
+            raise ValueError("There must be a time for each value")
+        finite = numpy.isfinite(time) & numpy.isfinite(value)
+        self._dropped += int(len(value) - finite.sum())
+        time, value = time[finite], value[finite]
+        if not len(value):
+            return
+        index = numpy.floor(time / self._resolution).astype(numpy.int64)
+        self._advance(int(index.max()))
+        assert self._latest is not None
+        kept = index > self._latest - self._history
+        self._dropped += int(len(index) - kept.sum())
+        index, value = index[kept], value[kept]
+        if not len(value):
+            return
+        self._seen += len(value)
+        slot = index % self._history
+        numpy.add.at(self._count, slot, 1)
+        numpy.add.at(self._sum, slot, value)
+        numpy.minimum.at(self._min, slot, value)
+        numpy.maximum.at(self._max, slot, value)
+        if self._bins is not None:
+            self._expand(slot, value)
+            bins = self._bins.shape[1]
+            position = numpy.minimum(
+                numpy.floor((value - self._low[slot]) / self._bin_width[slot]).astype(
+                    numpy.int64
+                ),
+                bins - 1,
+            )
+            numpy.add.at(self._bins, (slot, position), 1)
+        for view in self._views.values():
+            view._redraw()  # pylint:disable=protected-access
+
+    def reset(self) -> None:
+        """Forget all of the buckets."""
+        self._count[:] = 0
+        self._sum[:] = 0
+        self._min[:] = inf
+        self._max[:] = -inf
+        if self._bins is not None:
+            self._bins[:] = 0
+        self._low[:] = self._bin_width[:] = 0
+        self._latest = None
+        self._seen = self._dropped = 0
+        for view in self._views.values():
+            view._redraw()  # pylint:disable=protected-access
+
+    def _advance(self, latest: int) -> None:
+        """Move the latest bucket on, emptying those that fall out of the history.
+
+        Args:
+            latest: The index of the bucket that is to be the latest.
+        """
+        if self._latest is not None and latest <= self._latest:
+            return
+        if self._latest is None or latest - self._latest >= self._history:
+            cleared: Any = slice(None)
+        else:
+            cleared = numpy.arange(self._latest + 1, latest + 1) % self._history
+        self._count[cleared] = 0
+        self._sum[cleared] = 0
+        self._min[cleared] = inf
+        self._max[cleared] = -inf
+        if self._bins is not None:
+            self._bins[cleared] = 0
+        self._low[cleared] = self._bin_width[cleared] = 0
+        self._latest = latest
+
+    def _expand(self, slot: Any, value: Any) -> None:
+        """Expand the limits of the histograms until they take in some samples.
+
+        As with `StreamingHistogram`, the limits of each bucket's histogram
+        are taken from the first samples in it, and are doubled in width, by
+        merging neighbouring bins, until they take in any that arrive
+        outside of them. As each bucket has limits of its own, a sample far
+        from the rest only coarsens the histogram of the bucket it is in,
+        and only until that bucket falls out of the history.
+
+        Args:
+            slot: The slot of the bucket of each sample.
+            value: The value of each sample.
+        """
+        assert self._bins is not None
+        bins = self._bins.shape[1]
+        lowest = numpy.full(self._history, inf)
+        highest = numpy.full(self._history, -inf)
+        numpy.minimum.at(lowest, slot, value)
+        numpy.maximum.at(highest, slot, value)
+        touched = numpy.unique(slot)
+        new = touched[self._bin_width[touched] == 0]
+        span = highest[new] - lowest[new]
+        self._low[new] = lowest[new]
+        self._bin_width[new] = (
+            numpy.where(span > 0, span, numpy.abs(lowest[new])) / bins
+        )
+        self._bin_width[new[self._bin_width[new] == 0]] = 1.0 / bins
+        half = bins // 2
+        while True:
+            low, width = self._low[touched], self._bin_width[touched]
+            outside = (lowest[touched] < low) | (highest[touched] >= low + width * bins)
+            if not outside.any():
+                return
+            rows = touched[outside]
+            downwards = lowest[rows] < self._low[rows]
+            merged = self._bins[rows, 0::2] + self._bins[rows, 1::2]
+            self._bins[rows] = 0
+            self._bins[rows[~downwards], :half] = merged[~downwards]
+            self._bins[rows[downwards], half:] = merged[downwards]
+            self._low[rows[downwards]] -= self._bin_width[rows[downwards]] * bins
+            self._bin_width[rows] *= 2
+
+    def _occupied(self) -> int:
+        """Get the number of buckets kept that hold samples.
+
+        Returns:
+            The number of buckets.
+        """
+        return int(numpy.count_nonzero(self._count))
+
+    def _span(self, low: float | None, high: float | None) -> tuple[int, int] | None:
+        """Get the span of the narrowest buckets to draw.
+
+        Args:
+            low: The start of the span of time, if it has one.
+            high: The end of the span of time, if it has one.
+
+        Returns:
+            The indexes of the first and last buckets, or `None` if there
+            are none.
+        """
+        if self._latest is None:
+            return None
+        first, last = self._bucket(low), self._bucket(high)
+        if first is None or last is None:
+            # Any end without a limit is that of the buckets with samples.
+            occupied = numpy.flatnonzero(self._count)
+            if not len(occupied):
+                return None
+            oldest = self._latest - self._history + 1
+            order = (occupied - (oldest % self._history)) % self._history
+            if first is None:
+                first = oldest + int(order.min())
+            if last is None:
+                last = oldest + int(order.max())
+        return (first, last) if first <= last else None
+
+    def _bucket(self, limit: float | None) -> int | None:
+        """Get the index of the narrowest bucket a limit of a span of time is in.
+
+        Args:
+            limit: The limit, if it has one.
+
+        Returns:
+            The index of the bucket, or `None` if the limit isn't given or
+            isn't finite.
+        """
+        if limit is None or not isfinite(limit):
+            return None
+        return floor(limit / self._resolution)
+
+    def _multiple(self, buckets: int, columns: int) -> int:
+        """Pick how many of the narrowest buckets to merge into each drawn.
+
+        Args:
+            buckets: The number of the narrowest buckets in the span.
+            columns: The number of columns of the plot.
+
+        Returns:
+            The number of buckets to merge: 1, 2 or 5 times a power of ten.
+        """
+        wanted = max(columns * self._per_column, 1)
+        scale = 1
+        while True:
+            for step in _STEPS:
+                if buckets <= wanted * step * scale:
+                    return step * scale
+            scale *= 10
+
+    def _read(
+        self,
+        aggregate: Aggregate,
+        low: float | None,
+        high: float | None,
+        columns: int,
+    ) -> tuple[float, Any, Any]:
+        """Read an aggregate for the buckets within a span of time.
+
+        Args:
+            aggregate: The aggregate.
+            low: The start of the span, if it has one.
+            high: The end of the span, if it has one.
+            columns: The number of columns of the plot.
+
+        Returns:
+            The width of the buckets, and the middle and aggregate of each.
+        """
+        empty = numpy.zeros(0, dtype=numpy.float64)
+        span = self._span(low, high)
+        if span is None:
+            return self._resolution, empty, empty
+        first, last = span
+        multiple = self._multiple(last - first + 1, columns)
+        width = self._resolution * multiple
+        # Buckets are aligned to multiples of their width since time zero,
+        # so that they don't shift about as the span does.
+        first, last = first // multiple * multiple, (last // multiple + 1) * multiple
+        assert self._latest is not None
+        kept_first = max(first, self._latest - self._history + 1)
+        kept_last = min(last, self._latest + 1)
+        if kept_first >= kept_last:
+            return width, empty, empty
+        start = (numpy.arange(first, last, multiple) + multiple / 2) * self._resolution
+        # The narrowest buckets kept, in order, in groups of `multiple`.
+        slot = numpy.arange(kept_first, kept_last) % self._history
+        groups = (numpy.arange(kept_first, kept_last) - first) // multiple
+        bounds = numpy.flatnonzero(numpy.diff(groups, prepend=-1))
+        drawn = groups[bounds]
+        count = numpy.add.reduceat(self._count[slot], bounds)
+        y = numpy.full(len(start), numpy.nan)
+        with numpy.errstate(all="ignore"):
+            if aggregate == "mean":
+                values = numpy.add.reduceat(self._sum[slot], bounds) / count
+            elif aggregate == "min":
+                values = numpy.minimum.reduceat(self._min[slot], bounds)
+            elif aggregate == "max":
+                values = numpy.maximum.reduceat(self._max[slot], bounds)
+            else:
+                values = self._percentile(slot, bounds, count, 0.95)
+        values[count == 0] = numpy.nan
+        y[drawn] = values
+        return width, start, y
+
+    def _percentile(self, slot: Any, bounds: Any, count: Any, fraction: float) -> Any:
+        """Estimate a percentile of the samples in groups of buckets.
+
+        As each bucket's histogram has limits of its own, the histograms of
+        a group can't just be summed. Instead, the share of the samples of
+        the group below each of a number of points, spread evenly between
+        its smallest and largest samples, is found by interpolating within
+        the bins of each histogram; and the percentile is found by
+        interpolating between the points either side of it.
+
+        Args:
+            slot: The slots of the buckets, in order.
+            bounds: The position in `slot` of the first bucket of each group.
+            count: The number of samples in each group.
+            fraction: The percentile, as a fraction.
+
+        Returns:
+            The estimated percentile of each group.
+        """
+        assert self._bins is not None
+        bins = self._bins.shape[1]
+        lowest = numpy.minimum.reduceat(self._min[slot], bounds)
+        highest = numpy.maximum.reduceat(self._max[slot], bounds)
+        groups = numpy.repeat(
+            numpy.arange(len(bounds)), numpy.diff(bounds, append=len(slot))
+        )
+        # The points to find the share of samples below, for each group.
+        steps = numpy.linspace(0, 1, bins + 1)
+        points = lowest[:, None] + (highest - lowest)[:, None] * steps
+        # The number of samples of each bucket below the points of its group.
+        histogram = self._bins[slot]
+        cumulative = numpy.concatenate(
+            (
+                numpy.zeros((len(slot), 1), dtype=numpy.int64),
+                numpy.cumsum(histogram, axis=1),
+            ),
+            axis=1,
+        )
+        width = numpy.where(self._bin_width[slot] > 0, self._bin_width[slot], 1.0)
+        position = numpy.clip(
+            (points[groups] - self._low[slot][:, None]) / width[:, None], 0, bins
+        )
+        whole = numpy.minimum(numpy.floor(position).astype(numpy.int64), bins - 1)
+        rows = numpy.arange(len(slot))[:, None]
+        below = cumulative[rows, whole] + (position - whole) * histogram[rows, whole]
+        below = numpy.add.reduceat(below, bounds, axis=0)
+        # The last point the share below which is short of the percentile.
+        rank = fraction * count
+        after = numpy.minimum((below < rank[:, None]).sum(axis=1), bins)
+        before = numpy.maximum(after - 1, 0)
+        groups = numpy.arange(len(bounds))
+        start, end = below[groups, before], below[groups, after]
+        share = numpy.clip((rank - start) / numpy.maximum(end - start, 1e-12), 0, 1)
+        estimate = points[groups, before] + share * (
+            points[groups, after] - points[groups, before]
+        )
+        return numpy.clip(estimate, lowest, highest)
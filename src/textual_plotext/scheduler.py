@@ -0,0 +1,227 @@
+"""Provides an application-wide scheduler for the building of plot frames.
+
+When many plots change at once (the theme is switched, the terminal is
+resized, or a tick of data touches every plot) each of them would otherwise
+build its frame in its own `render`, in the order the plots happen to be
+painted, and nothing would be seen to change until all of them had been
+built. Instead, each frame of the application has a time slice for building
+plots in. A plot that needs building once the slice has been used up shows
+the frame it last built, and is queued; the queue is worked through over
+the following frames in order of priority: the focused plot first, then
+plots that can be seen, then plots that are scrolled out of view.
+"""
+
+from __future__ import annotations
+
+from itertools import count
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple
+from weakref import WeakKeyDictionary, ref
+
+from textual import constants
+
+from .frames import _on_screen
+
+if TYPE_CHECKING:
+    from textual.app import App
+    from textual.timer import Timer
+
+    from .plotext_plot import PlotextPlot
+
+FOCUSED = 0
+"""The priority of a plot that has focus."""
+
+VISIBLE = 1
+"""The priority of a plot that can be seen."""
+
+OFF_SCREEN = 2
+"""The priority of a plot that can't be seen."""
+
+
+def _priority(widget: PlotextPlot) -> int:
+    """Get the priority with which a plot should be built.
+
+    Args:
+        widget: The plot widget.
+
+    Returns:
+        The priority; lower values are built first.
+    """
+    if widget.has_focus:
+        return FOCUSED
+    if not _on_screen(widget):
+        return OFF_SCREEN
+    try:
+        return (
+            VISIBLE if widget.screen.find_widget(widget).visible_region else OFF_SCREEN
+        )
+    except Exception:  # pylint:disable=broad-except
+        return OFF_SCREEN
+
+
+class BuildSchedulerStats(NamedTuple):
+    """Statistics for a build scheduler."""
+
+    immediate: int
+    """The number of frames built as soon as they were needed."""
+
+    deferred: int
+    """The number of frames put off to a later frame of the application."""
+
+    scheduled: int
+    """The number of deferred frames that have since been built."""
+
+    pending: int
+    """The number of plots currently waiting to be built."""
+
+
+class BuildScheduler:
+    """An application-wide scheduler for the building of plot frames.
+
+    A focused plot is always built as soon as it is needed. Any other plot
+    is built as soon as it is needed if there is time left in the current
+    frame's slice; otherwise it is deferred to a later frame.
+    """
+
+    DEFAULT_TIME_SLICE_MS = 10.0
+    """The default time, in milliseconds, for building plots in each frame."""
+
+    def __init__(self, time_slice_ms: float = DEFAULT_TIME_SLICE_MS) -> None:
+        """Initialise the build scheduler.
+
+        Args:
+            time_slice_ms: The time, in milliseconds, for building plots in
+                each frame.
+        """
+        self.time_slice_ms = time_slice_ms
+        """The time, in milliseconds, for building plots in each frame."""
+        self._pending: dict[int, tuple[int, ref[PlotextPlot]]] = {}
+        self._order = count()
+        self._frame_start = 0.0
+        self._spent = 0.0
+        self._timer: Timer | None = None
+        self._immediate = 0
+        self._deferred = 0
+        self._scheduled = 0
+
+    @property
+    def stats(self) -> BuildSchedulerStats:
+        """The statistics for the scheduler."""
+        return BuildSchedulerStats(
+            self._immediate, self._deferred, self._scheduled, len(self._pending)
+        )
+
+    def _slice(self) -> float:
+        """Get the time spent building in the current frame.
+
+        Returns:
+            The time spent, in milliseconds.
+        """
+        now = perf_counter()
+        if now - self._frame_start >= 1 / constants.MAX_FPS:
+            self._frame_start = now
+            self._spent = 0.0
+        return self._spent
+
+    def admit(self, widget: PlotextPlot) -> bool:
+        """Decide whether a plot that needs building should be built now.
+
+        A plot that isn't admitted is queued to be built in a later frame.
+
+        Args:
+            widget: The plot widget that needs building.
+
+        Returns:
+            `True` if the plot should be built now, `False` if not.
+        """
+        if _priority(widget) == FOCUSED:
+            self._pending.pop(id(widget), None)
+            self._immediate += 1
+            return True
+        # Plots are rendered in the order they're painted, so the focused
+        # plot may not have been rendered yet; it's built first regardless.
+        # pylint:disable-next=import-outside-toplevel
+        from .plotext_plot import PlotextPlot
+
+        focused = widget.screen.focused
+        # pylint:disable-next=protected-access
+        if isinstance(focused, PlotextPlot) and focused._build_scheduled():
+            self._pending.pop(id(focused), None)
+            self._immediate += 1
+        if self._slice() < self.time_slice_ms:
+            self._pending.pop(id(widget), None)
+            self._immediate += 1
+            return True
+        self.defer(widget)
+        return False
+
+    def defer(self, widget: PlotextPlot) -> None:
+        """Queue a plot to be built in a later frame.
+
+        Args:
+            widget: The plot widget to build.
+        """
+        if id(widget) not in self._pending:
+            self._pending[id(widget)] = (next(self._order), ref(widget))
+            self._deferred += 1
+        if self._timer is None:
+            self._timer = widget.app.set_timer(
+                1 / constants.MAX_FPS, self._build_pending, name="plotext-builds"
+            )
+
+    def spent(self, elapsed: float) -> None:
+        """Record time spent building a plot.
+
+        Args:
+            elapsed: The time spent, in milliseconds.
+        """
+        self._slice()
+        self._spent += elapsed
+
+    def _build_pending(self) -> None:
+        """Build queued plots, in order of priority, for one frame's slice."""
+        self._timer = None
+        queued = [
+            (_priority(widget), order, widget)
+            for order, owner in self._pending.values()
+            if (widget := owner()) is not None and widget.is_mounted
+        ]
+        self._pending.clear()
+        queued.sort(key=lambda entry: entry[:2])
+        self._frame_start = perf_counter()
+        self._spent = 0.0
+        built = False
+        for _, order, widget in queued:
+            # Always build at least one plot, so that the queue keeps moving.
+            if built and self._spent >= self.time_slice_ms:
+                self._pending[id(widget)] = (order, ref(widget))
+            elif widget._build_scheduled():  # pylint:disable=protected-access
+                built = True
+                self._scheduled += 1
+        if self._pending and self._timer is None and queued:
+            self._timer = queued[0][2].app.set_timer(
+                1 / constants.MAX_FPS, self._build_pending, name="plotext-builds"
+            )
+
+
+_schedulers: WeakKeyDictionary[Any, BuildScheduler] = WeakKeyDictionary()
+"""The build schedulers for each application."""
+
+
+def build_scheduler(app: App[Any]) -> BuildScheduler:
+    """Get the build scheduler for an application.
+
+    The scheduler is created, with the default time slice, the first time it
+    is asked for.
+
+    Args:
+        app: The application to get the build scheduler for.
+
+    Returns:
+        The build scheduler.
+    """
+    try:
+        return _schedulers[app]
+    except KeyError:
+        scheduler = _schedulers[app] = BuildScheduler()
+        return scheduler
@@ -0,0 +1,961 @@
+"""Provides handles for updating plotted series in place.
+
+Plotext itself has no notion of updating a series once it has been plotted;
+the only option is to clear all of the data and plot everything again. The
+handles in this module keep track of where a series lives inside the
+Plotext figure so that it can be updated, restyled or removed on its own,
+leaving every other series in the figure untouched.
+
+The data of line and scatter series is also held by the handle, in compact
+arrays of floats, rather than in Plotext's lists of Python objects. It is
+only handed over to Plotext, as lists, for the duration of a build.
+"""
+
+# A series handle is part of its plot, and keeps the plot's bookkeeping of
+# series, slots and generations up to date alongside its own. So pylint is
+# asked not to flag protected access in this file.
+#
+# pylint:disable=protected-access
+
+from __future__ import annotations
+
+from array import array
+from functools import partial, wraps
+from sys import getsizeof
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Container,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+
+from typing_extensions import Literal, TypeAlias
+
+from plotext._utility import set_data as _set_data
+from plotext._utility import set_multiple_bar_data as _set_multiple_bar_data
+
+from ._categories import Categories, CategoryOrder, buckets, top, window
+from .mapped import MappedData
+from .resample import ResamplerView
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from ._raster import Signal
+    from .dataset import Dataset
+    from .plot import Plot
+
+SeriesKind: TypeAlias = Literal["plot", "scatter", "bar", "multiple_bar", "stacked_bar"]
+"""The kinds of series that a handle can be created for."""
+
+_BAR_KINDS: frozenset[SeriesKind] = frozenset({"bar", "multiple_bar", "stacked_bar"})
+"""The kinds of series that are drawn as bars, by Plotext itself."""
+
+_GROUPED_BAR_KINDS: frozenset[SeriesKind] = frozenset({"multiple_bar", "stacked_bar"})
+"""The kinds of series that draw a group of bars for each category."""
+
+_AGGREGATION_OPTIONS = frozenset({"aggregate", "max_categories", "sort"})
+"""The options of a bar series that decide which categories are drawn."""
+
+_DEFAULT_CATEGORIES = 20
+"""The number of categories an aggregated bar series fits to before its first build."""
+
+_SIGNAL_ATTRIBUTES = (
+    "xside",
+    "yside",
+    "x",
+    "y",
+    "lines",
+    "marker",
+    "color",
+    "style",
+    "fillx",
+    "filly",
+    "label",
+)
+"""The attributes of a Plotext monitor that hold one entry per signal."""
+
+_STAGED_ATTRIBUTES = ("x", "y", "marker", "color", "style")
+"""The per-signal attributes that are held by a series between builds."""
+
+_STYLE_OPTIONS: dict[SeriesKind, frozenset[str]] = {
+    "plot": frozenset({"marker", "color", "style", "fillx", "filly", "label"}),
+    "scatter": frozenset(
+        {"marker", "color", "style", "fillx", "filly", "label", "density"}
+    ),
+    "bar": frozenset(
+        {"marker", "color", "fill", "width", "orientation", "minimum", "label"}
+    )
+    | _AGGREGATION_OPTIONS,
+    "multiple_bar": frozenset(
+        {"marker", "color", "fill", "width", "orientation", "minimum", "labels"}
+    )
+    | _AGGREGATION_OPTIONS,
+    "stacked_bar": frozenset(
+        {"marker", "color", "fill", "width", "orientation", "minimum", "labels"}
+    )
+    | _AGGREGATION_OPTIONS,
+}
+"""The styling options that can be changed for each kind of series."""
+
+
+def _compact(values: list[Any]) -> Any:
+    """Pack a list of values into a compact array of floats, if possible.
+
+    NumPy is used if it is available, otherwise a standard library array is
+    used. Values that aren't numbers (for example `None`, which Plotext
+    treats as a gap in the data) are stored as NaN, which Plotext treats
+    the same way.
+
+    Args:
+        values: The values to pack.
+
+    Returns:
+        The packed values, or the original list if they can't be packed.
+    """
+    try:
+        floats = [float("nan") if value is None else float(value) for value in values]
+    except (TypeError, ValueError):
+        return values
+    if numpy is not None:
+        return numpy.array(floats, dtype=numpy.float64)
+    return array("d", floats)
+
+
+def _sizeof(values: Any) -> int:
+    """Get the number of bytes used by some series data.
+
+    Args:
+        values: The values to size.
+
+    Returns:
+        The number of bytes used.
+    """
+    if isinstance(values, list):
+        return getsizeof(values) + sum(
+            getsizeof(value) for value in values if isinstance(value, float)
+        )
+    if (
+        numpy is not None
+        and isinstance(values, numpy.ndarray)
+        and values.base is not None
+    ):
+        # A view onto a larger array, such as a row of the data given to
+        # `Plot.plot_many`, doesn't count the data it views.
+        return getsizeof(values) + values.nbytes
+    return getsizeof(values)
+
+
+def _recorded(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Make a method of a series go through its plot's recorder, if it has one.
+
+    Args:
+        method: The method.
+
+    Returns:
+        The method, as recorded.
+    """
+
+    @wraps(method)
+    def recorded(self: Series, *args: Any, **kwargs: Any) -> Any:
+        recorder = self._plot._recorder
+        if recorder is None:
+            return method(self, *args, **kwargs)
+        return recorder._call(self, method, args, kwargs)
+
+    return recorded
+
+
+class DetachedSeriesError(Exception):
+    """Raised when trying to update a series that is no longer in its plot."""
+
+
+def _check_density(options: Mapping[str, Any]) -> None:
+    """Check that the options of a series don't ask for a filled density map.
+
+    A density map shades cells rather than drawing points, so there is
+    nothing for it to fill.
+
+    Args:
+        options: The options of the series.
+
+    Raises:
+        ValueError: If the options ask for a density map that is filled.
+    """
+    if options.get("density") and (
+        options.get("fillx") not in (None, False)
+        or options.get("filly") not in (None, False)
+    ):
+        raise ValueError("A scatter drawn as a density map can't be filled")
+
+
+class _Slot:
+    """The location of a series' signals within a single Plotext monitor."""
+
+    __slots__ = ("figure", "monitor", "start", "count", "color")
+
+    def __init__(self, figure: Any, start: int, count: int) -> None:
+        """Initialise the slot.
+
+        Args:
+            figure: The figure whose Plotext monitor holds the signals.
+            start: The index of the first signal.
+            count: The number of signals.
+        """
+        self.figure = figure
+        self.monitor = figure.monitor
+        self.start = start
+        self.count = count
+        self.color: Any = None
+        """The colour Plotext picked for a line or scatter series in this monitor."""
+
+
+class Series:
+    """A handle on a series that has been added to a `Plot`.
+
+    Handles are returned by `Plot.plot`, `Plot.scatter` and `Plot.bar`, and
+    allow the series to be updated without having to clear and redeclare
+    the whole figure:
+
+    ```python
+    line = plt.plot(plt.sin())
+    ...
+    line.set_data(plt.sin(phase=0.5))
+    ```
+
+    Only the state of the series being changed is rebuilt; any other series
+    in the plot are left as they are.
+
+    A handle becomes detached when its series is removed, or when the data
+    of the plot it belongs to is cleared.
+    """
+
+    __slots__ = (
+        "_plot",
+        "_kind",
+        "_data",
+        "_options",
+        "_epoch",
+        "_slots",
+        "_x",
+        "_y",
+        "_marker",
+        "_color",
+        "_style",
+        "_cache",
+        "_fitted",
+        "_offset",
+        "_order",
+        "_dataset",
+        "_mapped",
+        "_window",
+        "__weakref__",
+    )
+
+    def __init__(
+        self,
+        plot: Plot,
+        kind: SeriesKind,
+        data: tuple[Sequence[Any] | Dataset | MappedData | ResamplerView, ...],
+        options: dict[str, Any],
+    ) -> None:
+        """Initialise the series, adding it to the plot.
+
+        Args:
+            plot: The plot the series belongs to.
+            kind: The kind of series.
+            data: The positional data arguments for the series; or, for a
+                line or scatter series, a `Dataset` to show, or `MappedData`
+                or a view of a `Resampler` to read from.
+            options: The keyword arguments for the series.
+
+        Raises:
+            TypeError: If a dataset or mapped data is given for a bar series.
+            ValueError: If a density map is asked for a filled series.
+        """
+        from .dataset import Dataset  # pylint:disable=import-outside-toplevel
+
+        source = data[0] if len(data) == 1 else None
+        dataset = source if isinstance(source, Dataset) else None
+        mapped = source if isinstance(source, (MappedData, ResamplerView)) else None
+        if dataset is not None or mapped is not None:
+            if kind in _BAR_KINDS:
+                raise TypeError(
+                    "A dataset or mapped data can only be shown as a line or scatter"
+                )
+            # The series is drawn empty, and then made to follow the dataset,
+            # or filled from the mapped data when it is built.
+            data = ([],)
+        _check_density(options)
+        self._plot = plot
+        self._kind: SeriesKind = kind
+        self._data: tuple[Sequence[Any], ...] = data  # type: ignore[assignment]
+        self._dataset: Dataset | None = None
+        self._mapped = mapped
+        self._window: tuple[Any, ...] | None = None
+        self._options = options
+        self._epoch = plot._epoch
+        self._slots: list[_Slot] = []
+        self._cache: dict[int, Any] = {}
+        self._fitted = _DEFAULT_CATEGORIES
+        self._offset = 0
+        self._order = CategoryOrder()
+        picked = []
+        for figure in plot._target_figures():
+            start = len(figure.monitor.x)
+            # The colour Plotext picks if none is given, which can't be read
+            # back from a series that draws nothing.
+            picked.append(figure.monitor.next_color())
+            self._issue(figure.monitor)
+            self._slots.append(_Slot(figure, start, len(figure.monitor.x) - start))
+        self._pin_color(picked)
+        if self._kind not in _BAR_KINDS:
+            self._take_signal()
+        if dataset is not None:
+            dataset._attach(self)
+        if isinstance(mapped, ResamplerView):
+            mapped._attach(self)
+        plot._series.append(self)
+        if plot._recorder is not None:
+            plot._recorder._created(self)
+
+    @property
+    def kind(self) -> SeriesKind:
+        """The kind of series this handle is for."""
+        return self._kind
+
+    @property
+    def attached(self) -> bool:
+        """Is the series still part of its plot?"""
+        return self._epoch == self._plot._epoch and bool(self._slots)
+
+    @property
+    def data(self) -> tuple[Sequence[Any], ...]:
+        """The data of the series.
+
+        For line and scatter series this is the `x` and `y` data, as held
+        by the series. For bar series it is all of the data, whichever of
+        the categories are drawn.
+        """
+        if self._kind in _BAR_KINDS:
+            return self._data
+        return (self._x, self._y)
+
+    @property
+    def dataset(self) -> Dataset | None:
+        """The dataset the series shows, if it is a view of one."""
+        return self._dataset
+
+    @property
+    def category_count(self) -> int:
+        """The number of categories in the data of a bar series."""
+        return len(self._categories().labels) if self._kind in _BAR_KINDS else 0
+
+    @property
+    def category_offset(self) -> int:
+        """The position of the first category shown in a windowed bar series.
+
+        This only applies to a bar series with `aggregate="window"`; setting
+        it scrolls the window, and only the categories within the window are
+        drawn.
+        """
+        return self._offset
+
+    @category_offset.setter
+    def category_offset(self, offset: int) -> None:
+        self._ensure_attached()
+        offset = min(max(offset, 0), max(self.category_count - self._shown_count(), 0))
+        if offset != self._offset:
+            self._offset = offset
+            if self._options.get("aggregate") == "window":
+                self._changed()
+                self._redraw()
+
+    def _categories(self) -> Categories:
+        """Get all of the categories of a bar series.
+
+        Returns:
+            The categories, with their values.
+        """
+        if self._kind == "bar":
+            labels, values = _set_data(*self._data)
+            return Categories(list(labels), [list(values)])
+        labels, groups = _set_multiple_bar_data(*self._data)
+        return Categories(list(labels), [list(values) for values in groups])
+
+    def _shown_count(self) -> int:
+        """Get the number of categories a bar series shows when aggregated.
+
+        Returns:
+            The number of categories.
+        """
+        return max(self._options.get("max_categories") or self._fitted, 2)
+
+    def _shown(self) -> tuple[Any, ...]:
+        """Get the data of a bar series for the categories that are drawn.
+
+        Returns:
+            The data, in the same form as it was given to the series.
+        """
+        aggregate = self._options.get("aggregate")
+        if aggregate is None:
+            return self._data
+        categories = self._categories()
+        count = self._shown_count()
+        if aggregate == "top":
+            categories = top(categories, count, self._order)
+        elif aggregate == "buckets":
+            categories = buckets(categories, count)
+        else:
+            self._offset = min(self._offset, max(len(categories.labels) - count, 0))
+            categories = window(
+                categories,
+                count,
+                self._offset,
+                self._order if self._options.get("sort") else None,
+            )
+        if self._kind == "bar":
+            return (categories.labels, categories.groups[0])
+        return (categories.labels, categories.groups)
+
+    def _fit(self) -> None:
+        """Fit the series to the size of the plot it is drawn in.
+
+        This is done at the start of a build, once the sizes of the subplots
+        are known. A series of mapped data reads the points it needs; an
+        aggregated bar series is drawn again if the number of categories
+        that fit has changed.
+        """
+        if self._mapped is not None:
+            self._read(self._mapped)
+            return
+        if (
+            self._kind not in _BAR_KINDS
+            or self._options.get("aggregate") is None
+            or self._options.get("max_categories")
+            or not self._slots
+        ):
+            return
+        width, height = self._slots[0].monitor.size
+        if width is None or height is None:
+            return
+        categories = self._categories()
+        groups = len(categories.groups) if self._kind == "multiple_bar" else 1
+        if self._options.get("orientation") in ("horizontal", "h"):
+            # A row for each bar, and a row between categories.
+            fitted = (height - 4) // (groups + 1)
+        else:
+            # Room for the bars, and for the longest tick label and a space;
+            # buckets are labelled with their first and last categories.
+            longest = max((len(str(label)) for label in categories.labels), default=0)
+            if self._options.get("aggregate") == "buckets":
+                longest = 2 * longest + 1
+            fitted = (width - 10) // max(2 * groups + 2, longest + 1)
+        fitted = max(fitted, 2)
+        if fitted != self._fitted:
+            self._fitted = fitted
+            self._redraw()
+
+    def _read(self, mapped: MappedData | ResamplerView) -> None:
+        """Read the points of a series of mapped data that the plot shows.
+
+        The points are read again only if the limits of the x axis or the
+        width of the plot have changed, or the series has been told to read
+        them again, as a resampler does when samples are added to it.
+
+        Args:
+            mapped: The mapped data the series reads from.
+        """
+        if not self._slots:
+            return
+        slot = self._slots[0]
+        monitor = slot.monitor
+        width = monitor.size[0]
+        if not width:
+            return
+        low, high = monitor.xlim[monitor.xside_to_pos(monitor.xside[slot.start])]
+        shown = (low, high, width)
+        if shown != self._window:
+            self._window = shown
+            self._x, self._y = mapped.read(low, high, width)
+            self._cache.clear()
+
+    def _reread(self, mapped: MappedData | ResamplerView) -> None:
+        """Read the points of the series again when it is next built.
+
+        Args:
+            mapped: The data that has changed; if the series no longer reads
+                from it, or is no longer in the plot, nothing is read again.
+        """
+        if self._mapped is mapped and self.attached:
+            self._window = None
+            self._changed()
+
+    def _unlink(self) -> None:
+        """Stop the series following a dataset, or reading from mapped data."""
+        self._dataset = None
+        self._mapped = None
+
+    def _issue(self, monitor: Any) -> None:
+        """Draw the series at the end of the given monitor's signals.
+
+        Args:
+            monitor: The Plotext monitor to draw into.
+        """
+        if self._kind in _BAR_KINDS:
+            options = {
+                name: value
+                for name, value in self._options.items()
+                if name not in _AGGREGATION_OPTIONS
+            }
+            getattr(monitor, f"draw_{self._kind}")(*self._shown(), **options)
+        else:
+            options = {
+                name: value
+                for name, value in self._options.items()
+                if name != "density"
+            }
+            monitor.draw(*self._data, lines=self._kind == "plot", **options)
+
+    def _pin_color(self, picked: Sequence[Any] = ()) -> None:
+        """Pin down the colour Plotext picked for the series, if it picked one.
+
+        If no colour was given for the series, Plotext picks the next colour
+        from the theme's sequence. So that a redraw doesn't move on to yet
+        another colour, the colour that was picked is remembered. A line or
+        scatter series drawn in several subplots may have had a different
+        colour picked in each, so each is remembered with its slot.
+
+        Args:
+            picked: The colour Plotext was to pick in each slot, for a
+                series that was drawn without any data.
+        """
+        if self._options.get("color") is None and self._kind not in _BAR_KINDS:
+            for index, slot in enumerate(self._slots):
+                if slot.count and slot.monitor.color[slot.start]:
+                    slot.color = slot.monitor.color[slot.start][0]
+                elif index < len(picked):
+                    slot.color = picked[index]
+        if self._options.get("color") is None and self._slots:
+            slot = self._slots[0]
+            if self._kind in _GROUPED_BAR_KINDS:
+                # Each group of bars is drawn in its own colour, starting with
+                # its first bar.
+                groups = len(self._categories().groups)
+                per_group = slot.count // groups if groups else 0
+                if per_group:
+                    self._options["color"] = [
+                        slot.monitor.color[slot.start + group * per_group][0]
+                        for group in range(groups)
+                    ]
+            elif slot.count and slot.monitor.color[slot.start]:
+                self._options["color"] = slot.monitor.color[slot.start][0]
+            elif picked:
+                self._options["color"] = picked[0]
+
+    def _take_signal(self) -> None:
+        """Take the signal for a line or scatter series out of Plotext.
+
+        The data is packed into compact arrays and the per-point styling is
+        reduced to a single value where it's the same for every point.
+        Plotext is left holding empty placeholders until the next build.
+        """
+        slot = self._slots[0]
+        monitor, index = slot.monitor, slot.start
+        self._x = _compact(monitor.x[index])
+        self._y = _compact(monitor.y[index])
+        self._marker = monitor.marker[index]
+        self._color = monitor.color[index]
+        self._style = monitor.style[index]
+        if not isinstance(self._options.get("marker"), list):
+            self._marker = monitor.check_marker(self._options.get("marker"))
+        if not isinstance(self._options.get("color"), list):
+            self._color = self._options.get("color")
+        if not isinstance(self._options.get("style"), list):
+            self._style = monitor.check_style(self._options.get("style"))
+        self._data = ()
+        for slot in self._slots:
+            for name in _STAGED_ATTRIBUTES:
+                getattr(slot.monitor, name)[slot.start] = []
+
+    def _stage(self, skip: Container[Any] = ()) -> None:
+        """Hand the signal for a line or scatter series to Plotext for a build.
+
+        Args:
+            skip: Any monitors the signal shouldn't be handed to.
+        """
+        x, y = self._x.tolist(), self._y.tolist()
+        for slot in self._slots:
+            if slot.monitor not in skip:
+                self._stage_signal(slot, x, y)
+
+    def _stage_signal(
+        self,
+        slot: _Slot,
+        x: Any,
+        y: Any,
+        marker: list[str] | None = None,
+        color: list[Any] | None = None,
+    ) -> None:
+        """Hand some data for the signal to a single Plotext monitor.
+
+        Args:
+            slot: The slot of the signal within the monitor to hand it to.
+            x: The x data.
+            y: The y data.
+            marker: The marker for each point, to use in place of the
+                series' own markers.
+            color: The colour for each point, to use in place of the
+                series' own colours.
+        """
+        length = len(x)
+        style = self._style if isinstance(self._style, list) else [self._style] * length
+        if marker is None:
+            marker = (
+                self._marker
+                if isinstance(self._marker, list)
+                else [self._marker] * length
+            )
+        if color is None:
+            own = self._color if slot.color is None else slot.color
+            color = own if isinstance(own, list) else [own] * length
+        monitor, index = slot.monitor, slot.start
+        monitor.x[index] = x
+        monitor.y[index] = y
+        monitor.marker[index] = marker
+        monitor.color[index] = color
+        monitor.style[index] = style
+
+    def _signals(self) -> Iterator[tuple[Any, Signal]]:
+        """Get the signals of the series that can be rasterised with NumPy.
+
+        Yields:
+            The monitor holding each signal, along with the signal.
+        """
+        if numpy is None or not (
+            isinstance(self._x, numpy.ndarray)
+            and isinstance(self._y, numpy.ndarray)
+            and isinstance(self._marker, str)
+            and not isinstance(self._color, list)
+            and not isinstance(self._style, list)
+        ):
+            return
+        from ._raster import Signal  # pylint:disable=import-outside-toplevel
+
+        for slot in self._slots:
+            monitor, index = slot.monitor, slot.start
+            if monitor.fillx[index] is False and monitor.filly[index] is False:
+                yield monitor, Signal(
+                    index,
+                    self._x,
+                    self._y,
+                    self._marker,
+                    self._kind == "scatter" and bool(self._options.get("density")),
+                    self._cache,
+                    partial(self._stage_signal, slot),
+                )
+
+    def _degrade(
+        self, markers: Mapping[str, str], points: int | None
+    ) -> Callable[[], None]:
+        """Degrade a line or scatter series for a build at a lower quality.
+
+        Args:
+            markers: The markers to draw in place of others.
+            points: The most points to draw, if there's a limit.
+
+        Returns:
+            A function that undoes the degradation.
+        """
+        marker, x, y = self._marker, self._x, self._y
+
+        def restore() -> None:
+            self._marker, self._x, self._y = marker, x, y
+
+        if isinstance(marker, list):
+            self._marker = [markers.get(each, each) for each in marker]
+        else:
+            self._marker = markers.get(marker, marker)
+        if (
+            points
+            and len(x) > points
+            and not self._options.get("density")
+            and not any(
+                isinstance(values, list)
+                for values in (self._marker, self._color, self._style)
+            )
+        ):
+            stride = -(-len(x) // points)
+            self._x, self._y = x[::stride], y[::stride]
+        return restore
+
+    def _unstage(self) -> None:
+        """Take the staged signal for a line or scatter series back out of Plotext."""
+        for slot in self._slots:
+            for name in _STAGED_ATTRIBUTES:
+                getattr(slot.monitor, name)[slot.start] = []
+
+    def _changed(self) -> None:
+        """Record that the series has changed, in its plot and its subplots."""
+        for slot in self._slots:
+            slot.figure._changes += 1
+        self._plot._generation += 1
+
+    def _ensure_attached(self) -> None:
+        """Ensure the series is still attached to its plot.
+
+        Raises:
+            DetachedSeriesError: If the series is no longer in the plot.
+        """
+        if not self.attached:
+            raise DetachedSeriesError("The series is no longer part of its plot")
+
+    def _shift(self, monitor: Any, after: int, delta: int) -> None:
+        """Shift the slots of the other series in a monitor.
+
+        Args:
+            monitor: The monitor whose signals have moved.
+            after: The index after which signals have moved.
+            delta: How far the signals have moved.
+        """
+        for series in self._plot._series:
+            if series is not self:
+                for slot in series._slots:
+                    if slot.monitor is monitor and slot.start > after:
+                        slot.start += delta
+
+    def _redraw(self) -> None:
+        """Redraw a bar series in place, in every monitor it is drawn in."""
+        for slot in self._slots:
+            monitor = slot.monitor
+            end = len(monitor.x)
+            self._issue(monitor)
+            count = len(monitor.x) - end
+            for name in _SIGNAL_ATTRIBUTES:
+                signals = getattr(monitor, name)
+                fresh = signals[end:]
+                del signals[end:]
+                signals[slot.start : slot.start + slot.count] = fresh
+            monitor.signals = len(monitor.x)
+            self._shift(monitor, slot.start, count - slot.count)
+            slot.count = count
+
+    @_recorded
+    def set_data(self, *data: Sequence[Any]) -> None:
+        """Replace the data of the series.
+
+        If the series is a view of a dataset, or reads from mapped data, it
+        stops doing so, and shows its own data from then on.
+
+        Args:
+            *data: The new data, given in the same form as when the series
+                was created (for example `y` or `x, y` for a line plot).
+
+        Raises:
+            DetachedSeriesError: If the series is no longer in the plot.
+        """
+        prepared = self._prepare(data)
+        self._unlink()
+        self._adopt(prepared)
+
+    def _follow(self, dataset: Dataset, x: Any, y: Any) -> None:
+        """Make a line or scatter series a view of a dataset.
+
+        Args:
+            dataset: The dataset.
+            x: The dataset's `x` data.
+            y: The dataset's `y` data.
+        """
+        self._dataset = dataset
+        self._adopt((x, y, False, False))
+
+    def publish(self, *data: Sequence[Any]) -> None:
+        """Publish new data for the series, from any thread.
+
+        This is a shortcut for publishing the data of a single series with
+        `Plot.publish`.
+
+        Args:
+            *data: The new data, given in the same form as for `set_data`.
+
+        Raises:
+            DetachedSeriesError: If the series is no longer in the plot.
+        """
+        self._plot.publish({self: data})
+
+    def _prepare(self, data: tuple[Sequence[Any], ...]) -> Any:
+        """Prepare new data for the series, ready for it to be adopted.
+
+        This leaves the series, and the Plotext figure, untouched; so it is
+        safe to call from any thread.
+
+        Args:
+            data: The new data, given in the same form as for `set_data`.
+
+        Returns:
+            The prepared data.
+
+        Raises:
+            DetachedSeriesError: If the series is no longer in the plot.
+        """
+        slots = self._slots
+        self._ensure_attached()
+        if self._kind in _BAR_KINDS:
+            return data
+        monitor = slots[0].monitor
+        x, y = _set_data(*data)
+        x, x_date = monitor.to_time(x)
+        y, y_date = monitor.to_time(y)
+        return _compact(x), _compact(y), x_date, y_date
+
+    def _adopt(self, prepared: Any) -> None:
+        """Replace the data of the series with some prepared data.
+
+        Args:
+            prepared: The data, as prepared by `_prepare`.
+        """
+        self._changed()
+        if self._kind in _BAR_KINDS:
+            self._data = prepared
+            self._redraw()
+            return
+        x, y, x_date, y_date = prepared
+        for slot in self._slots:
+            xside, yside = (
+                slot.monitor.xside[slot.start],
+                slot.monitor.yside[slot.start],
+            )
+            slot.monitor.x_date[slot.monitor.xside_to_pos(xside)] = x_date
+            slot.monitor.y_date[slot.monitor.yside_to_pos(yside)] = y_date
+        self._x, self._y = x, y
+        self._cache.clear()
+
+    @_recorded
+    def set_style(self, **options: Any) -> None:
+        """Change the styling of the series.
+
+        Args:
+            **options: The styling options to change. These are the same
+                keyword arguments as accepted when the series was created,
+                for example `marker`, `color` or `label`.
+
+        Raises:
+            DetachedSeriesError: If the series is no longer in the plot.
+            TypeError: If an option can't be changed for this kind of series.
+            ValueError: If the series would be a filled density map.
+        """
+        self._ensure_attached()
+        unknown = set(options) - _STYLE_OPTIONS[self._kind]
+        if unknown:
+            raise TypeError(
+                f"Can't set {', '.join(sorted(unknown))} on a {self._kind} series"
+            )
+        _check_density({**self._options, **options})
+        self._changed()
+        if self._kind in _BAR_KINDS:
+            self._options.update(options)
+            self._pin_color()
+            self._redraw()
+            return
+        if options.get("color", True) is None:
+            del options["color"]
+        self._options.update(options)
+        monitor = self._slots[0].monitor
+        if "marker" in options:
+            marker = options["marker"]
+            self._marker = (
+                list(map(monitor.check_marker, marker))
+                if isinstance(marker, list)
+                else monitor.check_marker(marker)
+            )
+        if "color" in options:
+            color = options["color"]
+            for slot in self._slots:
+                slot.color = None
+            self._color = (
+                list(map(monitor.check_color, color))
+                if isinstance(color, list)
+                else monitor.check_color(color)
+            )
+        if "style" in options:
+            style = options["style"]
+            self._style = (
+                list(map(monitor.check_style, style))
+                if isinstance(style, list)
+                else monitor.check_style(style)
+            )
+        for slot in self._slots:
+            monitor, index = slot.monitor, slot.start
+            if "fillx" in options:
+                monitor.fillx[index] = monitor.check_fill(options["fillx"])
+            if "filly" in options:
+                monitor.filly[index] = monitor.check_fill(options["filly"])
+            if "label" in options:
+                monitor.add_label(options["label"])
+                monitor.label[index] = monitor.label.pop()
+
+    @_recorded
+    def remove(self) -> None:
+        """Remove the series from its plot.
+
+        Removing a series that has already been removed does nothing.
+        """
+        if not self.attached:
+            return
+        for slot in self._slots:
+            monitor = slot.monitor
+            for name in _SIGNAL_ATTRIBUTES:
+                del getattr(monitor, name)[slot.start : slot.start + slot.count]
+            monitor.signals = len(monitor.x)
+            self._shift(monitor, slot.start, -slot.count)
+        self._changed()
+        self._slots = []
+        self._plot._series.remove(self)
+
+    def _content(self) -> tuple[Any, ...]:
+        """Get the content of the series, for hashing the content of its plot.
+
+        Returns:
+            The kind, data, style and placement of the series.
+        """
+        placement = [(slot.start, slot.count) for slot in self._slots]
+        if self._kind in _BAR_KINDS:
+            # The style of a bar series is all in its options.
+            return (
+                self._kind,
+                self._data,
+                self._options,
+                placement,
+                (self._fitted, self._offset),
+            )
+        return (
+            self._kind,
+            (self._x, self._y),
+            self._marker,
+            self._color,
+            self._style,
+            self._options,
+            placement,
+        )
+
+    def _memory_usage(self) -> int:
+        """Get the number of bytes used by the data held by the series.
+
+        Returns:
+            The number of bytes.
+        """
+        if self._kind in _BAR_KINDS:
+            return 0
+        # The data of a view of a dataset belongs to the dataset.
+        data = () if self._dataset is not None else (self._x, self._y)
+        return sum(
+            _sizeof(values)
+            for values in (*data, self._marker, self._color, self._style)
+            if not isinstance(values, str)
+        )
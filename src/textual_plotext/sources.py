@@ -0,0 +1,212 @@
+"""Provides for feeding a plot from an asynchronous source of samples.
+
+Rather than each application polling for new data with `set_interval`, a
+`PlotextPlot` can be bound to an async iterable of samples with
+`PlotextPlot.bind_source`. Samples are gathered as they arrive, and are
+applied to the series they're for in batches, at most once a frame; so
+however quickly the samples arrive, the plot is only updated, and rendered,
+as often as it can be seen to change.
+
+If samples arrive faster than the plot takes them in, a backpressure policy
+decides what happens: the source can be held back until there is room for
+more, or samples can be dropped. Counters of what has happened are kept, so
+that a plot that is falling behind can be spotted.
+"""
+
+from __future__ import annotations
+
+from asyncio import Event
+from collections import deque
+from time import monotonic
+from typing import TYPE_CHECKING, Any, AsyncIterable, NamedTuple
+
+from textual import constants
+from typing_extensions import Literal, TypeAlias
+
+from .resample import Resampler
+
+if TYPE_CHECKING:
+    from textual.timer import Timer
+    from textual.worker import Worker
+
+    from .plotext_plot import PlotextPlot
+    from .series import Series
+
+BackpressurePolicy: TypeAlias = Literal["block", "drop-oldest", "drop-newest"]
+"""What to do with a sample that arrives when a source's batch is full.
+
+- `"block"`: Hold the source back until there is room for the sample.
+- `"drop-oldest"`: Drop the oldest sample waiting to be applied.
+- `"drop-newest"`: Drop the sample that has just arrived.
+"""
+
+
+class SourceStats(NamedTuple):
+    """Statistics for a source bound to a plot."""
+
+    received: int
+    """The number of samples taken from the source."""
+
+    applied: int
+    """The number of samples applied to the series."""
+
+    dropped: int
+    """The number of samples dropped because the batch was full."""
+
+    stalls: int
+    """The number of times the source was held back because the batch was full."""
+
+    pending: int
+    """The number of samples waiting to be applied."""
+
+    frames: int
+    """The number of frames in which samples were applied."""
+
+    lag: float
+    """How long, in seconds, the oldest sample applied in the latest frame waited."""
+
+
+class SourceBinding:
+    """A binding of an asynchronous source of samples to a series of a plot.
+
+    Bindings are created with `PlotextPlot.bind_source`.
+
+    Each sample is either a `y` value, in which case its `x` value is its
+    position in the source, or an `(x, y)` pair. The latest `window` samples
+    make up the data of the series.
+
+    Samples can instead be folded into a `Resampler`, whose views the plot
+    shows. Each sample is then a `(time, value)` pair, or a value, which is
+    taken to be for the (monotonic) time it arrived.
+    """
+
+    def __init__(
+        self,
+        plot: PlotextPlot,
+        source: AsyncIterable[Any],
+        series: Series | Resampler,
+        batch: int,
+        window: int,
+        policy: BackpressurePolicy,
+    ) -> None:
+        """Initialise the binding.
+
+        Args:
+            plot: The plot widget the series is displayed in.
+            source: The source of samples.
+            series: The series, or resampler, to apply the samples to.
+            batch: The most samples to hold between frames.
+            window: The number of the latest samples to show.
+            policy: What to do with a sample when the batch is full.
+
+        Raises:
+            ValueError: If the batch or the window can't hold any samples.
+        """
+        if batch < 1:
+            raise ValueError("The batch must hold at least one sample")
+        if window < 1:
+            raise ValueError("The window must hold at least one sample")
+        self._plot = plot
+        self._source = source
+        self._series = series
+        self._batch = batch
+        self._policy = policy
+        self._pending: deque[tuple[float, Any]] = deque()
+        self._x: deque[Any] = deque(maxlen=window)
+        self._y: deque[Any] = deque(maxlen=window)
+        self._room = Event()
+        self._room.set()
+        self._frame: Timer | None = None
+        self._worker: Worker[None] | None = None
+        self._received = 0
+        self._applied = 0
+        self._dropped = 0
+        self._stalls = 0
+        self._frames = 0
+        self._lag = 0.0
+
+    @property
+    def series(self) -> Series | Resampler:
+        """The series, or resampler, the samples are applied to."""
+        return self._series
+
+    @property
+    def stats(self) -> SourceStats:
+        """The statistics for the binding."""
+        return SourceStats(
+            self._received,
+            self._applied,
+            self._dropped,
+            self._stalls,
+            len(self._pending),
+            self._frames,
+            self._lag,
+        )
+
+    def _start(self) -> None:
+        """Start taking samples from the source."""
+        self._worker = self._plot.run_worker(
+            self._consume(), group="plotext-sources", description=repr(self._source)
+        )
+
+    def stop(self) -> None:
+        """Stop taking samples from the source.
+
+        Any samples that have already been taken are still applied.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        self._room.set()
+
+    async def _consume(self) -> None:
+        """Take samples from the source until it is exhausted."""
+        async for sample in self._source:
+            position = self._received
+            self._received += 1
+            if len(self._pending) >= self._batch:
+                if self._policy == "block":
+                    self._stalls += 1
+                    self._room.clear()
+                    await self._room.wait()
+                elif self._policy == "drop-oldest":
+                    self._pending.popleft()
+                    self._dropped += 1
+                else:
+                    self._dropped += 1
+                    continue
+            arrived = monotonic()
+            if isinstance(sample, tuple):
+                x, y = sample
+            else:
+                resampled = isinstance(self._series, Resampler)
+                x, y = (arrived if resampled else position), sample
+            self._pending.append((arrived, (x, y)))
+            if self._frame is None:
+                self._frame = self._plot.set_timer(
+                    1 / constants.MAX_FPS, self._apply, name="plotext-source-frame"
+                )
+
+    def _apply(self) -> None:
+        """Apply the samples that have arrived to the series."""
+        self._frame = None
+        if not self._pending:
+            return
+        self._lag = monotonic() - self._pending[0][0]
+        if isinstance(self._series, Resampler):
+            self._series.add(
+                [x for _, (x, _) in self._pending], [y for _, (_, y) in self._pending]
+            )
+        else:
+            for _, (x, y) in self._pending:
+                self._x.append(x)
+                self._y.append(y)
+        self._applied += len(self._pending)
+        self._pending.clear()
+        self._room.set()
+        self._frames += 1
+        if isinstance(self._series, Resampler):
+            self._plot.refresh()
+        elif self._series.attached:
+            self._series.set_data(list(self._x), list(self._y))
+            self._plot.refresh()
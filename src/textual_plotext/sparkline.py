@@ -0,0 +1,298 @@
+"""Provides a lightweight widget for drawing a single series as a sparkline.
+
+A `PlotextPlot` carries a whole Plotext figure, with its axes, ticks,
+legend and title; which is a lot of machinery for a trend line in a table
+cell. A `PlotextSparkline` draws a single series straight into block or
+braille glyphs, with no figure at all, while taking its colours from the
+same themes as `PlotextPlot`.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+from math import isnan
+from typing import TYPE_CHECKING, Any, Callable, Sequence
+
+from rich.color import Color
+from rich.style import Style
+from rich.text import Text
+from textual.reactive import reactive
+from textual.widget import Widget
+from typing_extensions import Literal, TypeAlias
+
+from plotext._dict import themes as _themes
+
+from .plot import PlotextThemeName, _rgbify, _sequence
+from .series import Series
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+
+SparklineMarker: TypeAlias = Literal["block", "braille"]
+"""The kinds of glyph a sparkline can be drawn with."""
+
+_BLOCKS = " ▁▂▃▄▅▆▇█"
+"""The glyphs for each eighth of a cell filled from the bottom."""
+
+_BRAILLE_DOTS = ((0x01, 0x02, 0x04, 0x40), (0x08, 0x10, 0x20, 0x80))
+"""The bits of a braille glyph for each dot, by column and then row."""
+
+
+@lru_cache(maxsize=None)
+def _style(theme: str, color: int) -> Style:
+    """Get the style to draw a sparkline in.
+
+    Args:
+        theme: The name of the theme, or `"auto"`.
+        color: The index of the colour to use from the theme's sequence.
+
+    Returns:
+        The style.
+    """
+    if theme == "auto":
+        canvas: Any = "default"
+        sequence: Sequence[Any] = _sequence
+    else:
+        canvas, _, _, _, sequence = _themes.get(theme, _themes["default"])
+    foreground = _rgbify(sequence[color % len(sequence)])
+    background = _rgbify(canvas)
+    return Style(
+        color=None if foreground == "default" else Color.from_rgb(*foreground),
+        bgcolor=None if background == "default" else Color.from_rgb(*background),
+    )
+
+
+def _buckets(
+    values: Sequence[float], count: int, summary: Callable[[Sequence[float]], float]
+) -> list[float]:
+    """Summarise some values into a number of buckets.
+
+    Args:
+        values: The values to summarise.
+        count: The number of buckets.
+        summary: The function that summarises the values in a bucket.
+
+    Returns:
+        The summary of each bucket; a bucket with no numbers in it is NaN.
+        If there are fewer values than buckets, there is a bucket per value.
+    """
+    size = len(values)
+    if size <= count:
+        return [float(value) for value in values]
+    buckets = []
+    for bucket in range(count):
+        numbers = [
+            value
+            for value in values[bucket * size // count : (bucket + 1) * size // count]
+            if not isnan(value)
+        ]
+        buckets.append(summary(numbers) if numbers else float("nan"))
+    return buckets
+
+
+class PlotextSparkline(Widget):
+    """A lightweight widget that draws a single series as a sparkline.
+
+    The data isn't copied: the sparkline holds on to whatever sequence of
+    numbers it is given (a list, an `array.array`, a NumPy array, a
+    `deque`, ...) and reads it each time it is rendered, so after changing
+    the data in place, call `refresh`. The data can also be a `Series` of a
+    `Plot`, in which case the sparkline shares the data of that series.
+
+    If there is more data than there is room for, the data is split into
+    buckets and each bucket is drawn as the `summary` of its values.
+    """
+
+    DEFAULT_CSS = """
+    PlotextSparkline {
+        width: 1fr;
+        height: 1;
+    }
+    """
+
+    theme: reactive[Literal["auto"] | PlotextThemeName] = reactive("auto")
+    """The theme to take the colours of the sparkline from.
+
+    If set to `"auto"` the sparkline is drawn over the widget's own
+    background, in a colour from the same sequence that `PlotextPlot` uses
+    for its `"auto"` theme.
+    """
+
+    color: reactive[int] = reactive(0)
+    """The index of the colour to use from the theme's sequence of colours."""
+
+    marker: reactive[SparklineMarker] = reactive[SparklineMarker]("block")
+    """The kind of glyph to draw the sparkline with.
+
+    With `"block"` each cell is a bar; with `"braille"` each cell holds two
+    points, drawn as a line.
+    """
+
+    def __init__(
+        self,
+        data: Sequence[float] | Series | None = None,
+        *,
+        marker: SparklineMarker = "block",
+        theme: Literal["auto"] | PlotextThemeName = "auto",
+        color: int = 0,
+        minimum: float | None = None,
+        maximum: float | None = None,
+        summary: Callable[[Sequence[float]], float] = max,
+        name: str | None = None,
+        id: str | None = None,  # pylint:disable=redefined-builtin
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Initialise the sparkline widget.
+
+        Args:
+            data: The data to draw.
+            marker: The kind of glyph to draw the sparkline with.
+            theme: The theme to take the colours of the sparkline from.
+            color: The index of the colour to use from the theme's sequence.
+            minimum: The value at the bottom of the sparkline; by default
+                the smallest value drawn.
+            maximum: The value at the top of the sparkline; by default the
+                largest value drawn.
+            summary: The function that summarises the values in a bucket.
+            name: The name of the sparkline widget.
+            id: The ID of the sparkline widget in the DOM.
+            classes: The CSS classes of the sparkline widget.
+            disabled: Whether the sparkline widget is disabled or not.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._data = data
+        self.minimum = minimum
+        self.maximum = maximum
+        self.summary = summary
+        self.set_reactive(PlotextSparkline.marker, marker)
+        self.set_reactive(PlotextSparkline.theme, theme)
+        self.set_reactive(PlotextSparkline.color, color)
+
+    @property
+    def data(self) -> Sequence[float] | Series | None:
+        """The data drawn by the sparkline."""
+        return self._data
+
+    @data.setter
+    def data(self, data: Sequence[float] | Series | None) -> None:
+        self._data = data
+        self.refresh()
+
+    def _values(self) -> Sequence[float]:
+        """Get the values to draw.
+
+        Returns:
+            The values.
+        """
+        if self._data is None:
+            return []
+        if isinstance(self._data, Series):
+            return self._data.data[-1] if self._data.attached else []
+        if isinstance(self._data, deque):
+            # A deque can't be sliced into buckets.
+            return list(self._data)
+        return self._data
+
+    def _scale(self, values: list[float], steps: int) -> list[int | None]:
+        """Scale values onto a number of steps.
+
+        Args:
+            values: The values to scale.
+            steps: The number of steps.
+
+        Returns:
+            The step for each value, from 0 up to `steps - 1`, or `None` for
+            a gap.
+        """
+        numbers = [value for value in values if not isnan(value)]
+        if not numbers:
+            return [None] * len(values)
+        lower = min(numbers) if self.minimum is None else self.minimum
+        upper = max(numbers) if self.maximum is None else self.maximum
+        span = upper - lower
+        return [
+            None
+            if isnan(value)
+            else (
+                min(max(round((value - lower) / span * (steps - 1)), 0), steps - 1)
+                if span > 0
+                else steps // 2
+            )
+            for value in values
+        ]
+
+    def _blocks(self, values: Sequence[float], width: int, height: int) -> list[str]:
+        """Draw values as block glyphs.
+
+        Args:
+            values: The values to draw.
+            width: The width to draw in.
+            height: The height to draw in.
+
+        Returns:
+            The rows of the sparkline, from the top down.
+        """
+        levels = self._scale(_buckets(values, width, self.summary), height * 8)
+        rows = []
+        for row in range(height - 1, -1, -1):
+            rows.append(
+                "".join(
+                    " "
+                    if level is None
+                    else _BLOCKS[min(max(level + 1 - row * 8, 0), 8)]
+                    for level in levels
+                ).ljust(width)
+            )
+        return rows
+
+    def _braille(self, values: Sequence[float], width: int, height: int) -> list[str]:
+        """Draw values as a line of braille glyphs.
+
+        Args:
+            values: The values to draw.
+            width: The width to draw in.
+            height: The height to draw in.
+
+        Returns:
+            The rows of the sparkline, from the top down.
+        """
+        dots = height * 4
+        points = self._scale(_buckets(values, width * 2, self.summary), dots)
+        cells = [[0] * width for _ in range(height)]
+        previous: int | None = None
+        for column, point in enumerate(points):
+            if point is None:
+                previous = None
+                continue
+            # Join each point to the one before it, so the points make a line.
+            low, high = (
+                (point, point) if previous is None else sorted((previous, point))
+            )
+            for dot in range(low, high + 1):
+                row, bit = divmod(dots - 1 - dot, 4)
+                cells[row][column // 2] |= _BRAILLE_DOTS[column % 2][bit]
+            previous = point
+        return [
+            "".join(chr(0x2800 + cell) if cell else " " for cell in row)
+            for row in cells
+        ]
+
+    def render(self) -> RenderableType:
+        """Render the sparkline.
+
+        Returns:
+            The renderable for displaying the sparkline.
+        """
+        width, height = self.size
+        if not (width and height):
+            return ""
+        values = self._values()
+        draw = self._braille if self.marker == "braille" else self._blocks
+        return Text(
+            "\n".join(draw(values, width, height)),
+            style=_style(self.theme, self.color),
+            no_wrap=True,
+            overflow="crop",
+        )
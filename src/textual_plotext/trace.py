@@ -0,0 +1,572 @@
+"""Provides for recording the calls made to a plot, and replaying them.
+
+How fast a plot builds can depend on the exact sequence, and timing, of the
+updates made to it; which makes a performance problem seen with real data
+hard to reproduce elsewhere. A `TraceRecorder` logs every call made to a
+`Plot`, and to its series, along with when it was made and each time the
+plot was built, to a compressed trace file. `replay` then drives a
+headless `PlotextPlot` through the same calls, building it where it was
+built, and reports how long each build took; so a trace from the field
+becomes a repeatable benchmark.
+
+Labels and titles can be anonymised as they are recorded, for traces of
+data that can't be shared. The numbers in the data are kept, as it is those
+that the cost of a build depends on.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import os
+import warnings
+from array import array
+from itertools import count
+from threading import Lock, local
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, NamedTuple
+from weakref import WeakKeyDictionary
+
+from textual.app import App, ComposeResult
+
+from ._ansi import ansi_to_text
+from .dataset import Dataset
+from .frames import frame_store
+from .mapped import MappedData
+from .plot import _RESIZES, Plot, themes
+from .plotext_plot import PlotextPlot
+from .resample import ResamplerView
+from .series import _BAR_KINDS, Series
+
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+
+    from .plotext._figure import _figure_class as Figure
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore[assignment]
+
+_FORMAT = "textual-plotext-trace"
+"""The name of the format of a trace file, given in its header."""
+
+_VERSION = 1
+"""The version of the format of a trace file."""
+
+_TEXT_ARGUMENTS = {
+    "title": 0,
+    "xlabel": 0,
+    "ylabel": 0,
+    "text": 0,
+    "xticks": 1,
+    "yticks": 1,
+}
+"""The methods that take text to anonymise, and the position of the text."""
+
+_TEXT_OPTIONS = frozenset({"label", "labels", "xlabel", "ylabel", "title"})
+"""The keyword arguments that take text to anonymise."""
+
+_APPLIED = _RESIZES | {"theme"}
+"""The calls that aren't replayed, as the replaying widget applies its own."""
+
+
+class TraceRecorder:
+    """Records the calls made to a plot, and its builds, to a trace file.
+
+    ```python
+    recorder = TraceRecorder(self.query_one(PlotextPlot), "plot.trace")
+    ...
+    recorder.close()
+    ```
+
+    Recording should start before anything is plotted; calls on series
+    that were plotted before then are left out of the trace. Each call is
+    recorded with its arguments; any argument that isn't plain data (a
+    number, a string, or a sequence or mapping of them) is recorded as
+    `None`. A `Dataset` is recorded as the data it holds when it is plotted,
+    and each change to its data as new data published to its views.
+    `MappedData`, and views of a `Resampler`, can't be recorded; plotting
+    them gives a warning, and they are replayed as empty series.
+    """
+
+    def __init__(
+        self,
+        target: Plot | PlotextPlot,
+        path: str | os.PathLike[str],
+        *,
+        anonymise: bool = False,
+    ) -> None:
+        """Initialise the recorder, and start recording.
+
+        Args:
+            target: The plot, or plot widget, to record.
+            path: The path of the trace file to write.
+            anonymise: Replace labels and titles with placeholders of the
+                same length.
+
+        Raises:
+            RuntimeError: If the plot is already being recorded.
+        """
+        self._plot = target.plt if isinstance(target, PlotextPlot) else target
+        if self._plot._recorder is not None:
+            raise RuntimeError("The plot is already being recorded")
+        self._anonymise = anonymise
+        self._placeholders: dict[str, str] = {}
+        self._ids: WeakKeyDictionary[Series, int] = WeakKeyDictionary()
+        self._next_id = count()
+        self._depth = local()
+        self._lock = Lock()
+        self._started = monotonic()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"format": _FORMAT, "version": _VERSION, "anonymised": anonymise})
+        self._plot._recorder = self
+
+    def __enter__(self) -> TraceRecorder:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop recording, and close the trace file."""
+        # The recorder hooks itself into the plot it records.
+        # pylint:disable=protected-access
+        if self._plot._recorder is self:
+            self._plot._recorder = None
+        with self._lock:
+            self._file.close()
+
+    def _write(self, entry: Any) -> None:
+        """Write an entry to the trace file.
+
+        Args:
+            entry: The entry.
+        """
+        line = json.dumps(entry, separators=(",", ":"))
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+
+    def _created(self, series: Series) -> None:
+        """Note that a series has been created, giving it its id in the trace.
+
+        Args:
+            series: The series.
+        """
+        self._ids[series] = next(self._next_id)
+
+    def _built(self, width: int | None, height: int | None, theme: str | None) -> None:
+        """Record a build of the plot.
+
+        Args:
+            width: The width the plot was built at.
+            height: The height the plot was built at.
+            theme: The theme the plot was built with.
+        """
+        self._write([monotonic() - self._started, "build", width, height, theme])
+
+    def _call(
+        self,
+        target: Figure | Series,
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        """Make a call on the plot, or one of its series, recording it.
+
+        Calls made from within a recorded call are part of it, and aren't
+        recorded themselves.
+
+        Args:
+            target: The figure or series the call is made on.
+            method: The method being called.
+            args: The positional arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            The result of the call.
+        """
+        depth = getattr(self._depth, "value", 0)
+        self._depth.value = depth + 1
+        try:
+            when = monotonic() - self._started
+            result = method(target, *args, **kwargs)
+        finally:
+            self._depth.value = depth
+        if depth == 0:
+            name = method.__name__
+            where = self._target(target)
+            if where is not None:
+                args = self._sourced(name, args)
+                if self._anonymise:
+                    args, kwargs = self._anonymised(target, name, args, kwargs)
+                self._write(
+                    [when, "call", where, name, self._plain(args), self._plain(kwargs)]
+                )
+        return result
+
+    def _followed(self, series: Series, x: Any, y: Any) -> None:
+        """Record the data of a dataset changing, for a series that shows it.
+
+        The change is recorded as the new data being published to the series.
+
+        Args:
+            series: The series.
+            x: The new `x` data of the dataset.
+            y: The new `y` data of the dataset.
+        """
+        where = self._ids.get(series)
+        if where is not None:
+            when = monotonic() - self._started
+            self._write([when, "call", where, "publish", self._plain([x, y]), {}])
+
+    def _sourced(self, name: str, args: tuple[Any, ...]) -> tuple[Any, ...]:
+        """Replace the source a series is given its data from with the data.
+
+        Args:
+            name: The name of the method called.
+            args: The positional arguments of the call.
+
+        Returns:
+            The positional arguments, with a dataset replaced by its data.
+        """
+        if len(args) != 1:
+            return args
+        if isinstance(args[0], Dataset):
+            return args[0].data
+        if isinstance(args[0], (MappedData, ResamplerView)):
+            warnings.warn(
+                f"The data given to {name} can't be recorded;"
+                " the series will be replayed empty",
+                RuntimeWarning,
+                stacklevel=5,
+            )
+        return args
+
+    def _target(self, target: Figure | Series) -> Any:
+        """Get how a call's target is given in the trace.
+
+        Args:
+            target: The figure or series the call is made on.
+
+        Returns:
+            The id of a series, or the path to a figure; or `None` if the
+            series was created before recording started.
+        """
+        if isinstance(target, Series):
+            return self._ids.get(target)
+        path = []
+        figure = target
+        # Plotext only keeps a figure's place in its parent's grid of subplots.
+        # pylint:disable=protected-access
+        while not figure._is_master:
+            parent = figure._parent
+            for row, figures in enumerate(parent.subfig):
+                if figure in figures:
+                    path.append([row + 1, figures.index(figure) + 1])
+            figure = parent
+        return path[::-1]
+
+    def _plain(self, value: Any) -> Any:
+        """Convert a value into plain data, for the trace.
+
+        Args:
+            value: The value.
+
+        Returns:
+            The value as plain data, or `None` if it can't be.
+        """
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, Series):
+            return {"series": self._ids.get(value)}
+        if isinstance(value, Mapping):
+            if all(isinstance(key, str) for key in value):
+                return {key: self._plain(item) for key, item in value.items()}
+            return {
+                "items": [
+                    [self._plain(key), self._plain(item)] for key, item in value.items()
+                ]
+            }
+        if numpy is not None and isinstance(value, (numpy.ndarray, numpy.generic)):
+            return value.tolist()
+        if isinstance(value, array):
+            return value.tolist()
+        if isinstance(value, (list, tuple, range)):
+            # Data is usually all numbers, which can be written as it is.
+            if all(type(item) in (int, float) for item in value):
+                return list(value)
+            return [self._plain(item) for item in value]
+        return None
+
+    def _anonymised(
+        self,
+        target: Figure | Series,
+        name: str,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """Anonymise the text in the arguments of a call.
+
+        Args:
+            target: The figure or series the call is made on.
+            name: The name of the method called.
+            args: The positional arguments of the call.
+            kwargs: The keyword arguments of the call.
+
+        Returns:
+            The anonymised positional and keyword arguments.
+        """
+        anonymised = list(args)
+        position = _TEXT_ARGUMENTS.get(name)
+        if name in _BAR_KINDS or (
+            name in ("set_data", "publish")
+            and isinstance(target, Series)
+            and target.kind in _BAR_KINDS
+        ):
+            # The categories of bars are given first, if they are given.
+            position = 0 if len(args) > 1 else None
+        if position is not None and position < len(anonymised):
+            anonymised[position] = self._placeholder(anonymised[position])
+        return tuple(anonymised), {
+            key: self._placeholder(value) if key in _TEXT_OPTIONS else value
+            for key, value in kwargs.items()
+        }
+
+    def _placeholder(self, text: Any) -> Any:
+        """Replace text with a placeholder of the same length.
+
+        The same text is always replaced with the same placeholder.
+
+        Args:
+            text: The text, or a sequence of text.
+
+        Returns:
+            The placeholder, or placeholders.
+        """
+        if isinstance(text, str):
+            if text not in self._placeholders:
+                token = f"{len(self._placeholders):x}"
+                self._placeholders[text] = token + "x" * (len(text) - len(token))
+            return self._placeholders[text]
+        if isinstance(text, (list, tuple)):
+            return [self._placeholder(item) for item in text]
+        return text
+
+
+class ReplayReport(NamedTuple):
+    """The timings of the replay of a trace."""
+
+    calls: int
+    """The number of calls replayed."""
+
+    build_ms: list[float]
+    """The time, in milliseconds, that each build of the plot took."""
+
+    render_ms: list[float]
+    """The time, in milliseconds, that turning each build into text took."""
+
+    @property
+    def builds(self) -> int:
+        """The number of builds replayed."""
+        return len(self.build_ms)
+
+    def percentile(self, timings: list[float], percent: float) -> float:
+        """Get a percentile of some timings.
+
+        Args:
+            timings: The timings, such as `build_ms`.
+            percent: The percentile, from 0 to 100.
+
+        Returns:
+            The timing at that percentile, or 0 if there are none.
+        """
+        if not timings:
+            return 0.0
+        ordered = sorted(timings)
+        return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+
+class _ReplayedPlot(PlotextPlot):
+    """A plot widget that only shows the frames that the replay builds."""
+
+    def render(self) -> RenderableType:
+        frame = frame_store(self.app).latest(self)
+        return "" if frame is None else frame
+
+
+class _ReplayApp(App[None]):
+    """The headless application that a trace is replayed in."""
+
+    def compose(self) -> ComposeResult:
+        yield _ReplayedPlot()
+
+
+class _Replayer:
+    """Keeps the series created by a replay, in the order they're created."""
+
+    def __init__(self) -> None:
+        self.series: list[Series] = []
+
+    def _created(self, series: Series) -> None:
+        self.series.append(series)
+
+    def _built(self, width: int | None, height: int | None, theme: str | None) -> None:
+        pass
+
+    def _followed(self, series: Series, x: Any, y: Any) -> None:
+        pass
+
+    def _call(
+        self,
+        target: Figure | Series,
+        method: Callable[..., Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> Any:
+        return method(target, *args, **kwargs)
+
+
+def _entries(path: str | os.PathLike[str]) -> Iterator[Any]:
+    """Read the entries of a trace file.
+
+    Args:
+        path: The path of the trace file.
+
+    Yields:
+        Each entry after the header.
+
+    Raises:
+        ValueError: If the file isn't a trace.
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as trace:
+        try:
+            header = json.loads(trace.readline() or "{}")
+        except (OSError, ValueError):
+            header = {}
+        if header.get("format") != _FORMAT or header.get("version") != _VERSION:
+            raise ValueError(f"{os.fspath(path)!r} isn't a plot trace")
+        for line in trace:
+            yield json.loads(line)
+
+
+def replay(path: str | os.PathLike[str], *, speed: float | None = None) -> ReplayReport:
+    """Replay a trace in a headless `PlotextPlot`, timing each build.
+
+    Args:
+        path: The path of the trace file.
+        speed: How fast to replay the trace, relative to how it was
+            recorded; by default it is replayed as fast as possible.
+
+    Returns:
+        The timings of the replay.
+
+    Raises:
+        ValueError: If the file isn't a trace.
+    """
+    return asyncio.run(_replay(list(_entries(path)), speed))
+
+
+async def _replay(entries: list[Any], speed: float | None) -> ReplayReport:
+    """Replay the entries of a trace in a headless `PlotextPlot`.
+
+    Args:
+        entries: The entries of the trace.
+        speed: How fast to replay the trace, if not as fast as possible.
+
+    Returns:
+        The timings of the replay.
+    """
+    # The replay stands in for a recorder, and builds frames as the widget
+    # itself would.
+    # pylint:disable=protected-access
+    size = next(
+        ((entry[2], entry[3]) for entry in entries if entry[1] == "build"), (80, 24)
+    )
+    app = _ReplayApp()
+    async with app.run_test(size=(size[0] or 80, size[1] or 24)) as pilot:
+        widget = app.query_one(_ReplayedPlot)
+        replayer = _Replayer()
+        widget.plt._recorder = replayer  # type: ignore[assignment]
+        calls = 0
+        build_ms: list[float] = []
+        render_ms: list[float] = []
+        started = monotonic()
+        for entry in entries:
+            if speed:
+                await asyncio.sleep(max(entry[0] / speed - (monotonic() - started), 0))
+            if entry[1] == "call":
+                _, _, where, name, args, kwargs = entry
+                if name in _APPLIED:
+                    continue
+                target = _resolve(widget.plt, replayer, where)
+                if target is None:
+                    continue
+                args = _live(replayer, args)
+                kwargs = _live(replayer, kwargs)
+                getattr(target, name)(*args, **kwargs)
+                calls += 1
+            elif entry[1] == "build":
+                _, _, width, height, theme = entry
+                if width and height and (width, height) != tuple(widget.size):
+                    await pilot.resize_terminal(width, height)
+                    await pilot.pause()
+                if theme in themes():
+                    widget.theme = theme
+                key = widget._frame_key()
+                start = perf_counter()
+                built = widget.plt.build()
+                middle = perf_counter()
+                frame = ansi_to_text(built)
+                end = perf_counter()
+                frame_store(app).put(widget, key, frame)
+                build_ms.append((middle - start) * 1000)
+                render_ms.append((end - middle) * 1000)
+        widget.plt._recorder = None
+    return ReplayReport(calls, build_ms, render_ms)
+
+
+def _resolve(plot: Plot, replayer: _Replayer, where: Any) -> Any:
+    """Find the target of a call in a trace.
+
+    Args:
+        plot: The plot being replayed into.
+        replayer: The replayer, which knows the series.
+        where: The id of a series, or the path to a figure.
+
+    Returns:
+        The series or figure, or `None` if there's no such series.
+    """
+    if isinstance(where, int):
+        return replayer.series[where] if where < len(replayer.series) else None
+    figure: Any = plot
+    for row, col in where:
+        figure = figure.subfig[row - 1][col - 1]
+    return figure
+
+
+def _live(replayer: _Replayer, value: Any) -> Any:
+    """Turn the plain data from a trace back into arguments for a call.
+
+    Args:
+        replayer: The replayer, which knows the series.
+        value: The plain data.
+
+    Returns:
+        The arguments.
+    """
+    if isinstance(value, list):
+        return [_live(replayer, item) for item in value]
+    if isinstance(value, dict):
+        if set(value) == {"series"}:
+            series = value["series"]
+            return None if series is None else replayer.series[series]
+        if set(value) == {"items"}:
+            return {
+                _live(replayer, key): _live(replayer, item)
+                for key, item in value["items"]
+            }
+        return {key: _live(replayer, item) for key, item in value.items()}
+    return value
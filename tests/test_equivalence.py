@@ -0,0 +1,44 @@
+"""Check that the optimised ways of drawing a plot draw it as Plotext does.
+
+This runs the equivalence harness in `examples/equivalence.py` on a small,
+fixed set of figures; `make equivalence` runs it on many more.
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+
+def _harness() -> Any:
+    """Load the equivalence harness from the examples.
+
+    Returns:
+        The harness module.
+    """
+    path = Path(__file__).parent.parent / "examples" / "equivalence.py"
+    spec = spec_from_file_location("equivalence", path)
+    assert spec is not None and spec.loader is not None
+    module = module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+equivalence = _harness()
+
+SEEDS = range(equivalence.CROWDED)
+"""The seeds of the figures to check, the last of which is a crowded one."""
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_paths_draw_as_plotext(seed: int) -> None:
+    """Each optimised path draws a figure cell for cell as Plotext does."""
+    expected = equivalence.reference(seed)
+    for path in equivalence.PATHS:
+        actual, _ = path.draw(seed, True)
+        assert equivalence.difference(expected, actual) is None, path.name
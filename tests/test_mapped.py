@@ -0,0 +1,24 @@
+"""Tests for series data read from memory-mapped files."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from textual_plotext import MappedData, Plot
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_positions_count_from_one(tmp_path: Path) -> None:
+    """Mapped data without an x column draws where the same list does."""
+    values = numpy.sin(numpy.arange(50) / 5)
+    path = tmp_path / "values.f64"
+    values.tofile(path)
+    mapped, listed = Plot(), Plot()
+    for plot in (mapped, listed):
+        plot.plotsize(60, 15)
+    mapped.plot(MappedData(path))
+    listed.plot(values.tolist())
+    assert mapped.build() == listed.build()
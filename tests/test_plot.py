@@ -0,0 +1,44 @@
+"""Tests for the Textual-friendly Plotext plot."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+BAR_CHART = """
+from textual_plotext import Plot
+
+plot = Plot()
+plot.plotsize(60, 20)
+plot.bar(["north", "south", "east", "west", "centre"], [3, 1, 4, 1, 5])
+plot.multiple_bar(["a", "b", "c"], [[1, 2, 3], [3, 2, 1]], orientation="h")
+print(plot.content_hash())
+"""
+"""A script that prints the content hash of a plot of bar charts."""
+
+
+def _content_hash(seed: int) -> str:
+    """Get the content hash of a plot of bar charts, in a process of its own.
+
+    Args:
+        seed: The hash seed of the process.
+
+    Returns:
+        The content hash.
+    """
+    return subprocess.run(
+        [sys.executable, "-c", BAR_CHART],
+        env={**os.environ, "PYTHONHASHSEED": str(seed)},
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.mark.parametrize("seed", [2, 3])
+def test_content_hash_is_the_same_in_every_run(seed: int) -> None:
+    """The content hash of a bar chart doesn't depend on the hash seed."""
+    assert _content_hash(seed) == _content_hash(1)
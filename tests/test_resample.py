@@ -0,0 +1,59 @@
+"""Tests for resampling time series into buckets of time."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from textual_plotext.resample import Resampler
+
+numpy = pytest.importorskip("numpy")
+
+
+def _stream() -> tuple[Any, Any]:
+    """Make ten seconds of a noisy sine wave, a thousand samples a second.
+
+    Returns:
+        The times and values of the samples.
+    """
+    times = numpy.arange(0, 10, 0.001)
+    noise = numpy.random.default_rng(0).normal(0, 0.01, len(times))
+    return times, numpy.sin(times) + noise
+
+
+def _p95(resampler: Resampler, low: float, high: float) -> float:
+    """Read the 95th percentile of a single second.
+
+    Args:
+        resampler: The resampler.
+        low: The start of the second.
+        high: The end of the second.
+
+    Returns:
+        The estimated percentile.
+    """
+    _, y = resampler.view("p95").read(low, high, 1)
+    assert len(y) == 1
+    return float(y[0])
+
+
+def test_p95_is_accurate_after_an_outlier() -> None:
+    """An outlier only coarsens the percentile of the bucket it falls in."""
+    times, values = _stream()
+    resampler = Resampler()
+    resampler.add([0.5], [100.0])
+    resampler.add(times, values)
+    latest = (times >= 9) & (times < 10)
+    expected = float(numpy.percentile(values[latest], 95))
+    assert _p95(resampler, 9, 9.999) == pytest.approx(expected, abs=0.01)
+
+
+def test_p95_of_merged_buckets_is_accurate() -> None:
+    """The percentile of buckets merged for a wider view is accurate."""
+    times, values = _stream()
+    resampler = Resampler(resolution=0.1)
+    resampler.add(times, values)
+    second = (times >= 4) & (times < 5)
+    expected = float(numpy.percentile(values[second], 95))
+    assert _p95(resampler, 4, 4.999) == pytest.approx(expected, abs=0.01)
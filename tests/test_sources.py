@@ -0,0 +1,72 @@
+"""Tests for binding asynchronous sources of samples to a plot."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+from plotext._figure import _figure_class
+from textual.app import App, ComposeResult
+
+from textual_plotext import PlotextPlot
+from textual_plotext.plot import PlotextThemeName
+
+SAMPLES = 5
+"""The number of samples each source gives."""
+
+THEME: PlotextThemeName = "pro"
+"""The theme to draw the plot with."""
+
+
+class _SourcesApp(App[None]):
+    """An application with a plot to bind sources to."""
+
+    def compose(self) -> ComposeResult:
+        yield PlotextPlot()
+
+
+async def _samples(index: int) -> AsyncIterator[float]:
+    """Give a few samples.
+
+    Args:
+        index: The index of the source, which its samples start from.
+
+    Yields:
+        The samples.
+    """
+    for sample in range(SAMPLES):
+        yield float(index + sample)
+
+
+async def _bind(sources: int) -> str:
+    """Bind some sources to a plot, each to a series of its own.
+
+    Args:
+        sources: The number of sources.
+
+    Returns:
+        The plot, built once every sample has been applied.
+    """
+    async with _SourcesApp().run_test() as pilot:
+        widget = pilot.app.query_one(PlotextPlot)
+        widget.theme = THEME
+        await pilot.pause()
+        bindings = [widget.bind_source(_samples(index)) for index in range(sources)]
+        while any(binding.stats.applied < SAMPLES for binding in bindings):
+            await pilot.pause(0.01)
+        widget.plt.plotsize(100, 30)
+        return widget.plt.build()
+
+
+def test_many_sources_take_the_colours_plotext_gives() -> None:
+    """More sources than the theme has colours are drawn as Plotext draws them."""
+    sources = 48
+    built = asyncio.run(_bind(sources))
+    figure = _figure_class()
+    figure.theme(THEME)
+    figure.plotsize(100, 30)
+    for index in range(sources):
+        figure.plot(
+            list(range(SAMPLES)), [float(index + sample) for sample in range(SAMPLES)]
+        )
+    assert built == figure.build()